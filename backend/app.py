@@ -15,6 +15,7 @@ from typing import Any, Literal
 
 from dotenv import load_dotenv
 from fastapi import Depends, FastAPI, Header, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field
 
@@ -23,20 +24,28 @@ load_dotenv(Path(__file__).resolve().parent / ".env", override=False)
 
 from utils.dataManager import (
     MongoUnavailableError,
+    beginRequestSchemaCounters,
+    bootstrapSchemas,
+    closeAsyncMongoClient,
     createTables,
     deleteJobsByApplyStatusNotIn,
     deleteJobsKeepingOnlyApply,
     deletePastDataOlderThanHours,
+    describeMongoClientSettings,
     flushJobsAndPastData,
     flushPastDataNotInJobData,
     loadScraperSearchKeywords,
+    mongoPoolStats,
+    reconcileJobStatusCounters,
     saveScraperSearchKeywords,
+    schemaBootstrapStatus,
     updateApplyStatusByJobId,
 )
 from utils.authService import (
     changeUserPassword,
     createUserSessionToken,
     getUserFromToken,
+    getUserFromTokenAsync,
     listAllUsersForAdmin,
     loginUser,
     requireAdminUser,
@@ -45,34 +54,54 @@ from utils.authService import (
     updateUserName,
 )
 from utils.jobDecisionService import executeJobUiDecision
+from utils.midhtechSessionPool import midhtechSessionPoolStats
 from utils.jobViewerQueries import (
+    countJobDataAsync,
     fetchAdminJobStatusSummary,
+    fetchAdminJobStatusSummaryAsync,
     fetchDistinctCategories,
+    fetchDistinctCategoriesAsync,
     fetchDistinctPlatforms,
+    fetchDistinctPlatformsAsync,
+    countJobData,
+    fetchJobDataKeysetPage,
+    fetchJobDataKeysetPageAsync,
     fetchJobDataPage,
+    fetchJobDataPageAsync,
     fetchJobDetailByJobId,
+    fetchJobDetailByJobIdAsync,
     fetchJobSummaryCamel,
+    fetchJobSummaryCamelAsync,
 )
 from utils.userWeeklyStats import (
     decrementWeeklyRejectedCount,
     fetchCurrentWeekAcceptedCount,
+    fetchCurrentWeekAcceptedCountAsync,
     fetchWeeklyReportByUser,
+    fetchWeeklyReportByUserAsync,
     incrementWeeklyDecisionCount,
 )
 from utils.redisCache import (
     bumpJobsListVersion,
+    cacheStats,
+    closeAsyncRedisClient,
     deleteCacheKey,
+    getOrComputeCachedJson,
+    getOrComputeCachedJsonAsync,
+    jobsListVersion,
+    jobsListVersionAsync,
     keyAdminJobStatusSummary,
-    getCachedJson,
     keyAdminUsers,
     keyJobCategories,
     keyJobDetail,
     keyJobPlatforms,
+    keyJobsCount,
     keyJobsList,
     keyJobsSummary,
     keyProfileCurrentWeekAccepts,
     keyProfileWeeklyReport,
-    setCachedJson,
+    startCacheInvalidationListener,
+    stopCacheInvalidationListener,
 )
 from utils.validationDocker import (
     fetchValidationExecutionStatus,
@@ -92,15 +121,30 @@ if not logger.handlers:
 logger.setLevel(_logLevel)
 logger.propagate = False
 
+# Hot read routes use the AsyncMongoClient / redis.asyncio paths; false runs the same routes'
+# sync implementations in the threadpool (the pre-async behaviour, kept for comparison).
+ASYNC_ROUTES = str(os.getenv("API_ASYNC_ROUTES") or "true").strip().lower() in {"1", "true", "yes", "on"}
+
 
 @asynccontextmanager
 async def _appLifespan(_app: FastAPI):
     try:
         createTables(recreate=False)
-        logger.info("MongoDB collections/indexes ensured (including placetrackWorkspace).")
+        bootstrapSchemas()
+        logger.info(
+            "MongoDB collections/indexes ensured once for this process: %s",
+            ", ".join(sorted(schemaBootstrapStatus()["collections"])),
+        )
     except Exception as exc:
         logger.warning("MongoDB bootstrap on startup skipped: %s", exc)
+    logger.info("MongoClient settings: %s", describeMongoClientSettings())
+    if startCacheInvalidationListener():
+        logger.info("In-process L1 cache enabled; listening for Redis invalidation messages")
+    logger.info("Read routes: %s handlers", "async" if ASYNC_ROUTES else "sync (threadpool)")
     yield
+    stopCacheInvalidationListener()
+    await closeAsyncRedisClient()
+    await closeAsyncMongoClient()
 
 
 app = FastAPI(title="Saral Job Viewer API", version="1.0.0", lifespan=_appLifespan)
@@ -177,16 +221,19 @@ async def logApiRequests(request: Request, call_next):
     start = time.perf_counter()
     path = request.url.path
     method = request.method
+    schemaCounters = beginRequestSchemaCounters()
     try:
         response = await call_next(request)
         elapsedMs = int((time.perf_counter() - start) * 1000)
         logger.info(
-            "[REQ] id=%s method=%s path=%s status=%s tookMs=%s",
+            "[REQ] id=%s method=%s path=%s status=%s tookMs=%s schemaSkips=%s mongoRoundTripsSaved=%s",
             requestId,
             method,
             path,
             response.status_code,
             elapsedMs,
+            schemaCounters["schemaChecksSkipped"],
+            schemaCounters["roundTripsSaved"],
         )
         return response
     except Exception:
@@ -211,15 +258,17 @@ def _extractBearerToken(authorization: str | None) -> str:
     return token
 
 
-def requireAuth(authorization: str | None = Header(default=None)) -> dict[str, str]:
+async def requireAuth(authorization: str | None = Header(default=None)) -> dict[str, str]:
     token = _extractBearerToken(authorization)
     try:
-        return getUserFromToken(token)
+        if ASYNC_ROUTES:
+            return await getUserFromTokenAsync(token)
+        return await run_in_threadpool(getUserFromToken, token)
     except Exception as exc:
         raise HTTPException(status_code=401, detail=str(exc)) from exc
 
 
-def requireAdmin(currentUser: dict[str, Any] = Depends(requireAuth)) -> dict[str, Any]:
+async def requireAdmin(currentUser: dict[str, Any] = Depends(requireAuth)) -> dict[str, Any]:
     try:
         requireAdminUser(user=currentUser)
         return currentUser
@@ -353,13 +402,7 @@ def postAuthLogout(currentUser: dict[str, str] = Depends(requireAuth)):
 @app.get("/api/admin/users")
 def getAdminUsers(currentUser: dict[str, Any] = Depends(requireAdmin)):
     try:
-        cacheKey = keyAdminUsers()
-        cached = getCachedJson(cacheKey)
-        if cached is not None:
-            return cached
-        payload = listAllUsersForAdmin()
-        setCachedJson(cacheKey, payload, ttlSeconds=20)
-        return payload
+        return getOrComputeCachedJson(keyAdminUsers(), listAllUsersForAdmin, ttlSeconds=20)
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
@@ -385,15 +428,18 @@ def postAdminSetUserAdmin(
 
 
 @app.get("/api/admin/jobs/status-summary")
-def getAdminJobStatusSummary(currentUser: dict[str, Any] = Depends(requireAdmin)):
+async def getAdminJobStatusSummary(currentUser: dict[str, Any] = Depends(requireAdmin)):
     try:
-        cacheKey = keyAdminJobStatusSummary()
-        cached = getCachedJson(cacheKey)
-        if cached is not None:
-            return cached
-        payload = fetchAdminJobStatusSummary()
-        setCachedJson(cacheKey, payload, ttlSeconds=20)
-        return payload
+        if not ASYNC_ROUTES:
+            return await run_in_threadpool(
+                getOrComputeCachedJson,
+                keyAdminJobStatusSummary(),
+                fetchAdminJobStatusSummary,
+                ttlSeconds=20,
+            )
+        return await getOrComputeCachedJsonAsync(
+            keyAdminJobStatusSummary(), fetchAdminJobStatusSummaryAsync, ttlSeconds=20
+        )
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
@@ -412,6 +458,7 @@ def postAdminJobAction(
         "flush_past_data_orphans",
         "push_apply_jobs",
         "push_apply_jobs_then_cleanup",
+        "reconcile_status_counters",
     }
     if action not in allowedActions:
         raise HTTPException(status_code=400, detail="Unsupported admin action.")
@@ -443,6 +490,28 @@ def postAdminJobAction(
             "validationRun": validationRun,
         }
 
+    if action == "reconcile_status_counters":
+        reconciled = reconcileJobStatusCounters()
+        invalidateJobCaches()
+        driftRows = reconciled.get("drift") or []
+        message = (
+            "Status counters rebuilt from jobData. "
+            + (f"Repaired drift in {len(driftRows)} bucket(s)." if driftRows else "No drift found.")
+        )
+        logger.info(
+            "[ADMIN_ACTION_DONE] action=%s drift=%s admin=%s",
+            action,
+            driftRows,
+            adminDetails,
+        )
+        return {
+            "ok": True,
+            "action": action,
+            "admin": adminDetails,
+            "message": message,
+            "reconciled": reconciled,
+        }
+
     before = _adminStatusDebugSnapshot()
     beforeMergedRejected = int(before["rejected"]) + int(before["doNotApply"]) + int(before["existing"])
     if action == "delete_unwanted_classified_jobs":
@@ -567,6 +636,30 @@ def postAdminJobAction(
     return {"ok": True, "action": action, "admin": adminDetails, "message": "Action logged."}
 
 
+@app.get("/api/admin/schema-status")
+def getAdminSchemaStatus(currentUser: dict[str, Any] = Depends(requireAdmin)):
+    """Collections/indexes verified by this worker plus process-wide saved Mongo round-trips."""
+    return {"ok": True, **schemaBootstrapStatus()}
+
+
+@app.get("/api/admin/mongo-pool")
+def getAdminMongoPool(currentUser: dict[str, Any] = Depends(requireAdmin)):
+    """Effective MongoClient settings and pool checkout wait-time metrics for this worker."""
+    return {"ok": True, **mongoPoolStats()}
+
+
+@app.get("/api/admin/midhtech-sessions")
+def getAdminMidhtechSessions(currentUser: dict[str, Any] = Depends(requireAdmin)):
+    """Pooled Midhtech login sessions (Accept path): hit rate, evictions, entry ages (this worker)."""
+    return {"ok": True, **midhtechSessionPoolStats()}
+
+
+@app.get("/api/admin/cache-stats")
+def getAdminCacheStats(currentUser: dict[str, Any] = Depends(requireAdmin)):
+    """Read-through cache hit/miss/stale/recompute-time counters per key family (this worker)."""
+    return {"ok": True, **cacheStats()}
+
+
 @app.post("/api/admin/jobs/execution-status")
 def postAdminJobExecutionStatus(
     body: AdminJobExecutionStatusBody,
@@ -631,45 +724,53 @@ def postAdminScraperKeywords(
 
 
 @app.get("/api/jobs/summary")
-def getJobsSummary(currentUser: dict[str, str] = Depends(requireAuth)):
+async def getJobsSummary(currentUser: dict[str, str] = Depends(requireAuth)):
     try:
-        cacheKey = keyJobsSummary()
-        cached = getCachedJson(cacheKey)
-        if cached is not None:
-            return cached
-        summary = fetchJobSummaryCamel()
-        setCachedJson(cacheKey, summary, ttlSeconds=60)
-        return summary
+        if not ASYNC_ROUTES:
+            return await run_in_threadpool(
+                getOrComputeCachedJson, keyJobsSummary(), fetchJobSummaryCamel, ttlSeconds=60
+            )
+        return await getOrComputeCachedJsonAsync(
+            keyJobsSummary(), fetchJobSummaryCamelAsync, ttlSeconds=60
+        )
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
 
 @app.get("/api/jobs/platforms")
-def getJobPlatforms(currentUser: dict[str, str] = Depends(requireAuth)):
+async def getJobPlatforms(currentUser: dict[str, str] = Depends(requireAuth)):
     try:
-        cacheKey = keyJobPlatforms()
-        cached = getCachedJson(cacheKey)
-        if cached is not None:
-            return cached
-        platforms = fetchDistinctPlatforms()
-        payload = {"platforms": platforms}
-        setCachedJson(cacheKey, payload, ttlSeconds=300)
-        return payload
+        if not ASYNC_ROUTES:
+            return await run_in_threadpool(
+                getOrComputeCachedJson,
+                keyJobPlatforms(),
+                lambda: {"platforms": fetchDistinctPlatforms()},
+                ttlSeconds=300,
+            )
+
+        async def computePlatforms() -> dict[str, Any]:
+            return {"platforms": await fetchDistinctPlatformsAsync()}
+
+        return await getOrComputeCachedJsonAsync(keyJobPlatforms(), computePlatforms, ttlSeconds=300)
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
 
 @app.get("/api/jobs/categories")
-def getJobCategories(currentUser: dict[str, str] = Depends(requireAuth)):
+async def getJobCategories(currentUser: dict[str, str] = Depends(requireAuth)):
     try:
-        cacheKey = keyJobCategories()
-        cached = getCachedJson(cacheKey)
-        if cached is not None:
-            return cached
-        categories = fetchDistinctCategories()
-        payload = {"categories": categories}
-        setCachedJson(cacheKey, payload, ttlSeconds=300)
-        return payload
+        if not ASYNC_ROUTES:
+            return await run_in_threadpool(
+                getOrComputeCachedJson,
+                keyJobCategories(),
+                lambda: {"categories": fetchDistinctCategories()},
+                ttlSeconds=300,
+            )
+
+        async def computeCategories() -> dict[str, Any]:
+            return {"categories": await fetchDistinctCategoriesAsync()}
+
+        return await getOrComputeCachedJsonAsync(keyJobCategories(), computeCategories, ttlSeconds=300)
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
@@ -745,44 +846,63 @@ def postRejectedJobToApply(jobId: str, currentUser: dict[str, str] = Depends(req
 
 
 @app.get("/api/profile/weekly-report")
-def getProfileWeeklyReport(currentUser: dict[str, str] = Depends(requireAuth)):
+async def getProfileWeeklyReport(currentUser: dict[str, str] = Depends(requireAuth)):
     try:
-        cacheKey = keyProfileWeeklyReport(currentUser["userId"])
-        cached = getCachedJson(cacheKey)
-        if cached is not None:
-            return cached
-        payload = fetchWeeklyReportByUser(userId=currentUser["userId"])
-        setCachedJson(cacheKey, payload, ttlSeconds=30)
-        return payload
+        userId = currentUser["userId"]
+        if not ASYNC_ROUTES:
+            return await run_in_threadpool(
+                getOrComputeCachedJson,
+                keyProfileWeeklyReport(userId),
+                lambda: fetchWeeklyReportByUser(userId=userId),
+                ttlSeconds=30,
+            )
+        return await getOrComputeCachedJsonAsync(
+            keyProfileWeeklyReport(userId),
+            lambda: fetchWeeklyReportByUserAsync(userId=userId),
+            ttlSeconds=30,
+        )
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
 
 @app.get("/api/profile/current-week-accepts")
-def getProfileCurrentWeekAccepts(currentUser: dict[str, str] = Depends(requireAuth)):
+async def getProfileCurrentWeekAccepts(currentUser: dict[str, str] = Depends(requireAuth)):
     try:
-        cacheKey = keyProfileCurrentWeekAccepts(currentUser["userId"])
-        cached = getCachedJson(cacheKey)
-        if cached is not None:
-            return cached
-        payload = fetchCurrentWeekAcceptedCount(userId=currentUser["userId"])
-        setCachedJson(cacheKey, payload, ttlSeconds=15)
-        return payload
+        userId = currentUser["userId"]
+        if not ASYNC_ROUTES:
+            return await run_in_threadpool(
+                getOrComputeCachedJson,
+                keyProfileCurrentWeekAccepts(userId),
+                lambda: fetchCurrentWeekAcceptedCount(userId=userId),
+                ttlSeconds=15,
+            )
+        return await getOrComputeCachedJsonAsync(
+            keyProfileCurrentWeekAccepts(userId),
+            lambda: fetchCurrentWeekAcceptedCountAsync(userId=userId),
+            ttlSeconds=15,
+        )
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
 
 @app.get("/api/jobs/{jobId}")
-def getJobById(jobId: str, currentUser: dict[str, str] = Depends(requireAuth)):
+async def getJobById(jobId: str, currentUser: dict[str, str] = Depends(requireAuth)):
     try:
-        cacheKey = keyJobDetail(jobId)
-        cached = getCachedJson(cacheKey)
-        if cached is not None:
-            return cached
-        row = fetchJobDetailByJobId(jobId)
+        if not ASYNC_ROUTES:
+            row = await run_in_threadpool(
+                getOrComputeCachedJson,
+                keyJobDetail(jobId),
+                lambda: fetchJobDetailByJobId(jobId) or None,
+                ttlSeconds=20,
+            )
+        else:
+            row = await getOrComputeCachedJsonAsync(
+                keyJobDetail(jobId),
+                lambda: fetchJobDetailByJobIdAsync(jobId),
+                ttlSeconds=20,
+            )
         if not row:
             raise HTTPException(status_code=404, detail="Job not found")
-        setCachedJson(cacheKey, row, ttlSeconds=20)
         return row
     except HTTPException:
         raise
@@ -790,14 +910,157 @@ def getJobById(jobId: str, currentUser: dict[str, str] = Depends(requireAuth)):
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
 
+def _filterKwargs(filterParams: dict[str, str]) -> dict[str, str | None]:
+    return {name: (filterParams[name] or None) for name in ("platform", "applyStatus", "search", "category")}
+
+
+def _cachedJobCount(filterParams: dict[str, str]) -> int:
+    """Filtered list total, cached apart from pages so page/cursor requests do not recount."""
+    total = getOrComputeCachedJson(
+        keyJobsCount(filterParams),
+        lambda: countJobData(**_filterKwargs(filterParams)),
+        ttlSeconds=60,
+        version=jobsListVersion(),
+    )
+    return int(total or 0)
+
+
+async def _cachedJobCountAsync(filterParams: dict[str, str]) -> int:
+    total = await getOrComputeCachedJsonAsync(
+        keyJobsCount(filterParams),
+        lambda: countJobDataAsync(**_filterKwargs(filterParams)),
+        ttlSeconds=60,
+        version=await jobsListVersionAsync(),
+    )
+    return int(total or 0)
+
+
+def _keysetPayload(
+    items: list[dict[str, Any]], *, total: int, pageSize: int, cursor: str, nextCursor: str | None
+) -> dict[str, Any]:
+    return {
+        "items": items,
+        "total": total,
+        "pageSize": pageSize,
+        "cursor": cursor,
+        "nextCursor": nextCursor,
+        "hasMore": nextCursor is not None,
+    }
+
+
+def _offsetPayload(items: list[dict[str, Any]], *, total: int, page: int, pageSize: int) -> dict[str, Any]:
+    totalPages = max(1, math.ceil(total / pageSize)) if pageSize else 1
+    return {
+        "items": items,
+        "total": total,
+        "page": page,
+        "pageSize": pageSize,
+        "totalPages": totalPages,
+    }
+
+
+def _listJobsPayload(
+    filterParams: dict[str, str], *, page: int, pageSize: int, cursor: str | None
+) -> dict[str, Any]:
+    """Sync (threadpool) implementation of GET /api/jobs."""
+    listVersion = jobsListVersion()
+    filters = _filterKwargs(filterParams)
+    if cursor is not None:
+        cursorValue = cursor.strip()
+
+        def computeKeysetPage() -> dict[str, Any]:
+            try:
+                items, nextCursor = fetchJobDataKeysetPage(
+                    pageSize=pageSize, cursor=cursorValue or None, **filters
+                )
+            except ValueError as exc:
+                raise HTTPException(status_code=400, detail=str(exc)) from exc
+            return _keysetPayload(
+                items,
+                total=_cachedJobCount(filterParams),
+                pageSize=pageSize,
+                cursor=cursorValue,
+                nextCursor=nextCursor,
+            )
+
+        return getOrComputeCachedJson(
+            keyJobsList({**filterParams, "cursor": cursorValue, "pageSize": pageSize}),
+            computeKeysetPage,
+            ttlSeconds=30,
+            version=listVersion,
+        )
+
+    def computeOffsetPage() -> dict[str, Any]:
+        items, total = fetchJobDataPage(
+            page=page, pageSize=pageSize, total=_cachedJobCount(filterParams), **filters
+        )
+        return _offsetPayload(items, total=total, page=page, pageSize=pageSize)
+
+    return getOrComputeCachedJson(
+        keyJobsList({"page": page, "pageSize": pageSize, **filterParams}),
+        computeOffsetPage,
+        ttlSeconds=30,
+        version=listVersion,
+    )
+
+
+async def _listJobsPayloadAsync(
+    filterParams: dict[str, str], *, page: int, pageSize: int, cursor: str | None
+) -> dict[str, Any]:
+    """Async implementation of GET /api/jobs (same cache keys and payloads as the sync path)."""
+    listVersion = await jobsListVersionAsync()
+    filters = _filterKwargs(filterParams)
+    if cursor is not None:
+        cursorValue = cursor.strip()
+
+        async def computeKeysetPage() -> dict[str, Any]:
+            try:
+                items, nextCursor = await fetchJobDataKeysetPageAsync(
+                    pageSize=pageSize, cursor=cursorValue or None, **filters
+                )
+            except ValueError as exc:
+                raise HTTPException(status_code=400, detail=str(exc)) from exc
+            return _keysetPayload(
+                items,
+                total=await _cachedJobCountAsync(filterParams),
+                pageSize=pageSize,
+                cursor=cursorValue,
+                nextCursor=nextCursor,
+            )
+
+        return await getOrComputeCachedJsonAsync(
+            keyJobsList({**filterParams, "cursor": cursorValue, "pageSize": pageSize}),
+            computeKeysetPage,
+            ttlSeconds=30,
+            version=listVersion,
+        )
+
+    async def computeOffsetPage() -> dict[str, Any]:
+        items, total = await fetchJobDataPageAsync(
+            page=page, pageSize=pageSize, total=await _cachedJobCountAsync(filterParams), **filters
+        )
+        return _offsetPayload(items, total=total, page=page, pageSize=pageSize)
+
+    return await getOrComputeCachedJsonAsync(
+        keyJobsList({"page": page, "pageSize": pageSize, **filterParams}),
+        computeOffsetPage,
+        ttlSeconds=30,
+        version=listVersion,
+    )
+
+
 @app.get("/api/jobs")
-def listJobs(
+async def listJobs(
     page: int = Query(1, ge=1),
     pageSize: int = Query(20, ge=1, le=50),
     platform: str | None = Query(None),
     applyStatus: str | None = Query(None),
     search: str | None = Query(None),
     category: str | None = Query(None),
+    cursor: str | None = Query(
+        None,
+        description="Keyset mode: pass an empty value for the first page, then nextCursor.",
+    ),
     currentUser: dict[str, str] = Depends(requireAuth),
 ):
     try:
@@ -812,37 +1075,19 @@ def listJobs(
         if categoryValue and categoryValue.lower() == "all":
             categoryValue = None
 
-        cacheParams = {
-            "page": page,
-            "pageSize": pageSize,
+        filterParams = {
             "platform": platformValue or "",
             "applyStatus": applyValue or "",
             "search": searchValue or "",
             "category": categoryValue or "",
         }
-        cacheKey = keyJobsList(cacheParams)
-        cached = getCachedJson(cacheKey)
-        if cached is not None:
-            return cached
-
-        items, total = fetchJobDataPage(
-            page=page,
-            pageSize=pageSize,
-            platform=platformValue,
-            applyStatus=applyValue,
-            search=searchValue,
-            category=categoryValue,
-        )
-        totalPages = max(1, math.ceil(total / pageSize)) if pageSize else 1
-        payload = {
-            "items": items,
-            "total": total,
-            "page": page,
-            "pageSize": pageSize,
-            "totalPages": totalPages,
-        }
-        setCachedJson(cacheKey, payload, ttlSeconds=30)
-        return payload
+        if not ASYNC_ROUTES:
+            return await run_in_threadpool(
+                _listJobsPayload, filterParams, page=page, pageSize=pageSize, cursor=cursor
+            )
+        return await _listJobsPayloadAsync(filterParams, page=page, pageSize=pageSize, cursor=cursor)
+    except HTTPException:
+        raise
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
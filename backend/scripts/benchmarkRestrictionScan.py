@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Benchmark the restriction / experience scanner: the legacy per-regex loop vs the anchored
+single pass (scanRestrictionText) vs a cached hit on a persisted restrictionScanHash.
+
+Reads a corpus of real job rows (title + jobDescription) from jobData, or from a JSON file
+of job rows, and checks that every path returns the same tags for every job.
+
+Usage (from backend/):
+  python scripts/benchmarkRestrictionScan.py
+  python scripts/benchmarkRestrictionScan.py --limit 5000 --repeat 5
+  python scripts/benchmarkRestrictionScan.py --json ../scraping/data/jobright.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+
+def _parseArgs() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--uri", default=None, help="Mongo URI (default: MONGODB_URI / .env)")
+    parser.add_argument("--database", default=None, help="Database (default: MONGODB_DATABASE)")
+    parser.add_argument("--json", default=None, help="Read job rows from this JSON file instead")
+    parser.add_argument("--limit", type=int, default=2000, help="Max jobs in the corpus")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per path")
+    return parser.parse_args()
+
+
+def _loadCorpus(args: argparse.Namespace) -> list[dict[str, Any]]:
+    if args.json:
+        raw = json.loads(Path(args.json).read_text(encoding="utf-8"))
+        rows = raw.get("jobs", []) if isinstance(raw, dict) else raw
+        return [r for r in rows if isinstance(r, dict)][: max(1, args.limit)]
+    if args.uri:
+        os.environ["MONGODB_URI"] = args.uri
+    if args.database:
+        os.environ["MONGODB_DATABASE"] = args.database
+
+    from utils.dataManager import JOB_DATA_COLLECTION, getMongoDb
+
+    cur = getMongoDb()[JOB_DATA_COLLECTION].find(
+        {"jobDescription": {"$nin": [None, ""]}},
+        {"_id": 0, "jobId": 1, "title": 1, "jobDescription": 1},
+    ).limit(max(1, args.limit))
+    return list(cur)
+
+
+def _legacyTags(text: str) -> list[str]:
+    """Pre-prefilter findRestrictionTagsForJob body: every regex, every experience tag."""
+    from utils.jobDecisionService import (
+        EXPERIENCE_ABOVE_FIVE_LABEL,
+        RESTRICTION_SCANNERS,
+        experienceTagImpliesAboveFiveYears,
+        findJobDescriptionExperienceTags,
+    )
+
+    if not text:
+        return []
+    labels: set[str] = set()
+    for regex, label in RESTRICTION_SCANNERS:
+        if regex.search(text):
+            labels.add(label)
+    if labels and "Clearance" in labels and (
+        "Secret clearance" in labels
+        or "Top secret / TS" in labels
+        or "Public trust" in labels
+    ):
+        labels.discard("Clearance")
+    if any(experienceTagImpliesAboveFiveYears(t) for t in findJobDescriptionExperienceTags(text)):
+        labels.add(EXPERIENCE_ABOVE_FIVE_LABEL)
+    return sorted(labels)
+
+
+def _timeRuns(fn: Any, repeat: int) -> tuple[list[list[str]], list[float]]:
+    timings: list[float] = []
+    result: list[list[str]] = []
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        result = fn()
+        timings.append((time.perf_counter() - start) * 1000.0)
+    return result, timings
+
+
+def main() -> int:
+    args = _parseArgs()
+    jobs = _loadCorpus(args)
+    if not jobs:
+        print("No job rows with a jobDescription found.", file=sys.stderr)
+        return 1
+
+    from utils.jobDecisionService import (
+        composeRestrictionStyleText,
+        findRestrictionTagsForJob,
+        restrictionScanFields,
+        scanRestrictionText,
+    )
+
+    texts = [composeRestrictionStyleText(j) for j in jobs]
+    persisted = [{**j, **restrictionScanFields(j)} for j in jobs]
+    print(f"Corpus: {len(jobs)} jobs, {sum(len(t) for t in texts) / 1024:,.0f} KiB of text")
+
+    legacy, legacyMs = _timeRuns(lambda: [_legacyTags(t) for t in texts], args.repeat)
+    anchored, anchoredMs = _timeRuns(lambda: [scanRestrictionText(t) for t in texts], args.repeat)
+    cached, cachedMs = _timeRuns(
+        lambda: [findRestrictionTagsForJob(j) for j in persisted], args.repeat
+    )
+
+    print()
+    print(f"{'path':<10} {'p50 ms':>10} {'min ms':>10} {'max ms':>10} {'us/job':>10}")
+    for label, timings in (("legacy", legacyMs), ("anchored", anchoredMs), ("cached", cachedMs)):
+        p50 = statistics.median(timings)
+        print(
+            f"{label:<10} {p50:>10.1f} {min(timings):>10.1f} {max(timings):>10.1f} "
+            f"{p50 * 1000.0 / len(jobs):>10.1f}"
+        )
+    for label, timings in (("anchored", anchoredMs), ("cached", cachedMs)):
+        speedup = statistics.median(legacyMs) / max(statistics.median(timings), 1e-6)
+        print(f"{label}: speedup (p50) {speedup:.1f}x")
+
+    mismatches = [
+        (j.get("jobId"), a, b, c)
+        for j, a, b, c in zip(jobs, legacy, anchored, cached)
+        if not (a == b == c)
+    ]
+    for jobId, a, b, c in mismatches[:10]:
+        print(f"MISMATCH {jobId}: legacy={a} anchored={b} cached={c}", file=sys.stderr)
+    if mismatches:
+        return 1
+    flagged = sum(1 for tags in legacy if tags)
+    print(f"tags match for all {len(jobs)} jobs ({flagged} with at least one restriction)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Regression benchmark for the experience / restriction regex scanners in jobDecisionService.
+
+Runs every pattern over a fixture corpus (scripts/fixtures/scannerCorpus.json) plus generated
+adversarial inputs (long whitespace gaps, run-on sentences, digit runs, near-miss phrases)
+and reports per-pattern time, the worst-case input per pattern, and end-to-end throughput of
+findJobDescriptionExperienceTags / findRestrictionTagsForJob.
+
+Times are normalized against a linear reference pass (`\\w+`) over the same text so the budget
+holds across machines. Exits 1 when any pattern or the end-to-end scan exceeds its budget,
+which is what a catastrophic-backtracking pattern edit looks like.
+
+Usage (from backend/):
+  python scripts/benchmarkScannerRegex.py
+  python scripts/benchmarkScannerRegex.py --adversarial-kb 128 --repeat 5
+  python scripts/benchmarkScannerRegex.py --json ../scraping/data/jobright.json --top 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+FIXTURE_CORPUS = Path(__file__).resolve().parent / "fixtures" / "scannerCorpus.json"
+
+# Budgets, as multiples of the `\w+` reference pass over the same input.
+# A single pattern on a single input (worst case); quadratic backtracking lands in the 1000s.
+MAX_PATTERN_RATIO = 40.0
+# Whole corpus through findJobDescriptionExperienceTags + uncached findRestrictionTagsForJob.
+MAX_SCAN_RATIO = 60.0
+
+_REFERENCE = re.compile(r"\w+")
+
+
+def _parseArgs() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--json", default=None, help="Extra job rows (list or {jobs: [...]})")
+    parser.add_argument("--adversarial-kb", type=int, default=16, help="Size of each adversarial input")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs (best run is kept)")
+    parser.add_argument("--top", type=int, default=0, help="Only print the N slowest patterns")
+    parser.add_argument(
+        "--budget-scale", type=float, default=1.0, help="Multiply both budgets (noisy CI hosts)"
+    )
+    return parser.parse_args()
+
+
+def _loadRows(path: Path) -> list[dict[str, Any]]:
+    raw = json.loads(path.read_text(encoding="utf-8"))
+    rows = raw.get("jobs", []) if isinstance(raw, dict) else raw
+    return [r for r in rows if isinstance(r, dict)]
+
+
+def _adversarialInputs(kb: int) -> dict[str, str]:
+    n = max(1, kb) * 1024
+
+    def fill(unit: str, prefix: str = "", suffix: str = "") -> str:
+        return prefix + unit * max(1, (n - len(prefix) - len(suffix)) // len(unit)) + suffix
+
+    return {
+        "adv:whitespace-gap": fill(" ", "5+", "years"),
+        "adv:newline-gap": fill("\n", "Requirements: 5+", " years experience"),
+        "adv:years-no-experience": fill("a ", "5 years "),
+        "adv:digit-run": fill("1", "", " years"),
+        "adv:range-chain": fill("5 - ", "minimum of "),
+        "adv:experience-colon": fill("experience: " + "5 " * 30),
+        "adv:punctuation-span": fill("3 years" + " ,./&()+-" * 8),
+        "adv:run-on-sentence": fill("5+ years building platform tooling across teams and "),
+        "adv:yoe-chain": fill("yoe: 5 - "),
+        "adv:restriction-near-miss": fill(
+            "u. s. citizens secretive clearances sponsors publicly trusted authorizes "
+        ),
+    }
+
+
+def _patterns() -> list[tuple[str, str, Callable[[str], Any]]]:
+    from utils.jobDecisionService import _EXPERIENCE_SCANNERS, RESTRICTION_SCANNERS
+
+    out: list[tuple[str, str, Callable[[str], Any]]] = []
+    for i, pattern in enumerate(_EXPERIENCE_SCANNERS, start=1):
+        out.append((f"E{i:02d}", pattern.pattern, lambda t, p=pattern: list(p.finditer(t))))
+    for i, (pattern, label) in enumerate(RESTRICTION_SCANNERS, start=1):
+        out.append((f"R{i:02d}", label, lambda t, p=pattern: p.search(t)))
+    return out
+
+
+def _best(fn: Callable[[], Any], repeat: int, limit: float = float("inf")) -> float:
+    """Fastest of `repeat` runs; stops early once a run is already over `limit` seconds."""
+    best = float("inf")
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+        if best > limit:
+            break
+    return best
+
+
+def main() -> int:
+    args = _parseArgs()
+
+    from utils.jobDecisionService import (
+        _clampWhitespaceRuns,
+        composeRestrictionStyleText,
+        findJobDescriptionExperienceTags,
+        scanRestrictionText,
+    )
+
+    rows = _loadRows(FIXTURE_CORPUS)
+    if args.json:
+        rows += _loadRows(Path(args.json))
+    inputs: dict[str, str] = {
+        str(r.get("jobId") or f"row-{i}"): composeRestrictionStyleText(r) for i, r in enumerate(rows)
+    }
+    inputs.update(_adversarialInputs(args.adversarial_kb))
+    # Patterns run on the text the engine actually scans (whitespace runs clamped).
+    scanned = {name: _clampWhitespaceRuns(text) for name, text in inputs.items()}
+    totalBytes = sum(len(t.encode("utf-8")) for t in inputs.values())
+    print(
+        f"Corpus: {len(rows)} fixture rows + {len(inputs) - len(rows)} adversarial, "
+        f"{totalBytes / 1024:,.0f} KiB"
+    )
+
+    # Reference is taken on the raw input: the budget is relative to what the engine is handed.
+    reference = {
+        name: max(_best(lambda t=t: list(_REFERENCE.finditer(t)), args.repeat), 1e-6)
+        for name, t in inputs.items()
+    }
+    patternBudget = MAX_PATTERN_RATIO * args.budget_scale
+    scanBudget = MAX_SCAN_RATIO * args.budget_scale
+    failures: list[str] = []
+
+    results: list[tuple[str, str, float, str, float, float]] = []
+    for pid, desc, run in _patterns():
+        total = 0.0
+        worstName, worstSec, worstRatio = "", 0.0, 0.0
+        for name, text in scanned.items():
+            sec = _best(lambda: run(text), args.repeat, limit=patternBudget * reference[name])
+            total += sec
+            ratio = sec / reference[name]
+            if ratio > worstRatio:
+                worstName, worstSec, worstRatio = name, sec, ratio
+        results.append((pid, desc, total, worstName, worstSec, worstRatio))
+        if worstRatio > patternBudget:
+            failures.append(f"{pid} on {worstName}: {worstRatio:.1f}x reference > {patternBudget:.1f}x")
+
+    results.sort(key=lambda r: r[5], reverse=True)
+    shown = results[: args.top] if args.top > 0 else results
+    print()
+    print(f"{'id':<5} {'total ms':>10} {'worst ms':>10} {'x ref':>8}  worst input / pattern")
+    for pid, desc, total, worstName, worstSec, worstRatio in shown:
+        print(f"{pid:<5} {total * 1000:>10.2f} {worstSec * 1000:>10.2f} {worstRatio:>8.1f}  {worstName}")
+        print(f"{'':<5} {desc[:110]}")
+
+    texts = list(inputs.values())
+    refTotal = sum(reference.values())
+    print()
+    print(f"{'scan':<36} {'ms':>10} {'MiB/s':>10} {'x ref':>8}")
+    for label, fn in (
+        ("findJobDescriptionExperienceTags", lambda: [findJobDescriptionExperienceTags(t) for t in texts]),
+        ("findRestrictionTagsForJob (uncached)", lambda: [scanRestrictionText(t) for t in texts]),
+    ):
+        sec = _best(fn, args.repeat)
+        ratio = sec / refTotal
+        print(f"{label:<36} {sec * 1000:>10.1f} {totalBytes / (1 << 20) / max(sec, 1e-9):>10.1f} {ratio:>8.1f}")
+        if ratio > scanBudget:
+            failures.append(f"{label}: {ratio:.1f}x reference > {scanBudget:.1f}x")
+
+    print()
+    if failures:
+        for line in failures:
+            print(f"OVER BUDGET {line}", file=sys.stderr)
+        return 1
+    print(f"within budget (pattern <= {patternBudget:.0f}x, scan <= {scanBudget:.0f}x reference)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Benchmark jobData status summary: legacy full-document scan vs a server-side $group vs the
+materialized jobStatusCounters point lookup (what jobDataStatusCounts() reads today).
+
+Seeds N synthetic jobData rows (multi-KB jobDescription each) into a scratch database on a
+local mongod, then reports wire bytes and latency for each path.
+
+Usage (from backend/):
+  python scripts/benchmarkStatusSummary.py
+  python scripts/benchmarkStatusSummary.py --rows 100000 --repeat 5 --uri mongodb://127.0.0.1:27017
+  python scripts/benchmarkStatusSummary.py --keep      # leave the scratch database in place
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+STATUSES: tuple[str | None, ...] = (
+    None,
+    "",
+    "APPLY",
+    "DO_NOT_APPLY",
+    "EXISTING",
+    "APPLIED",
+    "REJECTED",
+    "REDO",
+)
+
+
+def _parseArgs() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--uri", default="mongodb://127.0.0.1:27017", help="Local mongod URI")
+    parser.add_argument("--database", default="saralJobViewerBench", help="Scratch database name")
+    parser.add_argument("--rows", type=int, default=100_000, help="Synthetic jobData rows")
+    parser.add_argument("--description-bytes", type=int, default=4000, help="jobDescription size")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per path")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--keep", action="store_true", help="Do not drop the scratch database")
+    return parser.parse_args()
+
+
+def _seedRows(coll: Any, *, rows: int, descriptionBytes: int, seed: int) -> None:
+    rng = random.Random(seed)
+    filler = ("Kubernetes Terraform AWS pipelines on-call observability " * 200)[:descriptionBytes]
+    batch: list[dict[str, Any]] = []
+    for i in range(rows):
+        doc: dict[str, Any] = {
+            "jobId": f"bench-{i:08d}",
+            "title": f"Platform Engineer {i}",
+            "companyName": f"Company {i % 997}",
+            "jobDescription": filler,
+            "timestamp": f"2026-01-{(i % 28) + 1:02d}T00:00:00Z",
+            "platform": rng.choice(("JobRight", "Glassdoor", "ZipRecruiter")),
+            "category": "devops",
+        }
+        status = rng.choice(STATUSES)
+        if status is not None:
+            doc["applyStatus"] = status
+        batch.append(doc)
+        if len(batch) >= 5000:
+            coll.insert_many(batch, ordered=False)
+            batch = []
+    if batch:
+        coll.insert_many(batch, ordered=False)
+
+
+def _legacyScan(db: Any, rawColl: Any) -> tuple[dict[str, int], int]:
+    """Pre-engine jobDataApplyStatusSummary: count_documents + find({}) of full documents."""
+    from utils.dataManager import JOB_DATA_COLLECTION, PAST_DATA_COLLECTION
+
+    total = db[JOB_DATA_COLLECTION].count_documents({})
+    pastRows = db[PAST_DATA_COLLECTION].count_documents({})
+    counts = {"nullPending": 0, "apply": 0, "doNotApply": 0, "existing": 0, "otherStatus": 0}
+    wireBytes = 0
+    for raw in rawColl.find({}):
+        wireBytes += len(raw.raw)
+        s = str(raw.get("applyStatus") or "").strip()
+        if not s:
+            counts["nullPending"] += 1
+        elif s == "APPLY":
+            counts["apply"] += 1
+        elif s == "DO_NOT_APPLY":
+            counts["doNotApply"] += 1
+        elif s == "EXISTING":
+            counts["existing"] += 1
+        else:
+            counts["otherStatus"] += 1
+    return {"total": total, **counts, "pastDataRows": pastRows}, wireBytes
+
+
+def _groupScan(rawColl: Any) -> tuple[dict[str, int], int]:
+    from utils.dataManager import applyStatusCountPipeline
+
+    wireBytes = 0
+    pending = 0
+    statusCounts: dict[str, int] = {}
+    for raw in rawColl.aggregate(applyStatusCountPipeline()):
+        wireBytes += len(raw.raw)
+        key = str(raw.get("_id") or "").strip()
+        if key:
+            statusCounts[key] = statusCounts.get(key, 0) + int(raw.get("count") or 0)
+        else:
+            pending += int(raw.get("count") or 0)
+    return _bucketsFromCounts(pending, statusCounts, rawColl), wireBytes
+
+
+def _countersLookup(rawCounters: Any) -> tuple[dict[str, int], int]:
+    from utils.dataManager import JOB_STATUS_COUNTERS_DOCUMENT_ID, jobDataApplyStatusSummary
+
+    raw = rawCounters.find_one({"_id": JOB_STATUS_COUNTERS_DOCUMENT_ID})
+    return jobDataApplyStatusSummary(), len(raw.raw) if raw is not None else 0
+
+
+def _bucketsFromCounts(pending: int, statusCounts: dict[str, int], rawColl: Any) -> dict[str, int]:
+    from utils.dataManager import PAST_DATA_COLLECTION
+
+    known = {"APPLY": "apply", "DO_NOT_APPLY": "doNotApply", "EXISTING": "existing"}
+    out = {"total": pending + sum(statusCounts.values()), "nullPending": pending}
+    for status, label in known.items():
+        out[label] = int(statusCounts.get(status, 0))
+    out["otherStatus"] = sum(v for k, v in statusCounts.items() if k not in known)
+    out["pastDataRows"] = rawColl.database[PAST_DATA_COLLECTION].count_documents({})
+    return out
+
+
+def _timeRuns(fn: Any, repeat: int) -> tuple[dict[str, int], int, list[float]]:
+    timings: list[float] = []
+    result: dict[str, int] = {}
+    wireBytes = 0
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        result, wireBytes = fn()
+        timings.append((time.perf_counter() - start) * 1000.0)
+    return result, wireBytes, timings
+
+
+def main() -> int:
+    args = _parseArgs()
+    # Point the shared client at the scratch database before utils.dataManager is imported.
+    os.environ["MONGODB_URI"] = args.uri
+    os.environ["MONGODB_DATABASE"] = args.database
+
+    from bson.codec_options import CodecOptions
+    from bson.raw_bson import RawBSONDocument
+
+    from utils.dataManager import (
+        JOB_DATA_COLLECTION,
+        JOB_STATUS_COUNTERS_COLLECTION,
+        createTables,
+        getMongoDb,
+        reconcileJobStatusCounters,
+    )
+
+    db = getMongoDb()
+    db.client.drop_database(args.database)
+    createTables(recreate=False)
+    jobCol = db[JOB_DATA_COLLECTION]
+    rawOptions = CodecOptions(document_class=RawBSONDocument)
+    rawCol = jobCol.with_options(codec_options=rawOptions)
+    rawCounters = db[JOB_STATUS_COUNTERS_COLLECTION].with_options(codec_options=rawOptions)
+
+    print(f"Seeding {args.rows} jobData rows into {args.database} …")
+    seedStart = time.perf_counter()
+    _seedRows(jobCol, rows=args.rows, descriptionBytes=args.description_bytes, seed=args.seed)
+    print(f"Seeded in {time.perf_counter() - seedStart:.1f}s")
+
+    try:
+        legacy, legacyBytes, legacyMs = _timeRuns(lambda: _legacyScan(db, rawCol), args.repeat)
+        grouped, groupBytes, groupMs = _timeRuns(lambda: _groupScan(rawCol), args.repeat)
+        # Bulk-seeded rows bypass the $inc hooks, so build the counters document once up front.
+        reconcileJobStatusCounters()
+        counters, countersBytes, countersMs = _timeRuns(
+            lambda: _countersLookup(rawCounters), args.repeat
+        )
+    finally:
+        if not args.keep:
+            db.client.drop_database(args.database)
+
+    print()
+    print(f"{'path':<10} {'bytes':>14} {'p50 ms':>10} {'min ms':>10} {'max ms':>10}")
+    for label, wire, timings in (
+        ("legacy", legacyBytes, legacyMs),
+        ("$group", groupBytes, groupMs),
+        ("counters", countersBytes, countersMs),
+    ):
+        print(
+            f"{label:<10} {wire:>14,} {statistics.median(timings):>10.1f} "
+            f"{min(timings):>10.1f} {max(timings):>10.1f}"
+        )
+    for label, wire, timings in (("$group", groupBytes, groupMs), ("counters", countersBytes, countersMs)):
+        speedup = statistics.median(legacyMs) / max(statistics.median(timings), 1e-6)
+        print(
+            f"{label}: speedup (p50) {speedup:.1f}x   bytes ratio {legacyBytes / max(wire, 1):,.0f}x"
+        )
+    if not (legacy == grouped == counters):
+        print(f"MISMATCH legacy={legacy} group={grouped} counters={counters}", file=sys.stderr)
+        return 1
+    print(f"counts match: {counters}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
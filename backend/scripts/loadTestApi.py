@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Load-test the hot read routes with sync (threadpool) vs async (AsyncMongoClient) handlers.
+
+Seeds N synthetic jobData rows plus one user into a scratch database on a local mongod, then
+starts `uvicorn app:app` once per mode (API_ASYNC_ROUTES=false / true) and drives the same
+request mix at a fixed client concurrency. Redis is disabled by default so every request
+reaches Mongo; pass --redis to measure the cached path instead.
+
+Usage (from backend/):
+  python scripts/loadTestApi.py
+  python scripts/loadTestApi.py --rows 50000 --concurrency 64 --duration 20
+  python scripts/loadTestApi.py --modes async --pool-size 50 --keep
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import secrets
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import requests
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+
+def _parseArgs() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--uri", default="mongodb://127.0.0.1:27017", help="Local mongod URI")
+    parser.add_argument("--database", default="saralJobViewerLoad", help="Scratch database name")
+    parser.add_argument("--rows", type=int, default=20_000, help="Synthetic jobData rows")
+    parser.add_argument("--concurrency", type=int, default=32, help="Concurrent client threads")
+    parser.add_argument("--duration", type=float, default=15.0, help="Seconds of load per mode")
+    parser.add_argument("--warmup", type=float, default=2.0, help="Unmeasured seconds before each run")
+    parser.add_argument("--modes", default="sync,async", help="Comma list of sync / async")
+    parser.add_argument("--port", type=int, default=9361, help="Port for the spawned API")
+    parser.add_argument("--pool-size", type=int, default=100, help="MONGODB_MAX_POOL_SIZE for the API")
+    parser.add_argument("--redis", action="store_true", help="Keep REDIS_* from the environment")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--keep", action="store_true", help="Do not drop the scratch database")
+    return parser.parse_args()
+
+
+def _seed(args: argparse.Namespace, jwtSecret: str) -> tuple[str, list[str]]:
+    """Insert jobData rows and a user; returns (bearer token, jobIds)."""
+    os.environ["MONGODB_URI"] = args.uri
+    os.environ["MONGODB_DATABASE"] = args.database
+    os.environ["JWT_SECRET"] = jwtSecret
+
+    from utils.authService import createUserSessionToken, registerUser
+    from utils.dataManager import (
+        JOB_DATA_COLLECTION,
+        createTables,
+        fifoSortKey,
+        getMongoDb,
+        reconcileJobStatusCounters,
+    )
+
+    db = getMongoDb()
+    db.client.drop_database(args.database)
+    createTables(recreate=False)
+    rng = random.Random(args.seed)
+    filler = "Kubernetes Terraform AWS pipelines on-call observability " * 40
+    jobIds: list[str] = []
+    batch: list[dict[str, Any]] = []
+    for i in range(args.rows):
+        jobId = f"load-{i:08d}"
+        timestamp = f"2026-{(i % 12) + 1:02d}-{(i % 28) + 1:02d}T00:00:00Z"
+        jobIds.append(jobId)
+        batch.append(
+            {
+                "jobId": jobId,
+                "title": f"Platform Engineer {i}",
+                "companyName": f"Company {i % 997}",
+                "jobDescription": filler,
+                "timestamp": timestamp,
+                "fifoKey": fifoSortKey(timestamp),
+                "platform": rng.choice(("JobRight", "Glassdoor", "ZipRecruiter")),
+                "category": rng.choice(("devops", "cloud", "sre")),
+                "applyStatus": rng.choice((None, "APPLY", "REJECTED", "APPLIED")),
+            }
+        )
+        if len(batch) >= 5000:
+            db[JOB_DATA_COLLECTION].insert_many(batch, ordered=False)
+            batch = []
+    if batch:
+        db[JOB_DATA_COLLECTION].insert_many(batch, ordered=False)
+    reconcileJobStatusCounters()
+    user = registerUser(name="Load Test", email="loadtest@example.com", password=secrets.token_hex(8))
+    return createUserSessionToken(user), jobIds
+
+
+def _startApi(args: argparse.Namespace, mode: str, jwtSecret: str) -> subprocess.Popen:
+    env = dict(os.environ)
+    env.update(
+        {
+            "API_ASYNC_ROUTES": "true" if mode == "async" else "false",
+            "MONGODB_URI": args.uri,
+            "MONGODB_DATABASE": args.database,
+            "MONGODB_MAX_POOL_SIZE": str(args.pool_size),
+            "JWT_SECRET": jwtSecret,
+            "APP_LOG_LEVEL": "WARNING",
+        }
+    )
+    if not args.redis:
+        env["REDIS_ENABLED"] = "false"
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app:app", "--port", str(args.port), "--log-level", "warning"],
+        cwd=str(ROOT),
+        env=env,
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            if requests.get(f"http://127.0.0.1:{args.port}/api/health", timeout=1).ok:
+                return proc
+        except requests.RequestException:
+            time.sleep(0.2)
+    proc.terminate()
+    raise RuntimeError(f"{mode} API did not become healthy on port {args.port}")
+
+
+def _requestMix(rng: random.Random, jobIds: list[str]) -> str:
+    roll = rng.random()
+    if roll < 0.45:
+        return f"/api/jobs?page={rng.randint(1, 50)}&pageSize=20"
+    if roll < 0.6:
+        return "/api/jobs?cursor=&pageSize=20&platform=" + rng.choice(("JobRight", "Glassdoor"))
+    if roll < 0.8:
+        return f"/api/jobs/{rng.choice(jobIds)}"
+    if roll < 0.9:
+        return "/api/jobs/summary"
+    return "/api/profile/current-week-accepts"
+
+
+def _drive(args: argparse.Namespace, token: str, jobIds: list[str]) -> dict[str, Any]:
+    baseUrl = f"http://127.0.0.1:{args.port}"
+    headers = {"Authorization": f"Bearer {token}"}
+    latencies: list[float] = []
+    errors = [0]
+    lock = threading.Lock()
+    stopAt = [0.0]
+    measureFrom = [0.0]
+
+    def worker(workerId: int) -> None:
+        rng = random.Random(args.seed + workerId)
+        session = requests.Session()
+        local: list[float] = []
+        localErrors = 0
+        while time.monotonic() < stopAt[0]:
+            path = _requestMix(rng, jobIds)
+            start = time.monotonic()
+            try:
+                ok = session.get(baseUrl + path, headers=headers, timeout=30).status_code < 500
+            except requests.RequestException:
+                ok = False
+            end = time.monotonic()
+            if start >= measureFrom[0]:
+                local.append((end - start) * 1000.0)
+                localErrors += 0 if ok else 1
+        with lock:
+            latencies.extend(local)
+            errors[0] += localErrors
+
+    now = time.monotonic()
+    measureFrom[0] = now + args.warmup
+    stopAt[0] = measureFrom[0] + args.duration
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        for workerId in range(args.concurrency):
+            pool.submit(worker, workerId)
+
+    latencies.sort()
+    if not latencies:
+        return {"requests": 0, "errors": errors[0], "rps": 0.0, "p50": 0.0, "p99": 0.0}
+    return {
+        "requests": len(latencies),
+        "errors": errors[0],
+        "rps": len(latencies) / args.duration,
+        "p50": statistics.median(latencies),
+        "p99": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))],
+    }
+
+
+def main() -> int:
+    args = _parseArgs()
+    modes = [m.strip() for m in args.modes.split(",") if m.strip() in ("sync", "async")]
+    if not modes:
+        print("--modes must name sync and/or async", file=sys.stderr)
+        return 2
+    jwtSecret = secrets.token_hex(32)
+
+    print(f"Seeding {args.rows} jobData rows into {args.database} …")
+    token, jobIds = _seed(args, jwtSecret)
+    results: dict[str, dict[str, Any]] = {}
+    try:
+        for mode in modes:
+            proc = _startApi(args, mode, jwtSecret)
+            try:
+                print(f"{mode}: {args.concurrency} clients for {args.duration:.0f}s …")
+                results[mode] = _drive(args, token, jobIds)
+            finally:
+                proc.terminate()
+                proc.wait(timeout=10)
+    finally:
+        if not args.keep:
+            from utils.dataManager import getMongoDb
+
+            getMongoDb().client.drop_database(args.database)
+
+    print()
+    print(f"{'mode':<6} {'requests':>9} {'errors':>7} {'req/s':>9} {'p50 ms':>9} {'p99 ms':>9}")
+    for mode, row in results.items():
+        print(
+            f"{mode:<6} {row['requests']:>9,} {row['errors']:>7} {row['rps']:>9.1f} "
+            f"{row['p50']:>9.1f} {row['p99']:>9.1f}"
+        )
+    if "sync" in results and "async" in results and results["sync"]["rps"]:
+        print(
+            f"async/sync throughput {results['async']['rps'] / results['sync']['rps']:.2f}x   "
+            f"p99 {results['sync']['p99']:.1f} -> {results['async']['p99']:.1f} ms"
+        )
+    return 1 if any(row["errors"] for row in results.values()) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
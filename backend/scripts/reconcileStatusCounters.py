@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""Rebuild the jobStatusCounters document from jobData and print any drift found."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from dotenv import load_dotenv
+
+load_dotenv(ROOT / ".env", override=False)
+
+from utils.dataManager import reconcileJobStatusCounters  # noqa: E402
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Recount jobData applyStatus buckets and overwrite the materialized counters.",
+    )
+    parser.add_argument(
+        "--fail-on-drift",
+        action="store_true",
+        help="Exit 1 when the stored counters did not match jobData (after repairing them)",
+    )
+    args = parser.parse_args()
+
+    result = reconcileJobStatusCounters()
+    print(json.dumps(result, indent=2))
+    if result["drift"]:
+        print(f"Repaired drift in {len(result['drift'])} bucket(s).", file=sys.stderr)
+        return 1 if args.fail_on_drift else 0
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
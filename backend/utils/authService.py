@@ -3,8 +3,25 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from typing import Any
 
-from utils.dataManager import MongoUnavailableError, getMongoDb
+from utils.dataManager import (
+    MongoUnavailableError,
+    ensureCollectionSchema,
+    ensureCollectionSchemaAsync,
+    getAsyncMongoDb,
+    getMongoDb,
+    registerCollectionSchema,
+)
+from utils.env import envInt
 from utils.jwtAuth import createJwtToken, verifyJwtToken
+from utils.redisCache import (
+    bumpUserTokenVersion,
+    deleteCacheKey,
+    getOrComputeCachedJson,
+    getOrComputeCachedJsonAsync,
+    keyAuthUser,
+    userTokenVersion,
+    userTokenVersionAsync,
+)
 from utils.userWeeklyStats import (
     fetchCurrentWeekAcceptedCountsByUsers,
     fetchCurrentWeekRejectedCountsByUsers,
@@ -17,9 +34,7 @@ def _utcNowIso() -> str:
     return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
-def ensureUserIndexes() -> None:
-    users = getMongoDb()[USER_COLLECTION]
-    users.create_index("email", unique=True)
+def _backfillUserDefaults(users: Any) -> None:
     # Backfill missing admin flag for older users.
     users.update_many({"isAdmin": {"$exists": False}}, {"$set": {"isAdmin": False}})
     # Backfill profile photo URL for older users.
@@ -37,6 +52,18 @@ def ensureUserIndexes() -> None:
         )
 
 
+registerCollectionSchema(
+    USER_COLLECTION,
+    [("email", {"unique": True})],
+    onVerify=_backfillUserDefaults,
+)
+
+
+def ensureUserIndexes() -> None:
+    """Unique email index + legacy backfills; runs against Mongo once per process."""
+    ensureCollectionSchema(USER_COLLECTION)
+
+
 def _normalizeEmail(email: str) -> str:
     return str(email or "").strip().lower()
 
@@ -137,19 +164,83 @@ def createUserSessionToken(user: dict[str, Any]) -> str:
     )
 
 
+def _authUserCacheTtlSeconds() -> int:
+    return envInt("AUTH_USER_CACHE_TTL_SECONDS", 30, 0)
+
+
+def _loadUserPrincipal(userId: str) -> dict[str, Any] | None:
+    ensureUserIndexes()
+    users = getMongoDb()[USER_COLLECTION]
+    userDoc = users.find_one({"userId": userId}, {"password": 0})
+    return _sanitizeUserDoc(userDoc) if userDoc else None
+
+
+async def _loadUserPrincipalAsync(userId: str) -> dict[str, Any] | None:
+    await ensureCollectionSchemaAsync(USER_COLLECTION)
+    users = getAsyncMongoDb()[USER_COLLECTION]
+    userDoc = await users.find_one({"userId": userId}, {"password": 0})
+    return _sanitizeUserDoc(userDoc) if userDoc else None
+
+
+def invalidateUserPrincipal(userId: str) -> None:
+    """Bump the user's token version so every worker drops its cached principal immediately."""
+    cleanUserId = str(userId or "").strip()
+    if not cleanUserId:
+        return
+    bumpUserTokenVersion(cleanUserId)
+    deleteCacheKey(keyAuthUser(cleanUserId))
+
+
 def getUserFromToken(token: str) -> dict[str, str]:
+    """
+    Verify the JWT and resolve its user. The principal is cached (Redis + in-process L1) for
+    AUTH_USER_CACHE_TTL_SECONDS, versioned by the per-user token-version counter, so the hot
+    path makes no Mongo call. Returned dicts are shared: do not mutate them.
+    """
     payload = verifyJwtToken(token)
     userId = str(payload.get("sub") or "").strip()
     email = _normalizeEmail(str(payload.get("email") or ""))
     if not userId or not email:
         raise ValueError("Invalid token payload")
 
-    ensureUserIndexes()
-    users = getMongoDb()[USER_COLLECTION]
-    userDoc = users.find_one({"userId": userId, "email": email})
-    if not userDoc:
+    ttl = _authUserCacheTtlSeconds()
+    if ttl > 0:
+        user = getOrComputeCachedJson(
+            keyAuthUser(userId),
+            lambda: _loadUserPrincipal(userId),
+            ttlSeconds=ttl,
+            version=userTokenVersion(userId),
+            allowStale=False,
+        )
+    else:
+        user = _loadUserPrincipal(userId)
+    if not user or _normalizeEmail(user.get("email") or "") != email:
         raise ValueError("User no longer exists")
-    return _sanitizeUserDoc(userDoc)
+    return user
+
+
+async def getUserFromTokenAsync(token: str) -> dict[str, str]:
+    """Async variant of getUserFromToken (same principal cache and token-version checks)."""
+    payload = verifyJwtToken(token)
+    userId = str(payload.get("sub") or "").strip()
+    email = _normalizeEmail(str(payload.get("email") or ""))
+    if not userId or not email:
+        raise ValueError("Invalid token payload")
+
+    ttl = _authUserCacheTtlSeconds()
+    if ttl > 0:
+        user = await getOrComputeCachedJsonAsync(
+            keyAuthUser(userId),
+            lambda: _loadUserPrincipalAsync(userId),
+            ttlSeconds=ttl,
+            version=await userTokenVersionAsync(userId),
+            allowStale=False,
+        )
+    else:
+        user = await _loadUserPrincipalAsync(userId)
+    if not user or _normalizeEmail(user.get("email") or "") != email:
+        raise ValueError("User no longer exists")
+    return user
 
 
 def requireAdminUser(*, user: dict[str, Any]) -> None:
@@ -230,6 +321,7 @@ def setUserAdminStatus(*, targetUserId: str, isAdmin: bool) -> None:
     )
     if result.matched_count == 0:
         raise ValueError("User not found")
+    invalidateUserPrincipal(cleanUserId)
 
 
 def updateUserName(*, userId: str, nextName: str) -> dict[str, Any]:
@@ -251,6 +343,7 @@ def updateUserName(*, userId: str, nextName: str) -> dict[str, Any]:
             }
         },
     )
+    invalidateUserPrincipal(cleanUserId)
     userDoc = users.find_one({"userId": cleanUserId})
     if not userDoc:
         raise ValueError("User not found")
@@ -285,3 +378,4 @@ def changeUserPassword(*, userId: str, currentPassword: str, newPassword: str) -
             }
         },
     )
+    invalidateUserPrincipal(cleanUserId)
@@ -1,10 +1,21 @@
 from __future__ import annotations
 
+import asyncio
+import atexit
+import importlib.util
+import json
 import os
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterator
+from contextvars import ContextVar
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any
 
+from .env import envFloat, envInt
+
 try:
     from dotenv import load_dotenv
 
@@ -14,9 +25,11 @@ except ImportError:
 
 try:
     from pymongo.errors import ConfigurationError, PyMongoError
+    from pymongo.monitoring import ConnectionPoolListener
 except ImportError:  # pragma: no cover - fallback when pymongo missing at import time
     ConfigurationError = Exception  # type: ignore[misc,assignment]
     PyMongoError = Exception  # type: ignore[misc,assignment]
+    ConnectionPoolListener = object  # type: ignore[misc,assignment]
 
 
 class MongoUnavailableError(RuntimeError):
@@ -26,10 +39,22 @@ JOB_DATA_COLLECTION = "jobData"
 PAST_DATA_COLLECTION = "pastData"
 SCRAPER_SETTINGS_COLLECTION = "scraperSettings"
 PLACETRACK_WORKSPACE_COLLECTION = "placetrackWorkspace"
+JOB_STATUS_COUNTERS_COLLECTION = "jobStatusCounters"
+VALIDATION_RUNS_COLLECTION = "validationRuns"
+VALIDATION_QUEUE_COLLECTION = "validationQueue"
+# Queue entries nobody consumed (no follower running) expire after this long.
+VALIDATION_QUEUE_TTL_SEC = 48 * 3600
+# Conditional bulk applyStatus rounds before falling back to single-row writes.
+BULK_STATUS_WRITE_ROUNDS = 3
 SCRAPER_KEYWORDS_DOCUMENT_ID = "searchKeywords"
+JOB_STATUS_COUNTERS_DOCUMENT_ID = "jobData"
+# fifoKey for rows without a timestamp: sorts after every ISO timestamp (binary string order).
+FIFO_KEY_BLANK_TIMESTAMP = "\uffff"
 
 _mongo_client: Any = None
 _mongo_db: Any = None
+_async_mongo_client: Any = None
+_async_mongo_db: Any = None
 
 
 def _logMongoFailure(label: str, exc: BaseException) -> None:
@@ -39,6 +64,229 @@ def _logMongoFailure(label: str, exc: BaseException) -> None:
     )
 
 
+def _mongoUriAndDatabase() -> tuple[str, str]:
+    uri = (os.getenv("MONGODB_URI") or os.getenv("MONGO_URI") or "").strip()
+    if not uri:
+        raise ValueError("Set MONGODB_URI in .env")
+    db_name = (
+        (os.getenv("MONGODB_DATABASE") or os.getenv("MONGODB_DB_NAME") or "").strip()
+        or "saralJobViewer"
+    )
+    return uri, db_name
+
+
+def _envFlag(name: str) -> bool | None:
+    """True/False when the env var is set, None when unset (leave the URI / driver default)."""
+    raw = str(os.getenv(name) or "").strip().lower()
+    if not raw:
+        return None
+    return raw in {"1", "true", "yes", "on"}
+
+
+# Wire compressors and the optional package each one needs (zlib ships with Python).
+_COMPRESSOR_MODULES = {"zstd": "zstandard", "snappy": "snappy", "zlib": None}
+_READ_PREFERENCE_NAMES = {
+    "primary": "PRIMARY",
+    "primarypreferred": "PRIMARY_PREFERRED",
+    "secondary": "SECONDARY",
+    "secondarypreferred": "SECONDARY_PREFERRED",
+    "nearest": "NEAREST",
+}
+
+
+def _mongoCompressors() -> tuple[list[str], list[str]]:
+    """(usable, skipped) from MONGODB_COMPRESSORS, in preference order; skips unknown/uninstalled."""
+    usable: list[str] = []
+    skipped: list[str] = []
+    for name in str(os.getenv("MONGODB_COMPRESSORS") or "").split(","):
+        clean = name.strip().lower()
+        if not clean or clean in usable:
+            continue
+        if clean not in _COMPRESSOR_MODULES:
+            skipped.append(clean)
+            continue
+        module = _COMPRESSOR_MODULES[clean]
+        if module is not None and importlib.util.find_spec(module) is None:
+            skipped.append(clean)
+            continue
+        usable.append(clean)
+    return usable, skipped
+
+
+def mongoClientOptions() -> dict[str, Any]:
+    """
+    Pool, timeout, compression and retry settings shared by the sync and async clients.
+    Unset MONGODB_* variables leave the URI / driver default in place.
+    """
+    options: dict[str, Any] = {
+        "maxPoolSize": envInt("MONGODB_MAX_POOL_SIZE", 100, 0),
+        "minPoolSize": envInt("MONGODB_MIN_POOL_SIZE", 0, 0),
+        "serverSelectionTimeoutMS": envInt("MONGODB_SERVER_SELECTION_TIMEOUT_MS", 15000, 1),
+        "connectTimeoutMS": envInt("MONGODB_CONNECT_TIMEOUT_MS", 20000, 1),
+    }
+    # 0 / unset keeps the driver default (no socket or pool-checkout timeout, no idle reaping).
+    for envName, option in (
+        ("MONGODB_SOCKET_TIMEOUT_MS", "socketTimeoutMS"),
+        ("MONGODB_WAIT_QUEUE_TIMEOUT_MS", "waitQueueTimeoutMS"),
+        ("MONGODB_MAX_IDLE_TIME_MS", "maxIdleTimeMS"),
+    ):
+        value = envInt(envName, 0, 0)
+        if value:
+            options[option] = value
+    compressors, _ = _mongoCompressors()
+    if compressors:
+        options["compressors"] = ",".join(compressors)
+    for envName, option in (("MONGODB_RETRY_WRITES", "retryWrites"), ("MONGODB_RETRY_READS", "retryReads")):
+        flag = _envFlag(envName)
+        if flag is not None:
+            options[option] = flag
+    appName = str(os.getenv("MONGODB_APP_NAME") or "").strip()
+    if appName:
+        options["appname"] = appName
+    return options
+
+
+def _dashboardReadPreference() -> Any | None:
+    """ReadPreference for dashboard reads (MONGODB_DASHBOARD_READ_PREFERENCE); None = client default."""
+    raw = str(os.getenv("MONGODB_DASHBOARD_READ_PREFERENCE") or "").strip().lower().replace("_", "")
+    attr = _READ_PREFERENCE_NAMES.get(raw)
+    if attr is None or attr == "PRIMARY":
+        return None
+    from pymongo import ReadPreference
+
+    return getattr(ReadPreference, attr)
+
+
+def describeMongoClientSettings() -> dict[str, Any]:
+    """Effective client settings (no credentials) for the startup log line and /api/admin/mongo-pool."""
+    _, skippedCompressors = _mongoCompressors()
+    readPreference = _dashboardReadPreference()
+    try:
+        _, dbName = _mongoUriAndDatabase()
+    except ValueError:
+        dbName = ""
+    return {
+        "database": dbName,
+        **mongoClientOptions(),
+        "skippedCompressors": skippedCompressors,
+        "dashboardReadPreference": readPreference.mongos_mode if readPreference is not None else "primary",
+    }
+
+
+class _PoolWaitMonitor(ConnectionPoolListener):
+    """Connection-pool events for one client: checkout wait times, failures and connections in use."""
+
+    def __init__(self, label: str) -> None:
+        self.label = label
+        self._lock = threading.Lock()
+        self._waitsMs: deque[float] = deque(maxlen=2048)
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._waitsMs.clear()
+            self.checkOuts = 0
+            self.checkOutFailures: dict[str, int] = {}
+            self.waitMsTotal = 0.0
+            self.waitMsMax = 0.0
+            self.inUse = 0
+            self.inUseMax = 0
+            self.connectionsCreated = 0
+            self.connectionsClosed = 0
+            self.poolsCleared = 0
+
+    def _recordWait(self, event: Any, *, succeeded: bool) -> None:
+        # event.duration (pymongo>=4.7): seconds from check-out start to connection or failure.
+        duration = getattr(event, "duration", None)
+        if duration is None:
+            return
+        waitMs = float(duration) * 1000.0
+        self._waitsMs.append(waitMs)
+        self.waitMsMax = max(self.waitMsMax, waitMs)
+        if succeeded:
+            self.waitMsTotal += waitMs
+
+    def connection_checked_out(self, event: Any) -> None:
+        with self._lock:
+            self.checkOuts += 1
+            self.inUse += 1
+            self.inUseMax = max(self.inUseMax, self.inUse)
+            self._recordWait(event, succeeded=True)
+
+    def connection_check_out_failed(self, event: Any) -> None:
+        with self._lock:
+            reason = str(getattr(event, "reason", "unknown"))
+            self.checkOutFailures[reason] = self.checkOutFailures.get(reason, 0) + 1
+            self._recordWait(event, succeeded=False)
+
+    def connection_checked_in(self, event: Any) -> None:
+        with self._lock:
+            self.inUse = max(0, self.inUse - 1)
+
+    def connection_created(self, event: Any) -> None:
+        with self._lock:
+            self.connectionsCreated += 1
+
+    def connection_closed(self, event: Any) -> None:
+        with self._lock:
+            self.connectionsClosed += 1
+
+    def pool_cleared(self, event: Any) -> None:
+        with self._lock:
+            self.poolsCleared += 1
+
+    def pool_created(self, event: Any) -> None:
+        return
+
+    def pool_ready(self, event: Any) -> None:
+        return
+
+    def pool_closed(self, event: Any) -> None:
+        return
+
+    def connection_ready(self, event: Any) -> None:
+        return
+
+    def connection_check_out_started(self, event: Any) -> None:
+        return
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            waits = sorted(self._waitsMs)
+
+            def pct(p: float) -> float:
+                return round(waits[min(len(waits) - 1, int(len(waits) * p))], 3) if waits else 0.0
+
+            return {
+                "checkOuts": self.checkOuts,
+                "checkOutFailures": dict(self.checkOutFailures),
+                "waitMsAvg": round(self.waitMsTotal / self.checkOuts, 3) if self.checkOuts else 0.0,
+                "waitMsP50": pct(0.50),
+                "waitMsP99": pct(0.99),
+                "waitMsMax": round(self.waitMsMax, 3),
+                "inUse": self.inUse,
+                "inUseMax": self.inUseMax,
+                "connectionsCreated": self.connectionsCreated,
+                "connectionsClosed": self.connectionsClosed,
+                "poolsCleared": self.poolsCleared,
+            }
+
+
+_syncPoolMonitor = _PoolWaitMonitor("sync")
+_asyncPoolMonitor = _PoolWaitMonitor("async")
+
+
+def mongoPoolStats() -> dict[str, Any]:
+    """Pool wait-time metrics per client in this process, plus the effective settings."""
+    return {
+        "settings": describeMongoClientSettings(),
+        "pools": {
+            "sync": _syncPoolMonitor.snapshot() if _mongo_client is not None else None,
+            "async": _asyncPoolMonitor.snapshot() if _async_mongo_client is not None else None,
+        },
+    }
+
+
 def _getMongoDb():
     global _mongo_client, _mongo_db
     if _mongo_db is not None:
@@ -47,18 +295,14 @@ def _getMongoDb():
         from pymongo import MongoClient
     except ImportError as exc:
         raise ImportError(
-            "Install pymongo and dnspython: pip install 'pymongo>=4.6,<5' 'dnspython>=2.0.0,<3'"
+            "Install pymongo and dnspython: pip install 'pymongo>=4.10,<5' 'dnspython>=2.0.0,<3'"
         ) from exc
 
-    uri = (os.getenv("MONGODB_URI") or os.getenv("MONGO_URI") or "").strip()
-    if not uri:
-        raise ValueError("Set MONGODB_URI in .env")
-    db_name = (
-        (os.getenv("MONGODB_DATABASE") or os.getenv("MONGODB_DB_NAME") or "").strip()
-        or "saralJobViewer"
-    )
+    uri, db_name = _mongoUriAndDatabase()
     try:
-        _mongo_client = MongoClient(uri, serverSelectionTimeoutMS=15000)
+        _mongo_client = MongoClient(
+            uri, **mongoClientOptions(), event_listeners=[_syncPoolMonitor]
+        )
         _mongo_db = _mongo_client[db_name]
     except (ConfigurationError, PyMongoError) as exc:
         _mongo_client = None
@@ -66,6 +310,10 @@ def _getMongoDb():
         raise MongoUnavailableError(
             f"MongoDB connection failed (check MONGODB_URI and DNS): {exc}"
         ) from exc
+    appendScrapeLog(
+        f"MongoClient settings: {json.dumps(describeMongoClientSettings(), sort_keys=True)}",
+        platform="MongoDB",
+    )
     return _mongo_db
 
 
@@ -74,6 +322,60 @@ def getMongoDb():
     return _getMongoDb()
 
 
+def getAsyncMongoDb():
+    """
+    pymongo AsyncMongoClient Database for async API routes (same URI, database and pool options).
+    The client binds to the running event loop on first use; create it from inside that loop.
+    """
+    global _async_mongo_client, _async_mongo_db
+    if _async_mongo_db is not None:
+        return _async_mongo_db
+    try:
+        from pymongo import AsyncMongoClient
+    except ImportError as exc:
+        raise ImportError("Async routes need pymongo>=4.10: pip install 'pymongo>=4.10,<5'") from exc
+
+    uri, db_name = _mongoUriAndDatabase()
+    try:
+        _async_mongo_client = AsyncMongoClient(
+            uri, **mongoClientOptions(), event_listeners=[_asyncPoolMonitor]
+        )
+        _async_mongo_db = _async_mongo_client[db_name]
+    except (ConfigurationError, PyMongoError) as exc:
+        _async_mongo_client = None
+        _async_mongo_db = None
+        raise MongoUnavailableError(
+            f"MongoDB connection failed (check MONGODB_URI and DNS): {exc}"
+        ) from exc
+    return _async_mongo_db
+
+
+def getDashboardMongoDb():
+    """
+    Database handle for dashboard reads (distinct filters, weekly reports, pastData count) that
+    tolerate replica lag; MONGODB_DASHBOARD_READ_PREFERENCE (e.g. secondaryPreferred), default primary.
+    The jobStatusCounters document is not read through it (see jobDataStatusCounts).
+    """
+    db = _getMongoDb()
+    readPreference = _dashboardReadPreference()
+    return db if readPreference is None else db.with_options(read_preference=readPreference)
+
+
+def getAsyncDashboardMongoDb():
+    db = getAsyncMongoDb()
+    readPreference = _dashboardReadPreference()
+    return db if readPreference is None else db.with_options(read_preference=readPreference)
+
+
+async def closeAsyncMongoClient() -> None:
+    global _async_mongo_client, _async_mongo_db
+    client = _async_mongo_client
+    _async_mongo_client = None
+    _async_mongo_db = None
+    if client is not None:
+        await client.close()
+
+
 def _projectRoot() -> Path:
     return Path(__file__).resolve().parent.parent
 
@@ -86,6 +388,10 @@ def _utcNowIso() -> str:
     return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
+def _utcIsoAfter(seconds: float) -> str:
+    return (datetime.now(timezone.utc) + timedelta(seconds=seconds)).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
 def appendScrapeLog(message: str, *, platform: str = "Unknown") -> Path:
     logsDir = _logsDirectory()
     logsDir.mkdir(parents=True, exist_ok=True)
@@ -96,26 +402,173 @@ def appendScrapeLog(message: str, *, platform: str = "Unknown") -> Path:
     return logPath
 
 
+IndexSpec = tuple[Any, dict[str, Any]]
+
+# Process-level schema registry: each collection lists its index specs plus an optional
+# hook (backfills etc.). A collection is verified against Mongo at most once per process;
+# later ensure calls are dict lookups and are counted as saved round-trips.
+_schemaIndexes: dict[str, list[IndexSpec]] = {
+    JOB_DATA_COLLECTION: [
+        ("jobId", {"unique": True}),
+        ("platform", {}),
+        ("category", {}),
+        ([("fifoKey", 1), ("jobId", 1)], {}),
+        ([("applyStatus", 1), ("fifoKey", 1), ("jobId", 1)], {}),
+    ],
+    PAST_DATA_COLLECTION: [
+        ("jobId", {"unique": True}),
+        ("platform", {}),
+    ],
+    JOB_STATUS_COUNTERS_COLLECTION: [],
+    VALIDATION_RUNS_COLLECTION: [
+        ([("mode", 1), ("status", 1), ("heartbeatAt", -1)], {}),
+        ([("startedAt", -1)], {}),
+    ],
+    VALIDATION_QUEUE_COLLECTION: [
+        ([("enqueuedAt", 1), ("_id", 1)], {}),
+        ("enqueuedAt", {"name": "enqueuedAtTtl", "expireAfterSeconds": VALIDATION_QUEUE_TTL_SEC}),
+    ],
+}
+_schemaHooks: dict[str, Callable[[Any], None]] = {}
+_schemaVerified: dict[str, dict[str, Any]] = {}
+_schemaLock = threading.RLock()
+_schemaTotals: dict[str, int] = {"verifyRuns": 0, "schemaChecksSkipped": 0, "roundTripsSaved": 0}
+_requestSchemaCounters: ContextVar[dict[str, int] | None] = ContextVar(
+    "requestSchemaCounters", default=None
+)
+
+
+def registerCollectionSchema(
+    collection: str,
+    indexes: list[IndexSpec] | tuple[IndexSpec, ...] = (),
+    *,
+    onVerify: Callable[[Any], None] | None = None,
+) -> None:
+    """
+    Add index specs (and an optional post-index hook receiving the collection) for a collection.
+    New specs invalidate a previous verification so they are created on the next ensure.
+    """
+    with _schemaLock:
+        specs = _schemaIndexes.setdefault(collection, [])
+        added = False
+        for spec in indexes:
+            if spec not in specs:
+                specs.append(spec)
+                added = True
+        if onVerify is not None:
+            _schemaHooks[collection] = onVerify
+            added = True
+        if added:
+            _schemaVerified.pop(collection, None)
+
+
+def _schemaRoundTrips(collection: str) -> int:
+    return len(_schemaIndexes.get(collection) or []) + (1 if collection in _schemaHooks else 0)
+
+
+def _countSchemaSkip(collection: str) -> None:
+    saved = _schemaRoundTrips(collection)
+    _schemaTotals["schemaChecksSkipped"] += 1
+    _schemaTotals["roundTripsSaved"] += saved
+    counters = _requestSchemaCounters.get()
+    if counters is not None:
+        counters["schemaChecksSkipped"] = counters.get("schemaChecksSkipped", 0) + 1
+        counters["roundTripsSaved"] = counters.get("roundTripsSaved", 0) + saved
+
+
+def ensureCollectionSchema(collection: str, *, force: bool = False) -> bool:
+    """
+    Create registered indexes for collection once per process.
+    Returns True when Mongo was contacted; raises on Mongo errors (nothing is recorded).
+    """
+    if not force and collection in _schemaVerified:
+        _countSchemaSkip(collection)
+        return False
+    with _schemaLock:
+        if not force and collection in _schemaVerified:
+            _countSchemaSkip(collection)
+            return False
+        coll = _getMongoDb()[collection]
+        specs = list(_schemaIndexes.get(collection) or [])
+        names: list[str] = []
+        for keys, options in specs:
+            names.append(str(coll.create_index(keys, **options)))
+        hook = _schemaHooks.get(collection)
+        if hook is not None:
+            hook(coll)
+        _schemaVerified[collection] = {"indexes": names, "verifiedAt": _utcNowIso()}
+        _schemaTotals["verifyRuns"] += 1
+        return True
+
+
+async def ensureCollectionSchemaAsync(collection: str) -> bool:
+    """Async-route variant: in-memory skip when verified, else the sync ensure off the event loop."""
+    if collection in _schemaVerified:
+        _countSchemaSkip(collection)
+        return False
+    return await asyncio.to_thread(ensureCollectionSchema, collection)
+
+
+def bootstrapSchemas(collections: list[str] | tuple[str, ...] | None = None) -> dict[str, bool]:
+    """Ensure every registered collection (or the given subset); returns collection -> contacted Mongo."""
+    names = list(collections) if collections is not None else sorted(_schemaIndexes)
+    return {name: ensureCollectionSchema(name) for name in names}
+
+
+def reverifySchemas(collections: list[str] | tuple[str, ...] | None = None) -> dict[str, Any]:
+    """Forget verification and re-run index creation (for collections dropped outside this process)."""
+    with _schemaLock:
+        names = list(collections) if collections is not None else sorted(_schemaIndexes)
+        for name in names:
+            _schemaVerified.pop(name, None)
+    verified: list[str] = []
+    failed: dict[str, str] = {}
+    for name in names:
+        try:
+            ensureCollectionSchema(name)
+            verified.append(name)
+        except (MongoUnavailableError, PyMongoError) as exc:
+            failed[name] = f"{type(exc).__name__}: {exc}"
+            _logMongoFailure(f"reverifySchemas({name})", exc)
+    return {"verified": verified, "failed": failed}
+
+
+def schemaBootstrapStatus() -> dict[str, Any]:
+    """Verified collections with their index names, plus process-wide skip/round-trip totals."""
+    with _schemaLock:
+        return {
+            "collections": {name: dict(info) for name, info in _schemaVerified.items()},
+            "pending": sorted(set(_schemaIndexes) - set(_schemaVerified)),
+            **_schemaTotals,
+        }
+
+
+def beginRequestSchemaCounters() -> dict[str, int]:
+    """Start per-request counters in the current context; the returned dict is updated in place."""
+    counters = {"schemaChecksSkipped": 0, "roundTripsSaved": 0}
+    _requestSchemaCounters.set(counters)
+    return counters
+
+
 def _mongoEnsureIndexes(recreate: bool) -> None:
     try:
-        db = _getMongoDb()
         if recreate:
+            db = _getMongoDb()
             names = set(db.list_collection_names())
-            if JOB_DATA_COLLECTION in names:
-                db[JOB_DATA_COLLECTION].drop()
-            if PAST_DATA_COLLECTION in names:
-                db[PAST_DATA_COLLECTION].drop()
-            if SCRAPER_SETTINGS_COLLECTION in names:
-                db[SCRAPER_SETTINGS_COLLECTION].drop()
-            if PLACETRACK_WORKSPACE_COLLECTION in names:
-                db[PLACETRACK_WORKSPACE_COLLECTION].drop()
-        job_col = db[JOB_DATA_COLLECTION]
-        past_col = db[PAST_DATA_COLLECTION]
-        job_col.create_index("jobId", unique=True)
-        past_col.create_index("jobId", unique=True)
-        job_col.create_index("platform")
-        job_col.create_index("category")
-        past_col.create_index("platform")
+            with _schemaLock:
+                if JOB_DATA_COLLECTION in names:
+                    db[JOB_DATA_COLLECTION].drop()
+                if PAST_DATA_COLLECTION in names:
+                    db[PAST_DATA_COLLECTION].drop()
+                if SCRAPER_SETTINGS_COLLECTION in names:
+                    db[SCRAPER_SETTINGS_COLLECTION].drop()
+                if PLACETRACK_WORKSPACE_COLLECTION in names:
+                    db[PLACETRACK_WORKSPACE_COLLECTION].drop()
+                if JOB_STATUS_COUNTERS_COLLECTION in names:
+                    db[JOB_STATUS_COUNTERS_COLLECTION].drop()
+                _schemaVerified.clear()
+        ensureCollectionSchema(JOB_DATA_COLLECTION)
+        ensureCollectionSchema(PAST_DATA_COLLECTION)
     except (MongoUnavailableError, PyMongoError) as exc:
         appendScrapeLog(
             f"Mongo index ensure skipped due to transient error: {type(exc).__name__}: {exc}",
@@ -124,7 +577,7 @@ def _mongoEnsureIndexes(recreate: bool) -> None:
 
 
 def createTables(*, recreate: bool = False) -> None:
-    """Ensure MongoDB collections and indexes exist (no-op when already present)."""
+    """Ensure MongoDB collections and indexes exist (verified once per process via the schema registry)."""
     _mongoEnsureIndexes(recreate)
 
 
@@ -213,22 +666,188 @@ def _mongoDocToJobRow(doc: dict) -> dict:
             out[k] = ""
         else:
             out[k] = v if isinstance(v, str) else str(v)
+    # Cached restriction scan (see upsertJobs); findRestrictionTagsForJob checks the hash.
+    if isinstance(doc.get("restrictionTags"), list) and doc.get("restrictionScanHash"):
+        out["restrictionTags"] = [str(t) for t in doc["restrictionTags"]]
+        out["restrictionScanHash"] = str(doc["restrictionScanHash"])
     return out
 
 
-def upsertJobs(rows: list[dict]) -> int:
+def fifoSortKey(timestamp: object) -> str:
+    """Stored sort key matching sortJobsFifoByTimestamp: timestamp, blank timestamps last."""
+    ts = str(timestamp or "").strip()
+    return ts or FIFO_KEY_BLANK_TIMESTAMP
+
+
+def _backfillFifoKeys(coll: Any) -> None:
+    coll.update_many(
+        {"fifoKey": {"$exists": False}},
+        [
+            {
+                "$set": {
+                    "fifoKey": {
+                        "$let": {
+                            "vars": {
+                                "ts": {"$trim": {"input": {"$toString": {"$ifNull": ["$timestamp", ""]}}}}
+                            },
+                            "in": {
+                                "$cond": [{"$eq": ["$$ts", ""]}, FIFO_KEY_BLANK_TIMESTAMP, "$$ts"]
+                            },
+                        }
+                    }
+                }
+            }
+        ],
+    )
+
+
+registerCollectionSchema(JOB_DATA_COLLECTION, onVerify=_backfillFifoKeys)
+
+
+# Materialized applyStatus counters: one document in jobStatusCounters holding
+# {"pending": n, "statuses": {<trimmed status>: n}}. Every applyStatus transition below
+# applies a matching $inc; reconcileJobStatusCounters() rebuilds it from jobData.
+def _statusCounterKey(status: object) -> str:
+    s = "" if status is None else str(status).strip()
+    return s.replace("%", "%25").replace(".", "%2E").replace("$", "%24")
+
+
+def _statusFromCounterKey(key: str) -> str:
+    return key.replace("%24", "$").replace("%2E", ".").replace("%25", "%")
+
+
+def _statusCounterField(status: object) -> str:
+    key = _statusCounterKey(status)
+    return f"statuses.{key}" if key else "pending"
+
+
+def _addStatusCounterDelta(deltas: dict[str, int], status: object, n: int) -> None:
+    field = _statusCounterField(status)
+    deltas[field] = deltas.get(field, 0) + n
+
+
+def _shiftStatusCounterDelta(deltas: dict[str, int], before: object, after: object) -> None:
+    if _statusCounterField(before) == _statusCounterField(after):
+        return
+    _addStatusCounterDelta(deltas, before, -1)
+    _addStatusCounterDelta(deltas, after, 1)
+
+
+def _applyStatusCounterDeltas(deltas: dict[str, int]) -> None:
+    """$inc the counters document (no upsert: a missing document is rebuilt on first read)."""
+    inc = {field: n for field, n in deltas.items() if n}
+    if not inc:
+        return
+    try:
+        _getMongoDb()[JOB_STATUS_COUNTERS_COLLECTION].update_one(
+            {"_id": JOB_STATUS_COUNTERS_DOCUMENT_ID},
+            {"$inc": inc, "$set": {"updatedAt": _utcNowIso()}},
+        )
+    except (MongoUnavailableError, PyMongoError) as exc:
+        _logMongoFailure("jobStatusCounters $inc (run reconcile to repair drift)", exc)
+
+
+def _shiftStatusCounter(before: object, after: object) -> None:
+    deltas: dict[str, int] = {}
+    _shiftStatusCounterDelta(deltas, before, after)
+    _applyStatusCounterDeltas(deltas)
+
+
+def _decodeStatusCounters(doc: dict | None) -> tuple[int, dict[str, int]]:
+    if not isinstance(doc, dict):
+        return 0, {}
+    statuses: dict[str, int] = {}
+    raw = doc.get("statuses")
+    if isinstance(raw, dict):
+        for key, value in raw.items():
+            count = int(value or 0)
+            if count:
+                statuses[_statusFromCounterKey(str(key))] = count
+    return int(doc.get("pending") or 0), statuses
+
+
+def _aggregateStatusCounters(coll: Any, match: dict[str, Any] | None = None) -> tuple[int, dict[str, int]]:
+    pipeline = ([{"$match": match}] if match else []) + applyStatusCountPipeline()
+    pending = 0
+    statuses: dict[str, int] = {}
+    for row in coll.aggregate(pipeline):
+        key = str(row.get("_id") or "").strip()
+        count = int(row.get("count") or 0)
+        if not key:
+            pending += count
+        else:
+            statuses[key] = statuses.get(key, 0) + count
+    return pending, statuses
+
+
+def reconcileJobStatusCounters() -> dict[str, Any]:
+    """
+    Rebuild the counters document from a $group over jobData and report drift
+    (rows of status/stored/actual/delta; pending is reported as status "NULL").
+    """
+    createTables(recreate=False)
+    db = _getMongoDb()
+    countersCol = db[JOB_STATUS_COUNTERS_COLLECTION]
+    stored = countersCol.find_one({"_id": JOB_STATUS_COUNTERS_DOCUMENT_ID})
+    storedPending, storedStatuses = _decodeStatusCounters(stored)
+    pending, statuses = _aggregateStatusCounters(db[JOB_DATA_COLLECTION])
+    now = _utcNowIso()
+    countersCol.replace_one(
+        {"_id": JOB_STATUS_COUNTERS_DOCUMENT_ID},
+        {
+            "pending": pending,
+            "statuses": {_statusCounterKey(k): v for k, v in statuses.items()},
+            "reconciledAt": now,
+            "updatedAt": now,
+        },
+        upsert=True,
+    )
+    drift: list[dict[str, Any]] = []
+    if stored is not None:
+        if storedPending != pending:
+            drift.append(
+                {"status": "NULL", "stored": storedPending, "actual": pending, "delta": pending - storedPending}
+            )
+        for key in sorted(set(storedStatuses) | set(statuses), key=str.upper):
+            before = int(storedStatuses.get(key, 0))
+            after = int(statuses.get(key, 0))
+            if before != after:
+                drift.append({"status": key, "stored": before, "actual": after, "delta": after - before})
+    return {
+        "hadDocument": stored is not None,
+        "drift": drift,
+        "total": pending + sum(statuses.values()),
+        "pending": pending,
+        "statusCounts": statuses,
+        "reconciledAt": now,
+    }
+
+
+def upsertJobs(rows: list[dict], *, enqueueNew: bool = False) -> int:
+    """
+    Upsert scraped rows into jobData (status counters kept in step). With enqueueNew, rows
+    inserted by this call with a pending (NULL) applyStatus are also pushed onto the
+    validation queue for a `validation.py -1 --follow` worker.
+
+    Rows that carry an applyStatus for an existing job are written conditionally on the
+    pre-image their counter shift is computed from; a row that lost a race with a claim or
+    UI decision is replayed through find_one_and_update, like the single-row paths. Later
+    rows for the same jobId win.
+    """
     if not rows:
         return 0
     from pymongo import UpdateOne
 
     from .jobDecisionService import (
+        EXPERIENCE_ABOVE_FIVE_LABEL,
         composeRestrictionStyleText,
+        restrictionScanFields,
         scanTextImpliesExperienceAboveFive,
     )
 
     createTables(recreate=False)
     coll = _getMongoDb()[JOB_DATA_COLLECTION]
-    ops: list[Any] = []
+    entries: dict[str, tuple[str | None, dict[str, Any]]] = {}
     for row in rows:
         if not isinstance(row, dict):
             continue
@@ -252,23 +871,205 @@ def upsertJobs(rows: list[dict]) -> int:
             "platform": str(row.get("platform") or "Unknown"),
             "category": str(row.get("category") or "").strip(),
         }
+        set_doc["fifoKey"] = fifoSortKey(set_doc["timestamp"])
         if apply_val is not None:
             set_doc["applyStatus"] = apply_val
-        set_doc["requiresExperienceAboveFive"] = bool(
-            scanTextImpliesExperienceAboveFive(composeRestrictionStyleText(row))
-        )
-        ops.append(UpdateOne({"jobId": jid}, {"$set": set_doc}, upsert=True))
-    if not ops:
+        # Cache the scan over the stored fields so later phases (validation, suggest, accept)
+        # can reuse it via restrictionScanHash; the flag still covers the full scraped row.
+        scan = restrictionScanFields(set_doc)
+        set_doc["restrictionTags"] = scan["restrictionTags"]
+        set_doc["restrictionScanHash"] = scan["restrictionScanHash"]
+        row_text = composeRestrictionStyleText(row)
+        if row_text == composeRestrictionStyleText(set_doc):
+            set_doc["requiresExperienceAboveFive"] = EXPERIENCE_ABOVE_FIVE_LABEL in scan["restrictionTags"]
+        else:
+            set_doc["requiresExperienceAboveFive"] = bool(
+                scanTextImpliesExperienceAboveFive(row_text)
+            )
+        entries.pop(jid, None)
+        entries[jid] = (apply_val, set_doc)
+    if not entries:
         return 0
     try:
-        coll.bulk_write(ops, ordered=False)
+        current = _applyStatusesByJobId(coll, sorted(entries))
+        # Only status-setting writes to existing rows move a counter bucket of a known row.
+        guardedIds = [
+            jid for jid, (apply_val, _) in entries.items() if apply_val is not None and jid in current
+        ]
+        upsertIds = [jid for jid in entries if jid not in current or entries[jid][0] is None]
+        upserted: set[str] = set()
+        if upsertIds:
+            result = coll.bulk_write(
+                [UpdateOne({"jobId": jid}, {"$set": entries[jid][1]}, upsert=True) for jid in upsertIds],
+                ordered=False,
+            )
+            upserted = {upsertIds[idx] for idx in (result.upserted_ids or {})}
+        guardedResult = None
+        if guardedIds:
+            guardedResult = coll.bulk_write(
+                [
+                    UpdateOne({"jobId": jid, "applyStatus": current[jid]}, {"$set": entries[jid][1]})
+                    for jid in guardedIds
+                ],
+                ordered=False,
+            )
     except PyMongoError as exc:
         appendScrapeLog(
             f"Mongo upsert skipped (transient error): {type(exc).__name__}: {exc}",
             platform="MongoDB",
         )
         return 0
-    return len(ops)
+
+    deltas: dict[str, int] = {}
+    for jid in upsertIds:
+        apply_val = entries[jid][0]
+        if jid in upserted:
+            _addStatusCounterDelta(deltas, apply_val, 1)
+        elif apply_val is not None:
+            # Inserted by someone else between the read and the write: prior unknown.
+            appendScrapeLog(
+                f"upsertJobs raced a concurrent insert of {jid} "
+                "(run reconcile_status_counters to repair drift)",
+                platform="MongoDB",
+            )
+    confirmed: list[str] | set[str] = guardedIds
+    if guardedResult is not None and guardedResult.matched_count < len(guardedIds):
+        after = _applyStatusesByJobId(coll, guardedIds)
+        confirmed = {jid for jid in guardedIds if jid in after and after[jid] == entries[jid][0]}
+        replay = [jid for jid in guardedIds if jid not in confirmed]
+        if len(replay) < len(guardedIds) - guardedResult.matched_count:
+            appendScrapeLog(
+                "upsertJobs raced a same-status write "
+                "(run reconcile_status_counters to repair drift)",
+                platform="MongoDB",
+            )
+        for jid in replay:
+            apply_val, set_doc = entries[jid]
+            try:
+                before = coll.find_one_and_update(
+                    {"jobId": jid}, {"$set": set_doc}, projection={"applyStatus": 1}, upsert=True
+                )
+            except PyMongoError as exc:
+                _logMongoFailure(f"upsertJobs replay of {jid}", exc)
+                continue
+            if before is None:
+                upserted.add(jid)
+                _addStatusCounterDelta(deltas, apply_val, 1)
+            else:
+                _shiftStatusCounterDelta(deltas, before.get("applyStatus"), apply_val)
+    for jid in confirmed:
+        _shiftStatusCounterDelta(deltas, current[jid], entries[jid][0])
+    _applyStatusCounterDeltas(deltas)
+    if enqueueNew:
+        fresh = [jid for jid in entries if jid in upserted and entries[jid][0] is None]
+        if fresh:
+            enqueueJobsForValidation(fresh)
+    return len(entries)
+
+
+# --- Validation queue: new NULL-status jobIds for a follow-mode validation worker ---
+# jobData stays the source of truth: an entry only says "check this one soon". A consumed entry
+# whose job is already decided (or leased by a backlog run) is simply dropped, and a job whose
+# entry is lost is still NULL, so the regular `validation.py -1` backlog run picks it up.
+
+
+def validationQueueEnabled() -> bool:
+    """VALIDATION_QUEUE_ENABLED=1 (set by `midhScraping.py --pipeline` for its scrapers)."""
+    return bool(_envFlag("VALIDATION_QUEUE_ENABLED"))
+
+
+def enqueueJobsForValidation(jobIds: list[str]) -> int:
+    """Add jobIds to validationQueue (idempotent per jobId). Returns new entries; 0 on Mongo errors."""
+    ids = list(dict.fromkeys(str(j).strip() for j in jobIds if str(j or "").strip()))
+    if not ids:
+        return 0
+    from pymongo import UpdateOne
+
+    now = datetime.now(timezone.utc)
+    try:
+        ensureCollectionSchema(VALIDATION_QUEUE_COLLECTION)
+        result = _getMongoDb()[VALIDATION_QUEUE_COLLECTION].bulk_write(
+            [
+                UpdateOne({"_id": jid}, {"$setOnInsert": {"enqueuedAt": now}}, upsert=True)
+                for jid in ids
+            ],
+            ordered=False,
+        )
+    except (MongoUnavailableError, PyMongoError) as exc:
+        appendScrapeLog(
+            f"Validation queue enqueue skipped: {type(exc).__name__}: {exc}",
+            platform="MongoDB",
+        )
+        return 0
+    return len(result.upserted_ids or {})
+
+
+def countValidationQueue() -> int:
+    ensureCollectionSchema(VALIDATION_QUEUE_COLLECTION)
+    return int(_getMongoDb()[VALIDATION_QUEUE_COLLECTION].estimated_document_count())
+
+
+def claimQueuedValidationJobs(
+    owner: str, limit: int, *, leaseSec: int | None = None
+) -> tuple[list[dict], int]:
+    """
+    Pop up to `limit` oldest queue entries and lease their still-pending jobData rows to
+    `owner` (same lease as claimJobsWithEmptyApplyStatus). Returns (leased rows in queue
+    order, entries consumed).
+    """
+    ensureCollectionSchema(VALIDATION_QUEUE_COLLECTION)
+    queue = _getMongoDb()[VALIDATION_QUEUE_COLLECTION]
+    oldest = queue.find({}, {"_id": 1}).sort([("enqueuedAt", 1), ("_id", 1)]).limit(max(1, limit))
+    ids = [str(d["_id"]) for d in oldest]
+    if not ids:
+        return [], 0
+    createTables(recreate=False)
+    coll = _getMongoDb()[JOB_DATA_COLLECTION]
+    query = _claimableEmptyApplyStatusQuery(None, _utcNowIso())
+    expiresAt = _utcIsoAfter(leaseSec or _validationLeaseSeconds())
+    coll.update_many(
+        {**query, "jobId": {"$in": ids}},
+        {"$set": {"leaseOwner": owner, "leaseExpiresAt": expiresAt}},
+    )
+    queue.delete_many({"_id": {"$in": ids}})
+    leased = {
+        str(d.get("jobId")): _mongoDocToJobRow(d)
+        for d in coll.find({"jobId": {"$in": ids}, "leaseOwner": owner, "applyStatus": None})
+    }
+    return [leased[jid] for jid in ids if jid in leased], len(ids)
+
+
+def iterQueuedValidationJobs(
+    owner: str,
+    *,
+    drainEvent: threading.Event,
+    pollSec: float | None = None,
+    batchSize: int | None = None,
+    leaseSec: int | None = None,
+) -> Iterator[dict | None]:
+    """
+    Follow-mode counterpart of iterClaimedJobsWithEmptyApplyStatus: yields leased rows as
+    they are queued, and None after every empty poll (so the caller can flush writes and
+    heartbeat while idle) before sleeping VALIDATION_QUEUE_POLL_SEC (default 5). Returns
+    once `drainEvent` is set and the queue is empty.
+    """
+    size = batchSize if batchSize is not None else envInt("VALIDATION_CURSOR_BATCH_SIZE", 100, 1)
+    poll = pollSec if pollSec is not None else envFloat("VALIDATION_QUEUE_POLL_SEC", 5.0, 1.0)
+    lease = leaseSec or _validationLeaseSeconds()
+    renewedAt = time.monotonic()
+    while True:
+        claimed, consumed = claimQueuedValidationJobs(owner, size, leaseSec=lease)
+        for job in claimed:
+            if time.monotonic() - renewedAt >= lease / 3:
+                renewValidationLeases(owner, leaseSec=lease)
+                renewedAt = time.monotonic()
+            yield job
+        if consumed:
+            continue
+        if drainEvent.is_set():
+            return
+        yield None
+        drainEvent.wait(poll)
 
 
 def loadJobsByPlatform(platform: str) -> list[dict]:
@@ -293,18 +1094,262 @@ def sortJobsFifoByTimestamp(jobs: list[dict]) -> list[dict]:
     return sorted(jobs, key=sortKey)
 
 
+def _emptyApplyStatusQuery(platform: str | None) -> dict[str, Any]:
+    query: dict[str, Any] = {"applyStatus": None}
+    if platform:
+        query["platform"] = platform
+    return query
+
+
+def iterJobsFifo(query: dict[str, Any], *, batchSize: int | None = None) -> Iterator[dict]:
+    """
+    Stream jobData rows matching `query` in FIFO order (fifoKey, jobId), `batchSize` rows per
+    round-trip (VALIDATION_CURSOR_BATCH_SIZE, default 100). Each batch is a fresh keyset query
+    served by the (applyStatus, fifoKey, jobId) index, so memory stays flat, the first row is
+    available after one small read, and hours-long validation runs never hold a server cursor
+    open. Rows whose status changes mid-run drop out of later batches instead of repeating.
+    """
+    size = batchSize if batchSize is not None else envInt("VALIDATION_CURSOR_BATCH_SIZE", 100, 1)
+    createTables(recreate=False)
+    coll = _getMongoDb()[JOB_DATA_COLLECTION]
+    after: tuple[str, str] | None = None
+    while True:
+        match = query
+        if after is not None:
+            keyset = {
+                "$or": [
+                    {"fifoKey": {"$gt": after[0]}},
+                    {"fifoKey": after[0], "jobId": {"$gt": after[1]}},
+                ]
+            }
+            match = {"$and": [query, keyset]} if query else keyset
+        docs = list(coll.find(match).sort([("fifoKey", 1), ("jobId", 1)]).limit(size))
+        for doc in docs:
+            yield _mongoDocToJobRow(doc)
+        if len(docs) < size:
+            return
+        last = docs[-1]
+        after = (
+            str(last.get("fifoKey") or fifoSortKey(last.get("timestamp"))),
+            str(last.get("jobId") or ""),
+        )
+
+
+def iterJobsWithEmptyApplyStatus(
+    platform: str | None = None, *, batchSize: int | None = None
+) -> Iterator[dict]:
+    """Streaming loadJobsWithEmptyApplyStatus: same rows and FIFO order, fetched in batches."""
+    return iterJobsFifo(_emptyApplyStatusQuery(platform), batchSize=batchSize)
+
+
+def countJobsWithEmptyApplyStatus(platform: str | None = None) -> int:
+    createTables(recreate=False)
+    return int(_getMongoDb()[JOB_DATA_COLLECTION].count_documents(_emptyApplyStatusQuery(platform)))
+
+
 def loadJobsWithEmptyApplyStatus(platform: str | None = None) -> list[dict]:
     """
     Jobs where applyStatus is null/missing only.
     Ordered FIFO: oldest timestamp first; rows with no timestamp sort last, then jobId.
     """
+    return list(iterJobsWithEmptyApplyStatus(platform))
+
+
+# Validation leases: a NULL-status job being checked carries leaseOwner / leaseExpiresAt
+# (applyStatus stays NULL, so counters and dashboards are unaffected). Other runs skip it until
+# the lease expires; bulkUpdateApplyStatuses clears the lease together with the status write.
+def _validationLeaseSeconds() -> int:
+    return envInt("VALIDATION_LEASE_SEC", 900, 30)
+
+
+def _claimableEmptyApplyStatusQuery(platform: str | None, nowIso: str) -> dict[str, Any]:
+    query = _emptyApplyStatusQuery(platform)
+    query["$or"] = [{"leaseExpiresAt": None}, {"leaseExpiresAt": {"$lte": nowIso}}]
+    return query
+
+
+def claimJobsWithEmptyApplyStatus(
+    owner: str,
+    limit: int,
+    *,
+    leaseSec: int | None = None,
+    platform: str | None = None,
+) -> tuple[list[dict], bool]:
+    """
+    Lease up to `limit` unleased (or expired) NULL-status jobs to `owner`, oldest first.
+    Returns (claimed rows in FIFO order, whether any candidates existed). A concurrent run
+    can win some candidates, so an empty claim with candidates present means "try again".
+    """
     createTables(recreate=False)
-    query: dict[str, Any] = {"applyStatus": None}
-    if platform:
-        query["platform"] = platform
-    cur = _getMongoDb()[JOB_DATA_COLLECTION].find(query)
-    jobs = [_mongoDocToJobRow(d) for d in cur]
-    return sortJobsFifoByTimestamp(jobs)
+    coll = _getMongoDb()[JOB_DATA_COLLECTION]
+    query = _claimableEmptyApplyStatusQuery(platform, _utcNowIso())
+    fifo = [("fifoKey", 1), ("jobId", 1)]
+    candidates = [
+        str(d.get("jobId"))
+        for d in coll.find(query, {"_id": 0, "jobId": 1}).sort(fifo).limit(max(1, limit))
+    ]
+    if not candidates:
+        return [], False
+    expiresAt = _utcIsoAfter(leaseSec or _validationLeaseSeconds())
+    coll.update_many(
+        {**query, "jobId": {"$in": candidates}},
+        {"$set": {"leaseOwner": owner, "leaseExpiresAt": expiresAt}},
+    )
+    claimed = coll.find({"jobId": {"$in": candidates}, "leaseOwner": owner, "applyStatus": None}).sort(fifo)
+    return [_mongoDocToJobRow(d) for d in claimed], True
+
+
+def renewValidationLeases(owner: str, *, leaseSec: int | None = None) -> int:
+    """Push out the expiry of every NULL-status job still leased to `owner`."""
+    res = _getMongoDb()[JOB_DATA_COLLECTION].update_many(
+        {"leaseOwner": owner, "applyStatus": None},
+        {"$set": {"leaseExpiresAt": _utcIsoAfter(leaseSec or _validationLeaseSeconds())}},
+    )
+    return int(res.modified_count)
+
+
+def releaseValidationLeases(owner: str) -> int:
+    """Drop every lease held by `owner` so other runs can pick those jobs up immediately."""
+    res = _getMongoDb()[JOB_DATA_COLLECTION].update_many(
+        {"leaseOwner": owner},
+        {"$unset": {"leaseOwner": "", "leaseExpiresAt": ""}},
+    )
+    return int(res.modified_count)
+
+
+def iterClaimedJobsWithEmptyApplyStatus(
+    owner: str,
+    *,
+    batchSize: int | None = None,
+    leaseSec: int | None = None,
+    platform: str | None = None,
+) -> Iterator[dict]:
+    """
+    Lease-claiming variant of iterJobsWithEmptyApplyStatus for validation runs: claims FIFO
+    batches for `owner` and yields them, renewing the owner's leases every third of the lease
+    so jobs that are yielded but not yet written stay claimed. Parallel runs split the
+    backlog; a crashed run's jobs come back once its leases expire (or are released).
+    """
+    size = batchSize if batchSize is not None else envInt("VALIDATION_CURSOR_BATCH_SIZE", 100, 1)
+    lease = leaseSec or _validationLeaseSeconds()
+    renewedAt = time.monotonic()
+    while True:
+        claimed, hadCandidates = claimJobsWithEmptyApplyStatus(
+            owner, size, leaseSec=lease, platform=platform
+        )
+        if not hadCandidates:
+            return
+        for job in claimed:
+            if time.monotonic() - renewedAt >= lease / 3:
+                renewValidationLeases(owner, leaseSec=lease)
+                renewedAt = time.monotonic()
+            yield job
+
+
+class ValidationRunCheckpoint:
+    """
+    Checkpoint document (validationRuns) for one validation run, used as a context manager.
+
+    On enter, a `running` run of the same mode whose heartbeat is older than
+    VALIDATION_RUN_STALE_SEC (default 300) is treated as a crashed container and adopted:
+    counters carry on, resumeCount increments and its leases are released so its unfinished
+    jobs are claimed first. Otherwise a new run is inserted. checkpoint() stores progress plus
+    a heartbeat; on exit the run is closed as completed / interrupted / aborted (from the
+    exception, if any) and every lease it still holds is released. Enter it before the
+    ApplyStatusWriteBuffer so buffered statuses are written before the leases go.
+    """
+
+    def __init__(self, owner: str, *, mode: str = "validate", total: int = 0):
+        self.owner = owner
+        self.mode = mode
+        self.total = int(total)
+        self.doc: dict[str, Any] = {}
+        self.progress: dict[str, Any] = {}
+        self.lost = False
+
+    @property
+    def runId(self) -> str:
+        return str(self.doc.get("_id") or "")
+
+    @property
+    def resumed(self) -> bool:
+        return int(self.doc.get("resumeCount") or 0) > 0
+
+    def __enter__(self) -> "ValidationRunCheckpoint":
+        from pymongo import ReturnDocument
+
+        createTables(recreate=False)
+        ensureCollectionSchema(VALIDATION_RUNS_COLLECTION)
+        coll = _getMongoDb()[VALIDATION_RUNS_COLLECTION]
+        now = _utcNowIso()
+        staleBefore = _utcIsoAfter(-envInt("VALIDATION_RUN_STALE_SEC", 300, 30))
+        stale = coll.find_one(
+            {"mode": self.mode, "status": "running", "heartbeatAt": {"$lt": staleBefore}},
+            sort=[("heartbeatAt", -1)],
+        )
+        if stale is not None:
+            adopted = coll.find_one_and_update(
+                {"_id": stale["_id"], "owner": stale.get("owner"), "status": "running"},
+                {
+                    "$set": {"owner": self.owner, "heartbeatAt": now, "resumedAt": now},
+                    "$inc": {"resumeCount": 1},
+                },
+                return_document=ReturnDocument.AFTER,
+            )
+            if adopted is not None:
+                releaseValidationLeases(str(stale.get("owner") or ""))
+                self.doc = adopted
+                return self
+        self.doc = {
+            "_id": f"{self.mode}-{now}-{self.owner}",
+            "mode": self.mode,
+            "owner": self.owner,
+            "status": "running",
+            "startedAt": now,
+            "heartbeatAt": now,
+            "pendingAtStart": self.total,
+            "processed": 0,
+            "written": 0,
+            "rejectedPrecheck": 0,
+            "lastJobId": None,
+            "lastTimestamp": None,
+            "resumeCount": 0,
+        }
+        coll.insert_one(self.doc)
+        return self
+
+    def checkpoint(self, progress: dict[str, Any]) -> bool:
+        """Persist progress + heartbeat; False (and `lost`) once another run adopted this one."""
+        self.progress = dict(progress)
+        try:
+            res = _getMongoDb()[VALIDATION_RUNS_COLLECTION].update_one(
+                {"_id": self.runId, "owner": self.owner},
+                {"$set": {**self.progress, "heartbeatAt": _utcNowIso()}},
+            )
+        except (MongoUnavailableError, PyMongoError) as exc:
+            _logMongoFailure("validationRuns checkpoint", exc)
+            return True
+        self.lost = res.matched_count == 0
+        return not self.lost
+
+    def __exit__(self, excType: type[BaseException] | None, *_exc: object) -> None:
+        if self.lost:
+            return
+        if excType is None:
+            status = "completed"
+        elif issubclass(excType, (KeyboardInterrupt, SystemExit)):
+            status = "interrupted"
+        else:
+            status = "aborted"
+        now = _utcNowIso()
+        try:
+            _getMongoDb()[VALIDATION_RUNS_COLLECTION].update_one(
+                {"_id": self.runId, "owner": self.owner},
+                {"$set": {**self.progress, "status": status, "heartbeatAt": now, "finishedAt": now}},
+            )
+            releaseValidationLeases(self.owner)
+        except (MongoUnavailableError, PyMongoError) as exc:
+            _logMongoFailure("validationRuns finish (leases expire on their own)", exc)
 
 
 def updateApplyStatusByJobId(jobId: str, applyStatus: str) -> bool:
@@ -313,10 +1358,180 @@ def updateApplyStatusByJobId(jobId: str, applyStatus: str) -> bool:
     if not jid:
         return False
     createTables(recreate=False)
-    res = _getMongoDb()[JOB_DATA_COLLECTION].update_one(
-        {"jobId": jid}, {"$set": {"applyStatus": status}}
+    before = _getMongoDb()[JOB_DATA_COLLECTION].find_one_and_update(
+        {"jobId": jid}, {"$set": {"applyStatus": status}}, projection={"applyStatus": 1}
     )
-    return res.matched_count > 0
+    if before is None:
+        return False
+    _shiftStatusCounter(before.get("applyStatus"), status)
+    return True
+
+
+def _applyStatusesByJobId(coll: Any, jobIds: list[str]) -> dict[str, Any]:
+    return {
+        str(d.get("jobId")): d.get("applyStatus")
+        for d in coll.find({"jobId": {"$in": jobIds}}, {"_id": 0, "jobId": 1, "applyStatus": 1})
+    }
+
+
+def bulkUpdateApplyStatuses(updates: list[tuple[str, str]]) -> set[str]:
+    """
+    Set applyStatus for many jobIds with one pre-image read and one unordered bulk_write
+    (instead of createTables + find_one_and_update per job). Later entries for the same jobId
+    win. Returns the jobIds that matched a jobData row.
+
+    Each write is conditional on the pre-image it is counted from, so a concurrent claim or UI
+    decision between the read and the write cannot shift the wrong counter bucket. When fewer
+    writes match than were sent, the rows are re-read: rows now at their target are counted,
+    the rest are retried against their new pre-image, and whatever still races after
+    BULK_STATUS_WRITE_ROUNDS goes through the single-row find_one_and_update path.
+    """
+    latest: dict[str, str] = {}
+    for jobId, applyStatus in updates:
+        jid = str(jobId or "").strip()
+        if jid:
+            latest[jid] = str(applyStatus or "").strip()
+    if not latest:
+        return set()
+    from pymongo import UpdateOne
+
+    createTables(recreate=False)
+    coll = _getMongoDb()[JOB_DATA_COLLECTION]
+    unset = {"leaseOwner": "", "leaseExpiresAt": ""}
+    matched: set[str] = set()
+    deltas: dict[str, int] = {}
+    pending = sorted(latest)
+    for _ in range(BULK_STATUS_WRITE_ROUNDS):
+        if not pending:
+            break
+        before = _applyStatusesByJobId(coll, pending)
+        if not before:
+            pending = []
+            break
+        ops = [
+            UpdateOne(
+                {"jobId": jid, "applyStatus": prior},
+                {"$set": {"applyStatus": latest[jid]}, "$unset": unset},
+            )
+            for jid, prior in before.items()
+        ]
+        result = coll.bulk_write(ops, ordered=False)
+        if result.matched_count == len(ops):
+            confirmed, pending = before, []
+        else:
+            # Someone changed a row between the read and the write: keep the rows that reached
+            # their target, retry the others from what they hold now.
+            current = _applyStatusesByJobId(coll, sorted(before))
+            confirmed = {
+                jid: prior
+                for jid, prior in before.items()
+                if jid in current and current[jid] == latest[jid]
+            }
+            pending = sorted(jid for jid in current if jid not in confirmed)
+            if len(pending) + len(before) - len(current) < len(ops) - result.matched_count:
+                # A concurrent writer set one of these rows to the very status we wanted and
+                # counted it itself; the rows cannot be told apart.
+                appendScrapeLog(
+                    "bulkUpdateApplyStatuses raced a same-status write "
+                    "(run reconcile_status_counters to repair drift)",
+                    platform="MongoDB",
+                )
+        matched.update(confirmed)
+        for jid, prior in confirmed.items():
+            _shiftStatusCounterDelta(deltas, prior, latest[jid])
+
+    for jid in pending:
+        before = coll.find_one_and_update(
+            {"jobId": jid},
+            {"$set": {"applyStatus": latest[jid]}, "$unset": unset},
+            projection={"applyStatus": 1},
+        )
+        if before is not None:
+            matched.add(jid)
+            _shiftStatusCounterDelta(deltas, before.get("applyStatus"), latest[jid])
+    _applyStatusCounterDeltas(deltas)
+    return matched
+
+
+class ApplyStatusWriteBuffer:
+    """
+    Write-behind buffer for validation outcomes. add() queues (jobId, applyStatus); the queue
+    is written with bulkUpdateApplyStatuses every VALIDATION_WRITE_BATCH_SIZE entries
+    (default 50) or VALIDATION_WRITE_FLUSH_SEC seconds (default 5).
+
+    Use as a context manager: the remainder is flushed when the block exits for any reason
+    (ConsecutiveCheckFailureAbort, KeyboardInterrupt, SystemExit), and an atexit hook covers
+    interpreter shutdown while the buffer is open. A failed bulk write keeps its entries
+    queued for the next flush.
+
+    Whether a row matched is only known at flush time: `written` counts updated rows (split by
+    the `source` passed to add() in `writtenBySource`) and `missing` lists jobIds that matched
+    nothing.
+    """
+
+    def __init__(self, batchSize: int | None = None, flushSec: float | None = None):
+        self.batchSize = batchSize if batchSize is not None else envInt("VALIDATION_WRITE_BATCH_SIZE", 50, 1)
+        self.flushSec = flushSec if flushSec is not None else envFloat("VALIDATION_WRITE_FLUSH_SEC", 5.0, 0.0)
+        self.written = 0
+        self.writtenBySource: dict[str, int] = {}
+        self.flushes = 0
+        self.missing: list[str] = []
+        self._pending: list[tuple[str, str, str]] = []
+        self._lastFlushAt = time.monotonic()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def add(self, jobId: str, applyStatus: str, source: str = "") -> None:
+        """Queue one outcome; `source` only labels it in writtenBySource."""
+        jid = str(jobId or "").strip()
+        if not jid:
+            return
+        with self._lock:
+            self._pending.append((jid, str(applyStatus or "").strip(), source))
+        self.flushIfDue()
+
+    def flushIfDue(self) -> int:
+        with self._lock:
+            due = bool(self._pending) and (
+                len(self._pending) >= self.batchSize
+                or time.monotonic() - self._lastFlushAt >= self.flushSec
+            )
+        return self.flush() if due else 0
+
+    def flush(self) -> int:
+        """Write everything queued; returns how many jobData rows were updated."""
+        with self._lock:
+            batch, self._pending = self._pending, []
+            self._lastFlushAt = time.monotonic()
+        if not batch:
+            return 0
+        try:
+            matched = bulkUpdateApplyStatuses([(jid, status) for jid, status, _ in batch])
+        except (MongoUnavailableError, PyMongoError) as exc:
+            with self._lock:
+                self._pending[:0] = batch
+            _logMongoFailure(f"applyStatus bulk write of {len(batch)} job(s)", exc)
+            return 0
+        sources = {jid: source for jid, _, source in batch}
+        self.missing.extend(sorted(set(sources) - matched))
+        updated = set(sources) & matched
+        for jid in updated:
+            self.writtenBySource[sources[jid]] = self.writtenBySource.get(sources[jid], 0) + 1
+        self.written += len(updated)
+        self.flushes += 1
+        return len(updated)
+
+    def __enter__(self) -> "ApplyStatusWriteBuffer":
+        atexit.register(self.flush)
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        try:
+            self.flush()
+        finally:
+            atexit.unregister(self.flush)
 
 
 def getApplyStatusUpperByJobId(jobId: str) -> str | None:
@@ -352,6 +1567,7 @@ def claimApplyingFromApply(jobId: str) -> tuple[str, str | None]:
         {"$set": {"applyStatus": "APPLYING"}},
     )
     if before is not None:
+        _shiftStatusCounter("APPLY", "APPLYING")
         return "claimed", "APPLY"
     row = col.find_one({"jobId": jid}, {"applyStatus": 1})
     if not row:
@@ -379,6 +1595,8 @@ def finalizeApplyStatusFromApplying(jobId: str, applyStatus: str) -> bool:
         {"jobId": jid, "applyStatus": "APPLYING"},
         {"$set": {"applyStatus": status}},
     )
+    if res.matched_count > 0:
+        _shiftStatusCounter("APPLYING", status)
     return res.matched_count > 0
 
 
@@ -392,59 +1610,112 @@ def revertApplyingToApply(jobId: str) -> bool:
         {"jobId": jid, "applyStatus": "APPLYING"},
         {"$set": {"applyStatus": "APPLY"}},
     )
+    if res.matched_count > 0:
+        _shiftStatusCounter("APPLYING", "APPLY")
     return res.matched_count > 0
 
 
-def loadJobsByApplyStatus(applyStatus: str) -> list[dict]:
+def iterJobsByApplyStatus(applyStatus: str, *, batchSize: int | None = None) -> Iterator[dict]:
+    """Stream rows with exactly this applyStatus in FIFO order (see iterJobsFifo)."""
     status = str(applyStatus or "").strip()
     if not status:
-        return []
+        return iter(())
+    return iterJobsFifo({"applyStatus": status}, batchSize=batchSize)
+
+
+def countJobsByApplyStatus(applyStatus: str) -> int:
+    status = str(applyStatus or "").strip()
+    if not status:
+        return 0
     createTables(recreate=False)
-    cur = _getMongoDb()[JOB_DATA_COLLECTION].find({"applyStatus": status})
-    jobs = [_mongoDocToJobRow(d) for d in cur]
-    return sortJobsFifoByTimestamp(jobs)
+    return int(_getMongoDb()[JOB_DATA_COLLECTION].count_documents({"applyStatus": status}))
 
 
-def jobDataApplyStatusSummary() -> dict[str, int]:
+def loadJobsByApplyStatus(applyStatus: str) -> list[dict]:
+    return list(iterJobsByApplyStatus(applyStatus))
+
+
+def applyStatusCountPipeline() -> list[dict[str, Any]]:
+    """Server-side $group on trimmed applyStatus; only that field leaves the storage engine."""
+    return [
+        {"$project": {"_id": 0, "applyStatus": 1}},
+        {
+            "$group": {
+                "_id": {"$trim": {"input": {"$toString": {"$ifNull": ["$applyStatus", ""]}}}},
+                "count": {"$sum": 1},
+            }
+        },
+    ]
+
+
+def jobDataStatusCounts() -> dict[str, Any]:
+    """
+    Status-count engine shared by /api/jobs/summary and the admin dashboard.
+    Returns total, pending (null/missing/blank), statusCounts {trimmed status: count} and pastDataRows.
+    Reads the materialized counters document (one point lookup); rebuilds it when missing.
+    The counters are read from the primary: a lagging secondary would serve stale counts right
+    after a status write or reconcile, and a missing document there would trigger a full rebuild.
+    """
     createTables(recreate=False)
-    db = _getMongoDb()
-    job_col = db[JOB_DATA_COLLECTION]
-    past_col = db[PAST_DATA_COLLECTION]
-    total = job_col.count_documents({})
-    past_n = past_col.count_documents({})
+    doc = getMongoDb()[JOB_STATUS_COUNTERS_COLLECTION].find_one({"_id": JOB_STATUS_COUNTERS_DOCUMENT_ID})
+    if not isinstance(doc, dict) or not doc.get("reconciledAt"):
+        rebuilt = reconcileJobStatusCounters()
+        pending, statusCounts = int(rebuilt["pending"]), dict(rebuilt["statusCounts"])
+    else:
+        pending, statusCounts = _decodeStatusCounters(doc)
+    pending = max(0, pending)
+    statusCounts = {k: v for k, v in statusCounts.items() if v > 0}
+    return {
+        "total": pending + sum(statusCounts.values()),
+        "pending": pending,
+        "statusCounts": statusCounts,
+        "pastDataRows": int(getDashboardMongoDb()[PAST_DATA_COLLECTION].estimated_document_count()),
+    }
 
-    def _trim_status(doc: dict) -> str:
-        return str(doc.get("applyStatus") or "").strip()
 
-    pending = 0
-    n_apply = 0
-    n_dna = 0
-    n_ex = 0
-    n_other = 0
-    for doc in job_col.find({}):
-        s = _trim_status(doc)
-        if not s:
-            pending += 1
-        elif s == "APPLY":
-            n_apply += 1
-        elif s == "DO_NOT_APPLY":
-            n_dna += 1
-        elif s == "EXISTING":
-            n_ex += 1
-        else:
-            n_other += 1
+async def jobDataStatusCountsAsync() -> dict[str, Any]:
+    """Async variant of jobDataStatusCounts (rebuilds a missing counters document off the loop)."""
+    await ensureCollectionSchemaAsync(JOB_DATA_COLLECTION)
+    countersCol = getAsyncMongoDb()[JOB_STATUS_COUNTERS_COLLECTION]
+    doc = await countersCol.find_one({"_id": JOB_STATUS_COUNTERS_DOCUMENT_ID})
+    if not isinstance(doc, dict) or not doc.get("reconciledAt"):
+        rebuilt = await asyncio.to_thread(reconcileJobStatusCounters)
+        pending, statusCounts = int(rebuilt["pending"]), dict(rebuilt["statusCounts"])
+    else:
+        pending, statusCounts = _decodeStatusCounters(doc)
+    pastDataRows = await getAsyncDashboardMongoDb()[PAST_DATA_COLLECTION].estimated_document_count()
+    pending = max(0, pending)
+    statusCounts = {k: v for k, v in statusCounts.items() if v > 0}
+    return {
+        "total": pending + sum(statusCounts.values()),
+        "pending": pending,
+        "statusCounts": statusCounts,
+        "pastDataRows": int(pastDataRows),
+    }
 
+
+def applyStatusSummaryFromCounts(counts: dict[str, Any]) -> dict[str, int]:
+    """Summary buckets (apply / doNotApply / existing / other) from a jobDataStatusCounts() result."""
+    statusCounts: dict[str, int] = counts["statusCounts"]
+    n_apply = int(statusCounts.get("APPLY", 0))
+    n_dna = int(statusCounts.get("DO_NOT_APPLY", 0))
+    n_ex = int(statusCounts.get("EXISTING", 0))
+    n_other = sum(statusCounts.values()) - (n_apply + n_dna + n_ex)
     return {
-        "total": total,
-        "nullPending": pending,
+        "total": int(counts["total"]),
+        "nullPending": int(counts["pending"]),
         "apply": n_apply,
         "doNotApply": n_dna,
         "existing": n_ex,
         "otherStatus": n_other,
-        "pastDataRows": past_n,
+        "pastDataRows": int(counts["pastDataRows"]),
     }
 
 
+def jobDataApplyStatusSummary() -> dict[str, int]:
+    return applyStatusSummaryFromCounts(jobDataStatusCounts())
+
+
 def deleteJobsByApplyStatusNotIn(allowedStatuses: list[str] | tuple[str, ...]) -> int:
     normalized = sorted(
         {str(item or "").strip() for item in allowedStatuses if str(item or "").strip()}
@@ -455,6 +1726,7 @@ def deleteJobsByApplyStatusNotIn(allowedStatuses: list[str] | tuple[str, ...]) -
     createTables(recreate=False)
     coll = _getMongoDb()[JOB_DATA_COLLECTION]
     to_delete: list[str] = []
+    deltas: dict[str, int] = {}
     for doc in coll.find(
         {"applyStatus": {"$exists": True, "$nin": [None, ""]}},
         {"jobId": 1, "applyStatus": 1},
@@ -464,10 +1736,16 @@ def deleteJobsByApplyStatusNotIn(allowedStatuses: list[str] | tuple[str, ...]) -
             jid = str(doc.get("jobId") or "").strip()
             if jid:
                 to_delete.append(jid)
+                _addStatusCounterDelta(deltas, s, -1)
     if not to_delete:
         return 0
     res = coll.delete_many({"jobId": {"$in": to_delete}})
-    return int(res.deleted_count or 0)
+    deleted = int(res.deleted_count or 0)
+    if deleted == len(to_delete):
+        _applyStatusCounterDeltas(deltas)
+    else:
+        reconcileJobStatusCounters()
+    return deleted
 
 
 def deleteJobsKeepingOnlyApply() -> int:
@@ -477,8 +1755,19 @@ def deleteJobsKeepingOnlyApply() -> int:
     """
     createTables(recreate=False)
     coll = _getMongoDb()[JOB_DATA_COLLECTION]
-    res = coll.delete_many({"applyStatus": {"$ne": "APPLY"}})
-    return int(res.deleted_count or 0)
+    match = {"applyStatus": {"$ne": "APPLY"}}
+    pending, statuses = _aggregateStatusCounters(coll, match)
+    res = coll.delete_many(match)
+    deleted = int(res.deleted_count or 0)
+    if deleted == pending + sum(statuses.values()):
+        deltas: dict[str, int] = {}
+        _addStatusCounterDelta(deltas, None, -pending)
+        for status, count in statuses.items():
+            _addStatusCounterDelta(deltas, status, -count)
+        _applyStatusCounterDeltas(deltas)
+    else:
+        reconcileJobStatusCounters()
+    return deleted
 
 
 def _parseStoredTimestampToUtc(raw: object) -> datetime | None:
@@ -557,6 +1846,7 @@ def flushJobsAndPastData() -> dict[str, int]:
     db = _getMongoDb()
     job_deleted = int((db[JOB_DATA_COLLECTION].delete_many({}).deleted_count) or 0)
     past_deleted = int((db[PAST_DATA_COLLECTION].delete_many({}).deleted_count) or 0)
+    reconcileJobStatusCounters()
     return {"jobDataDeleted": job_deleted, "pastDataDeleted": past_deleted}
 
 
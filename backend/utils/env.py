@@ -0,0 +1,38 @@
+"""
+Numeric settings read from environment variables.
+
+Unset, blank and unparseable values all fall back to the default, and the result (default
+included) is clamped to [minimum, maximum] when those are given.
+"""
+
+from __future__ import annotations
+
+import os
+
+
+def _clamp(value, minimum, maximum):
+    if minimum is not None:
+        value = max(minimum, value)
+    if maximum is not None:
+        value = min(maximum, value)
+    return value
+
+
+def envInt(name: str, default: int, minimum: int | None = None, maximum: int | None = None) -> int:
+    raw = str(os.getenv(name) or "").strip()
+    try:
+        value = int(raw) if raw else default
+    except ValueError:
+        value = default
+    return _clamp(value, minimum, maximum)
+
+
+def envFloat(
+    name: str, default: float, minimum: float | None = None, maximum: float | None = None
+) -> float:
+    raw = str(os.getenv(name) or "").strip()
+    try:
+        value = float(raw) if raw else default
+    except ValueError:
+        value = default
+    return _clamp(value, minimum, maximum)
@@ -0,0 +1,223 @@
+"""
+Batched Gmail API calls on top of new_batch_http_request.
+
+Each HTTP batch carries up to GMAIL_BATCH_SIZE calls (the API caps a batch at 100; Gmail
+starts throttling large batches, so the default is 50), at most GMAIL_BATCH_PARALLEL
+batches are in flight, and calls that come back 429 / 5xx / rateLimitExceeded are retried
+in a later round with exponential backoff. Other per-call errors are returned, not raised.
+
+modifyLabelsBatched applies label changes the same way trashNoiseCategoryMail trashes mail:
+ids sharing one (addLabelIds, removeLabelIds) set go out as messages.batchModify calls of up
+to 1,000 ids, and only a chunk that fails is retried id by id.
+
+Env:
+  GMAIL_BATCH_SIZE          calls per batch request, default 50 (max 100)
+  GMAIL_BATCH_PARALLEL      batch requests in flight, default 2
+  GMAIL_BATCH_MAX_RETRIES   retry rounds for throttled / 5xx calls, default 5
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+import google_auth_httplib2
+import httplib2
+from googleapiclient.errors import HttpError
+from googleapiclient.http import build_http
+
+from utils.env import envInt
+
+GMAIL_BATCH_LIMIT = 100
+BATCH_MODIFY_SIZE = 1000
+_RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+_RETRYABLE_REASONS = ("ratelimitexceeded", "userratelimitexceeded", "backenderror")
+_BACKOFF_BASE_SEC = 1.0
+_BACKOFF_MAX_SEC = 32.0
+
+_threadLocal = threading.local()
+
+
+def httpErrorStatus(exc: BaseException) -> int | None:
+    if isinstance(exc, HttpError):
+        return getattr(exc.resp, "status", None)
+    return None
+
+
+def isRetryableGmailError(exc: BaseException) -> bool:
+    """Throttling (429 / 403 rateLimitExceeded), 5xx and transport failures."""
+    if isinstance(exc, HttpError):
+        status = httpErrorStatus(exc)
+        if status in _RETRYABLE_STATUS:
+            return True
+        if status == 403:
+            content = exc.content
+            if isinstance(content, bytes):
+                content = content.decode("utf-8", "replace")
+            lowered = str(content or "").lower()
+            return any(reason in lowered for reason in _RETRYABLE_REASONS)
+        return False
+    return isinstance(exc, (OSError, httplib2.HttpLib2Error))
+
+
+def _backoffSec(attempt: int) -> float:
+    delay = min(_BACKOFF_MAX_SEC, _BACKOFF_BASE_SEC * (2 ** (attempt - 1)))
+    return delay + random.uniform(0, delay / 2)
+
+
+def _threadHttp(credentials):
+    """httplib2 is not thread-safe, so each worker thread gets its own authorized connection."""
+    http = getattr(_threadLocal, "http", None)
+    if http is None or getattr(http, "credentials", None) is not credentials:
+        http = google_auth_httplib2.AuthorizedHttp(credentials, http=build_http())
+        _threadLocal.http = http
+    return http
+
+
+def _executeChunk(
+    gmail,
+    chunk: list[str],
+    build: Callable[[str], Any],
+    credentials,
+) -> tuple[dict[str, Any], dict[str, BaseException]]:
+    ok: dict[str, Any] = {}
+    failed: dict[str, BaseException] = {}
+
+    def onResponse(requestId: str, response: Any, exception: BaseException | None) -> None:
+        if exception is not None:
+            failed[requestId] = exception
+        else:
+            ok[requestId] = response
+
+    batch = gmail.new_batch_http_request(callback=onResponse)
+    for key in chunk:
+        batch.add(build(key), request_id=key)
+    try:
+        batch.execute(http=_threadHttp(credentials) if credentials is not None else None)
+    except Exception as exc:
+        # The batch itself failed: every call it did not answer shares that error.
+        for key in chunk:
+            if key not in ok and key not in failed:
+                failed[key] = exc
+    return ok, failed
+
+
+def executeGmailBatched(
+    gmail,
+    keys: list[str],
+    build: Callable[[str], Any],
+    *,
+    batchSize: int | None = None,
+    maxParallel: int | None = None,
+    maxRetries: int | None = None,
+) -> tuple[dict[str, Any], dict[str, BaseException]]:
+    """
+    Execute build(key) (an unexecuted HttpRequest from `gmail`) for every distinct key
+    through batch requests. Returns (responses by key, errors by key); each key lands in
+    exactly one of the two.
+    """
+    size = batchSize or envInt("GMAIL_BATCH_SIZE", 50, 1, GMAIL_BATCH_LIMIT)
+    size = max(1, min(size, GMAIL_BATCH_LIMIT))
+    parallel = maxParallel or envInt("GMAIL_BATCH_PARALLEL", 2, 1)
+    retries = maxRetries if maxRetries is not None else envInt("GMAIL_BATCH_MAX_RETRIES", 5, 0)
+    credentials = getattr(getattr(gmail, "_http", None), "credentials", None)
+    if credentials is None:
+        parallel = 1
+
+    responses: dict[str, Any] = {}
+    errors: dict[str, BaseException] = {}
+    pending = list(dict.fromkeys(k for k in keys if k))
+    for attempt in range(retries + 1):
+        if not pending:
+            break
+        if attempt:
+            time.sleep(_backoffSec(attempt))
+        chunks = [pending[i : i + size] for i in range(0, len(pending), size)]
+        if parallel > 1 and len(chunks) > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(parallel, len(chunks)), thread_name_prefix="gmail-batch"
+            ) as pool:
+                outcomes = list(
+                    pool.map(lambda c: _executeChunk(gmail, c, build, credentials), chunks)
+                )
+        else:
+            outcomes = [_executeChunk(gmail, c, build, None) for c in chunks]
+
+        retry: list[str] = []
+        for ok, failed in outcomes:
+            responses.update(ok)
+            for key, exc in failed.items():
+                if attempt < retries and isRetryableGmailError(exc):
+                    retry.append(key)
+                else:
+                    errors[key] = exc
+        pending = retry
+    return responses, errors
+
+
+def getMessagesBatched(
+    gmail,
+    messageIds: list[str],
+    **getArgs: Any,
+) -> tuple[dict[str, dict], dict[str, BaseException]]:
+    """users.messages.get(userId="me", id=..., **getArgs) for every id, batched."""
+    messages = gmail.users().messages()
+    return executeGmailBatched(
+        gmail,
+        messageIds,
+        lambda msgId: messages.get(userId="me", id=msgId, **getArgs),
+    )
+
+
+def _executeWithRetry(request, retries: int) -> Any:
+    for attempt in range(retries + 1):
+        try:
+            return request.execute()
+        except Exception as exc:
+            if attempt >= retries or not isRetryableGmailError(exc):
+                raise
+            time.sleep(_backoffSec(attempt + 1))
+    return None
+
+
+def modifyLabelsBatched(
+    gmail,
+    changes: list[tuple[str, list[str], list[str]]],
+    *,
+    maxRetries: int | None = None,
+) -> dict[str, BaseException]:
+    """
+    Apply (messageId, addLabelIds, removeLabelIds) changes with messages.batchModify, one
+    call per label signature and BATCH_MODIFY_SIZE ids. A chunk whose batchModify fails is
+    re-sent as per-id modify calls (batched), so one bad id does not fail its neighbours.
+    Returns errors by message id; ids not in it were modified.
+    """
+    retries = maxRetries if maxRetries is not None else envInt("GMAIL_BATCH_MAX_RETRIES", 5, 0)
+    groups: dict[tuple[tuple[str, ...], tuple[str, ...]], list[str]] = {}
+    for messageId, addIds, removeIds in changes:
+        if messageId:
+            groups.setdefault((tuple(addIds), tuple(removeIds)), []).append(messageId)
+
+    messages = gmail.users().messages()
+    errors: dict[str, BaseException] = {}
+    for (addIds, removeIds), ids in groups.items():
+        body = {"addLabelIds": list(addIds), "removeLabelIds": list(removeIds)}
+        ids = list(dict.fromkeys(ids))
+        for start in range(0, len(ids), BATCH_MODIFY_SIZE):
+            chunk = ids[start : start + BATCH_MODIFY_SIZE]
+            try:
+                _executeWithRetry(
+                    messages.batchModify(userId="me", body={"ids": chunk, **body}), retries
+                )
+            except Exception:
+                _, failed = executeGmailBatched(
+                    gmail,
+                    chunk,
+                    lambda msgId: messages.modify(userId="me", id=msgId, body=body),
+                    maxRetries=retries,
+                )
+                errors.update(failed)
+    return errors
@@ -0,0 +1,88 @@
+"""
+Persistent inbox-clean classifications, so a message classified in one preview is not
+re-classified (and, above all, not re-sent to the LLM) by the next preview / clean call.
+
+One document per Gmail message id. An entry is only reused while its contentHash still
+matches: the hash covers sender, subject, snippet and body plus the classifier version
+(regex patterns, LLM prompt and model), so editing a pattern or switching model makes old
+entries miss on their own. `llmChecked` records whether the LLM already answered for the
+message; a regex-only entry never stands in for a call that wants the LLM.
+
+MongoDB being unavailable only disables the cache: lookups miss and writes are dropped.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Any
+
+from utils.dataManager import (
+    MongoUnavailableError,
+    PyMongoError,
+    ensureCollectionSchema,
+    getMongoDb,
+    registerCollectionSchema,
+)
+
+GMAIL_CLASSIFICATIONS_COLLECTION = "gmailClassifications"
+# Unread mail older than this is rarely previewed again; let Mongo drop it.
+GMAIL_CLASSIFICATION_TTL_SEC = 30 * 24 * 3600
+
+_CLASSIFICATION_FIELDS = ("category", "labelName", "reason", "isCompany", "isJobRelated", "source")
+
+registerCollectionSchema(
+    GMAIL_CLASSIFICATIONS_COLLECTION,
+    [
+        (
+            "classifiedAt",
+            {"name": "classifiedAtTtl", "expireAfterSeconds": GMAIL_CLASSIFICATION_TTL_SEC},
+        ),
+    ],
+)
+
+
+def _collection():
+    ensureCollectionSchema(GMAIL_CLASSIFICATIONS_COLLECTION)
+    return getMongoDb()[GMAIL_CLASSIFICATIONS_COLLECTION]
+
+
+def loadCachedClassifications(hashes: dict[str, str]) -> dict[str, dict[str, Any]]:
+    """
+    hashes: message id -> current contentHash.
+    Returns message id -> {classification, llmChecked} for entries whose hash still matches.
+    """
+    if not hashes:
+        return {}
+    try:
+        docs = list(_collection().find({"_id": {"$in": list(hashes)}}))
+    except (MongoUnavailableError, PyMongoError):
+        return {}
+
+    found: dict[str, dict[str, Any]] = {}
+    for doc in docs:
+        msgId = doc.get("_id")
+        if not msgId or doc.get("contentHash") != hashes.get(msgId):
+            continue
+        found[msgId] = {
+            "classification": {field: doc.get(field) for field in _CLASSIFICATION_FIELDS},
+            "llmChecked": bool(doc.get("llmChecked")),
+        }
+    return found
+
+
+def saveClassifications(entries: list[tuple[str, str, dict, bool]]) -> None:
+    """entries: (messageId, contentHash, classification, llmChecked). Replaces older entries."""
+    if not entries:
+        return
+    from pymongo import UpdateOne
+
+    now = datetime.now(timezone.utc)
+    ops = []
+    for msgId, contentHash, classification, llmChecked in entries:
+        doc = {field: classification.get(field) for field in _CLASSIFICATION_FIELDS}
+        doc.update({"contentHash": contentHash, "llmChecked": llmChecked, "classifiedAt": now})
+        ops.append(UpdateOne({"_id": msgId}, {"$set": doc}, upsert=True))
+    try:
+        _collection().bulk_write(ops, ordered=False)
+    except (MongoUnavailableError, PyMongoError):
+        return
@@ -4,6 +4,7 @@ from datetime import datetime, timezone
 from email.utils import parseaddr, parsedate_to_datetime
 
 from utils.gmailAuth import getGmailService
+from utils.gmailBatch import getMessagesBatched, httpErrorStatus
 
 UNREAD_PRIMARY_QUERY = "is:unread in:inbox category:primary"
 HEADER_NAMES = ("From", "Subject", "Date", "To")
@@ -69,20 +70,24 @@ def fetchUnreadPrimaryEmails(*, maxResults: int = 1000) -> dict:
     """List unread Primary inbox messages (metadata only — no LLM)."""
     gmail = getGmailService()
     messageIds = _listUnreadMessageIds(gmail, maxResults=max(1, min(maxResults, 1000)))
-    emails: list[dict] = []
+    messages, failures = getMessagesBatched(
+        gmail,
+        messageIds,
+        format="metadata",
+        metadataHeaders=list(HEADER_NAMES),
+    )
+    # Deleted / moved since the list call: nothing to show. Anything else is reported.
+    errors = {
+        msgId: exc for msgId, exc in failures.items() if httpErrorStatus(exc) != 404
+    }
+    if errors and not messages:
+        raise next(iter(errors.values()))
 
+    emails: list[dict] = []
     for msgId in messageIds:
-        message = (
-            gmail.users()
-            .messages()
-            .get(
-                userId="me",
-                id=msgId,
-                format="metadata",
-                metadataHeaders=list(HEADER_NAMES),
-            )
-            .execute()
-        )
+        message = messages.get(msgId)
+        if message is None:
+            continue
         headers = _headerMap(message.get("payload") or {})
         fromName, fromEmail = _parseFrom(headers.get("from", ""))
         emails.append(
@@ -104,4 +109,5 @@ def fetchUnreadPrimaryEmails(*, maxResults: int = 1000) -> dict:
         "fetchedAt": datetime.now(timezone.utc).isoformat(),
         "count": len(emails),
         "emails": emails,
+        "errors": [{"id": msgId, "error": str(exc)} for msgId, exc in errors.items()],
     }
@@ -5,7 +5,10 @@ import re
 from datetime import datetime, timezone
 from email.utils import getaddresses
 
+from googleapiclient.errors import HttpError
+
 from utils.gmailAuth import getGmailService
+from utils.gmailBatch import getMessagesBatched, httpErrorStatus
 from utils.gmailConfig import DEFAULT_SENT_SINCE
 from utils.placetrackStore import loadSentRecipientsCache, saveSentRecipientsCache
 
@@ -45,15 +48,14 @@ def _saveCache(payload: dict) -> None:
     saveSentRecipientsCache(payload)
 
 
-def fetchSentRecipientEmails(since: str = DEFAULT_SENT_SINCE, *, refresh: bool = False) -> dict:
-    if not refresh:
-        cached = _loadCache()
-        if cached and cached.get("since") == since:
-            return cached
+def _publicResult(cache: dict, mode: str) -> dict:
+    """API shape: the cache without its per-message processed markers."""
+    result = {key: value for key, value in cache.items() if key != "messageIds"}
+    result["mode"] = mode
+    return result
 
-    gmail = getGmailService()
-    query = _sinceToGmailQuery(since)
-    recipients: set[str] = set()
+
+def _listSentMessageIds(gmail, query: str) -> list[str]:
     messageIds: list[str] = []
     pageToken: str | None = None
 
@@ -71,29 +73,132 @@ def fetchSentRecipientEmails(since: str = DEFAULT_SENT_SINCE, *, refresh: bool =
         pageToken = response.get("nextPageToken")
         if not pageToken:
             break
+    return messageIds
 
-    for msgId in messageIds:
-        message = (
-            gmail.users()
-            .messages()
-            .get(
-                userId="me",
-                id=msgId,
-                format="metadata",
-                metadataHeaders=list(HEADER_NAMES),
+
+def _listSentSinceHistory(gmail, startHistoryId: str) -> tuple[list[str], str] | None:
+    """
+    Ids of messages that entered SENT after startHistoryId (new sends, and drafts that got
+    the SENT label), plus the newest historyId. None when Gmail no longer keeps history
+    that far back (404) and a full scan is needed.
+    """
+    messageIds: list[str] = []
+    latest = startHistoryId
+    pageToken: str | None = None
+
+    while True:
+        try:
+            response = (
+                gmail.users()
+                .history()
+                .list(
+                    userId="me",
+                    startHistoryId=startHistoryId,
+                    labelId="SENT",
+                    historyTypes=["messageAdded", "labelAdded"],
+                    maxResults=500,
+                    pageToken=pageToken,
+                )
+                .execute()
             )
-            .execute()
-        )
+        except HttpError as exc:
+            if httpErrorStatus(exc) == 404:
+                return None
+            raise
+        for record in response.get("history") or []:
+            for added in record.get("messagesAdded") or []:
+                message = added.get("message") or {}
+                if message.get("id") and "SENT" in (message.get("labelIds") or []):
+                    messageIds.append(message["id"])
+            for added in record.get("labelsAdded") or []:
+                message = added.get("message") or {}
+                if message.get("id") and "SENT" in (added.get("labelIds") or []):
+                    messageIds.append(message["id"])
+        latest = str(response.get("historyId") or latest)
+        pageToken = response.get("nextPageToken")
+        if not pageToken:
+            break
+    return list(dict.fromkeys(messageIds)), latest
+
+
+def _recipientsOfMessages(gmail, messageIds: list[str]) -> set[str]:
+    recipients: set[str] = set()
+    messages, failures = getMessagesBatched(
+        gmail,
+        messageIds,
+        format="metadata",
+        metadataHeaders=list(HEADER_NAMES),
+    )
+    # The cached set must stay complete: only messages deleted since they were listed
+    # (404) may be missing from it.
+    for exc in failures.values():
+        if httpErrorStatus(exc) != 404:
+            raise exc
+    for message in messages.values():
         headers = _headerMap(message.get("payload") or {})
         for name in HEADER_NAMES:
             recipients.update(_extractEmailsFromHeader(headers.get(name.lower(), "")))
+    return recipients
 
-    result = {
+
+def _fullScan(gmail, since: str) -> dict:
+    # Taken before listing, so mail sent during the scan is picked up by the next
+    # incremental refresh (the processed markers drop anything already counted).
+    historyId = gmail.users().getProfile(userId="me").execute().get("historyId")
+    messageIds = _listSentMessageIds(gmail, _sinceToGmailQuery(since))
+    recipients = _recipientsOfMessages(gmail, messageIds)
+    return {
         "since": since,
         "fetchedAt": datetime.now(timezone.utc).isoformat(),
+        "historyId": str(historyId) if historyId else None,
+        "messageIds": messageIds,
         "messageCount": len(messageIds),
         "recipientCount": len(recipients),
         "recipients": sorted(recipients),
     }
+
+
+def _incrementalRefresh(gmail, cached: dict) -> dict | None:
+    listed = _listSentSinceHistory(gmail, str(cached["historyId"]))
+    if listed is None:
+        return None
+    newIds, historyId = listed
+    processed = set(cached.get("messageIds") or [])
+    fresh = [msgId for msgId in newIds if msgId not in processed]
+    recipients = set(cached.get("recipients") or [])
+    recipients.update(_recipientsOfMessages(gmail, fresh))
+    messageIds = list(cached.get("messageIds") or []) + fresh
+    return {
+        "since": cached.get("since"),
+        "fetchedAt": datetime.now(timezone.utc).isoformat(),
+        "historyId": historyId,
+        "messageIds": messageIds,
+        "messageCount": len(messageIds),
+        "recipientCount": len(recipients),
+        "recipients": sorted(recipients),
+    }
+
+
+def fetchSentRecipientEmails(since: str = DEFAULT_SENT_SINCE, *, refresh: bool = False) -> dict:
+    """
+    Recipient addresses of mail sent since `since`. Served from the cache unless refresh;
+    a refresh reads only mail sent after the cached historyId (users.history.list) and
+    merges it in, falling back to a full scan for a new `since`, a cache written before
+    history tracking, or a historyId Gmail has expired.
+    """
+    cached = _loadCache()
+    if cached and cached.get("since") != since:
+        cached = None
+    if cached and not refresh:
+        return _publicResult(cached, "cached")
+
+    gmail = getGmailService()
+    result = None
+    mode = "incremental"
+    if cached and cached.get("historyId") and cached.get("messageIds") is not None:
+        result = _incrementalRefresh(gmail, cached)
+    if result is None:
+        result = _fullScan(gmail, since)
+        mode = "full"
     _saveCache(result)
-    return result
+    return _publicResult(result, mode)
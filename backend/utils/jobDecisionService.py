@@ -9,9 +9,12 @@ Centralizes:
 
 from __future__ import annotations
 
+import hashlib
 import json
 import re
+import threading
 import traceback
+from collections import OrderedDict
 from typing import Any, Final, Literal
 
 from utils.dataManager import (
@@ -22,7 +25,7 @@ from utils.dataManager import (
     revertApplyingToApply,
     updateApplyStatusByJobId,
 )
-from utils.midhtechSuggestApi import authenticateMidhtechSessionWithCredentials, submitJobSuggestion
+from utils.midhtechSessionPool import acquireMidhtechSession, submitJobSuggestionPooled
 
 # --- Restriction regex scanners (title + visa note + responsibility + description) ---
 
@@ -91,6 +94,77 @@ _EXPERIENCE_SCANNERS: tuple[re.Pattern[str], ...] = tuple(
 
 _DIGIT_RUN: Final[re.Pattern[str]] = re.compile(r"\d+")
 
+# Runs of whitespace longer than any bounded span in the patterns ({0,78}) are clamped before
+# scanning: `\s*\+?\s*` style sequences backtrack quadratically over a long run (a 50k-space
+# gap after "5+" took ~30s per pattern), and no match can depend on the run being longer.
+_LONG_WHITESPACE_RUN: Final[re.Pattern[str]] = re.compile(r"\s{80,}")
+
+
+def _clampWhitespaceRuns(text: str) -> str:
+    return _LONG_WHITESPACE_RUN.sub(lambda m: m.group(0)[:79], text)
+
+
+EXPERIENCE_ABOVE_FIVE_LABEL: Final[str] = "Requires 6+ years experience (detected)"
+
+# --- Scan prefilter: literal anchors every match must contain (checked on casefolded text) ---
+# A scanner whose anchors are all absent cannot match, so its regex is skipped. Most
+# descriptions mention none of the restriction words, so the usual cost is a few C-speed
+# substring searches instead of 11 case-insensitive regex passes.
+
+_RESTRICTION_ANCHORS: Final[dict[str, tuple[str, ...]]] = {
+    "US citizen": ("citizen",),
+    "Citizenship": ("citizenship",),
+    "Permanent resident / green card": ("permanent", "green"),
+    "I-9 / E-Verify": ("i-9", "verify"),
+    "Top secret / TS": ("secret", "t/s", "ts/sci"),
+    "Secret clearance": ("clearance",),
+    "Public trust": ("public",),
+    "Clearance": ("clearance",),
+    "Not sponsoring": ("sponsor",),
+    "No visa sponsorship": ("sponsor",),
+    "Authorization restriction": ("authorized",),
+}
+
+
+def _experienceAnchors(source: str) -> tuple[str, ...]:
+    if "yoe" in source:
+        return ("yoe", "y.")
+    if "months?" in source:
+        return ("month",)
+    return ("yr", "year")
+
+
+# Every experience pattern also needs a digit (checked once per text).
+# Non-ASCII letters that re.IGNORECASE treats as ASCII letters but casefold() does not fold to them.
+_ANCHOR_FOLD_EXTRA: Final[dict[int, str]] = str.maketrans(
+    {"\u0130": "i", "\u0131": "i", "\u017f": "s", "\u212a": "k"}
+)
+
+
+def _foldForAnchors(text: str) -> str:
+    if text.isascii():
+        return text.lower()
+    return text.translate(_ANCHOR_FOLD_EXTRA).casefold()
+
+
+_EXPERIENCE_SCANNER_ANCHORS: tuple[tuple[re.Pattern[str], tuple[str, ...]], ...] = tuple(
+    (pattern, _experienceAnchors(src))
+    for pattern, src in zip(_EXPERIENCE_SCANNERS, _EXPERIENCE_SCANNER_SOURCES)
+)
+
+# Changes whenever a pattern or label changes, so persisted scan hashes go stale on their own.
+RESTRICTION_SCAN_VERSION: Final[str] = hashlib.sha1(
+    "\0".join(
+        [p.pattern for p, _ in RESTRICTION_SCANNERS]
+        + [label for _, label in RESTRICTION_SCANNERS]
+        + list(_EXPERIENCE_SCANNER_SOURCES)
+    ).encode("utf-8")
+).hexdigest()[:8]
+
+_SCAN_CACHE_MAX = 4096
+_scanCache: "OrderedDict[str, tuple[str, ...]]" = OrderedDict()
+_scanCacheLock = threading.Lock()
+
 
 def composeRestrictionStyleText(job: object) -> str:
     """Concatenate fields scanned for restrictions and experience (ingest + API pre-check)."""
@@ -111,7 +185,7 @@ def _normalizeExperienceSnippet(s: str) -> str:
 
 def findJobDescriptionExperienceTags(body: str | None) -> list[str]:
     """Distinct matched snippets in document order (mirrors frontend findJobDescriptionExperienceTags)."""
-    text = (body or "").strip()
+    text = _clampWhitespaceRuns((body or "").strip())
     if not text:
         return []
     byKey: dict[str, tuple[int, str]] = {}
@@ -144,10 +218,21 @@ def experienceTagImpliesAboveFiveYears(tag: str) -> bool:
 
 
 def scanTextImpliesExperienceAboveFive(text: str | None) -> bool:
-    """True if any experience-style tag implies six or more years (auto-reject threshold)."""
-    for tag in findJobDescriptionExperienceTags(text):
-        if experienceTagImpliesAboveFiveYears(tag):
-            return True
+    """
+    True if any experience-style tag implies six or more years (auto-reject threshold).
+    Same answer as checking every findJobDescriptionExperienceTags() tag, but skips patterns
+    whose anchors are absent and stops at the first 6+ match.
+    """
+    body = _clampWhitespaceRuns((text or "").strip())
+    if not body or _DIGIT_RUN.search(body) is None:
+        return False
+    folded = _foldForAnchors(body)
+    for pattern, anchors in _EXPERIENCE_SCANNER_ANCHORS:
+        if not any(a in folded for a in anchors):
+            continue
+        for m in pattern.finditer(body):
+            if experienceTagImpliesAboveFiveYears(_normalizeExperienceSnippet(m.group(0))):
+                return True
     return False
 
 
@@ -155,19 +240,15 @@ def jobImpliesExperienceAboveFive(job: object) -> bool:
     return scanTextImpliesExperienceAboveFive(composeRestrictionStyleText(job))
 
 
-def findRestrictionTagsForJob(job: object) -> list[str]:
-    """
-    Human-readable labels for RESTRICTION_SCANNERS matches plus 6+ years experience when detected.
-    Empty list means no local blockers for ingest / accept pre-check.
-    """
-    if not isinstance(job, dict):
-        return []
-    text = composeRestrictionStyleText(job)
+def scanRestrictionText(text: str) -> list[str]:
+    """Uncached scan of already-composed text; see findRestrictionTagsForJob."""
     if not text:
         return []
+    text = _clampWhitespaceRuns(text)
+    folded = _foldForAnchors(text)
     labels: set[str] = set()
     for regex, label in RESTRICTION_SCANNERS:
-        if regex.search(text):
+        if any(a in folded for a in _RESTRICTION_ANCHORS[label]) and regex.search(text):
             labels.add(label)
     if labels and "Clearance" in labels and (
         "Secret clearance" in labels
@@ -176,10 +257,69 @@ def findRestrictionTagsForJob(job: object) -> list[str]:
     ):
         labels.discard("Clearance")
     if scanTextImpliesExperienceAboveFive(text):
-        labels.add("Requires 6+ years experience (detected)")
+        labels.add(EXPERIENCE_ABOVE_FIVE_LABEL)
     return sorted(labels)
 
 
+def restrictionScanHash(text: str) -> str:
+    """Content hash of composed scan text, salted with RESTRICTION_SCAN_VERSION."""
+    digest = hashlib.blake2b(digest_size=12)
+    digest.update(RESTRICTION_SCAN_VERSION.encode("ascii"))
+    digest.update(text.encode("utf-8", "surrogatepass"))
+    return digest.hexdigest()
+
+
+def _scanRestrictionTextCached(text: str, textHash: str) -> list[str]:
+    with _scanCacheLock:
+        cached = _scanCache.get(textHash)
+        if cached is not None:
+            _scanCache.move_to_end(textHash)
+            return list(cached)
+    labels = scanRestrictionText(text)
+    with _scanCacheLock:
+        _scanCache[textHash] = tuple(labels)
+        while len(_scanCache) > _SCAN_CACHE_MAX:
+            _scanCache.popitem(last=False)
+    return labels
+
+
+def restrictionScanFields(job: object) -> dict[str, Any]:
+    """
+    Persistable scan result for a job row: restrictionTags + restrictionScanHash (+ the
+    requiresExperienceAboveFive flag). upsertJobs stores these so validation / suggest /
+    accept pre-checks on unchanged text are a hash comparison instead of a rescan.
+    """
+    text = composeRestrictionStyleText(job)
+    textHash = restrictionScanHash(text)
+    tags = _scanRestrictionTextCached(text, textHash) if text else []
+    return {
+        "restrictionTags": tags,
+        "restrictionScanHash": textHash,
+        "requiresExperienceAboveFive": EXPERIENCE_ABOVE_FIVE_LABEL in tags,
+    }
+
+
+def findRestrictionTagsForJob(job: object) -> list[str]:
+    """
+    Human-readable labels for RESTRICTION_SCANNERS matches plus 6+ years experience when detected.
+    Empty list means no local blockers for ingest / accept pre-check.
+
+    Reuses `restrictionTags` persisted on the row when its `restrictionScanHash` still matches
+    the composed text (and scanner version), then a bounded in-process cache keyed by the same
+    hash; only new text is scanned.
+    """
+    if not isinstance(job, dict):
+        return []
+    text = composeRestrictionStyleText(job)
+    if not text:
+        return []
+    textHash = restrictionScanHash(text)
+    stored = job.get("restrictionTags")
+    if job.get("restrictionScanHash") == textHash and isinstance(stored, list):
+        return [str(tag) for tag in stored]
+    return _scanRestrictionTextCached(text, textHash)
+
+
 # --- UI accept / reject + Midhtech submit ---
 
 Decision = Literal["accept", "reject"]
@@ -427,12 +567,13 @@ def executeJobUiDecision(
     print("[accept] Phase 1: Midhtech login with Settings credentials", flush=True)
     steps.append(buildStep("login", False, "Connecting to Midhtech…"))
     try:
-        session, _, suggest_url, _, csrf_token = authenticateMidhtechSessionWithCredentials(
-            profileEmail,
-            profilePassword,
-        )
-        steps[-1] = buildStep("login", True, "Login successful; loaded suggest page and CSRF token")
-        print("[accept] Phase 1 SUCCESS: session authenticated", flush=True)
+        pooled = acquireMidhtechSession(profileEmail, profilePassword)
+        if pooled[1]:
+            steps[-1] = buildStep("login", True, "Reused pooled Midhtech session and CSRF token")
+            print("[accept] Phase 1 SUCCESS: pooled session reused", flush=True)
+        else:
+            steps[-1] = buildStep("login", True, "Login successful; loaded suggest page and CSRF token")
+            print("[accept] Phase 1 SUCCESS: session authenticated", flush=True)
     except Exception as exc:
         msg = str(exc).strip() or exc.__class__.__name__
         traceback.print_exc()
@@ -453,8 +594,8 @@ def executeJobUiDecision(
     print("[accept] Phase 2: submitJobSuggestion (full payload from viewer)", flush=True)
     steps.append(buildStep("submit", False, "Posting job to /jobs/suggest/…"))
     try:
-        submit_ok, detail, auto_apply_status = submitJobSuggestion(
-            session, suggest_url, csrf_token, job
+        submit_ok, detail, auto_apply_status = submitJobSuggestionPooled(
+            profileEmail, profilePassword, job, pooled=pooled
         )
         if not submit_ok:
             steps[-1] = buildStep("submit", False, detail)
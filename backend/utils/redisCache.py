@@ -3,16 +3,27 @@ from __future__ import annotations
 import hashlib
 import json
 import os
-from typing import Any
+import asyncio
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable
+
+from utils.env import envInt
 
 try:
     import redis
+    import redis.asyncio as redisAsync
 except Exception:  # pragma: no cover
     redis = None  # type: ignore[assignment]
+    redisAsync = None  # type: ignore[assignment]
 
 
 _redisClient: Any | None = None
+_asyncRedisClient: Any | None = None
 _redisUnavailable = False
+_processId = uuid.uuid4().hex
 
 
 def _envBool(name: str, default: bool) -> bool:
@@ -45,6 +56,10 @@ def _fullKey(suffix: str) -> str:
     return f"{_versionPrefix()}:{suffix}"
 
 
+def _redisUrl() -> str:
+    return str(os.getenv("REDIS_URL") or "redis://127.0.0.1:9262/0").strip()
+
+
 def getRedisClient():
     global _redisClient, _redisUnavailable
     if _redisUnavailable:
@@ -57,16 +72,7 @@ def getRedisClient():
         _redisUnavailable = True
         return None
     try:
-        redisUrl = str(os.getenv("REDIS_URL") or "redis://127.0.0.1:9262/0").strip()
-        socketTimeoutMs = int(str(os.getenv("REDIS_SOCKET_TIMEOUT_MS") or "500").strip())
-        socketConnectTimeoutMs = int(str(os.getenv("REDIS_CONNECT_TIMEOUT_MS") or "500").strip())
-        client = redis.Redis.from_url(
-            redisUrl,
-            decode_responses=True,
-            socket_timeout=max(0.1, socketTimeoutMs / 1000.0),
-            socket_connect_timeout=max(0.1, socketConnectTimeoutMs / 1000.0),
-            health_check_interval=30,
-        )
+        client = redis.Redis.from_url(_redisUrl(), **_redisClientOptions())
         client.ping()
         _redisClient = client
         return _redisClient
@@ -75,6 +81,42 @@ def getRedisClient():
         return None
 
 
+def _redisClientOptions() -> dict[str, Any]:
+    socketTimeoutMs = envInt("REDIS_SOCKET_TIMEOUT_MS", 500, 100)
+    socketConnectTimeoutMs = envInt("REDIS_CONNECT_TIMEOUT_MS", 500, 100)
+    return {
+        "decode_responses": True,
+        "socket_timeout": socketTimeoutMs / 1000.0,
+        "socket_connect_timeout": socketConnectTimeoutMs / 1000.0,
+        "health_check_interval": 30,
+    }
+
+
+def getAsyncRedisClient():
+    """redis.asyncio client for async routes; only handed out once the sync client has pinged OK."""
+    global _asyncRedisClient
+    if _asyncRedisClient is not None:
+        return _asyncRedisClient
+    if redisAsync is None or getRedisClient() is None:
+        return None
+    try:
+        _asyncRedisClient = redisAsync.Redis.from_url(_redisUrl(), **_redisClientOptions())
+    except Exception:
+        return None
+    return _asyncRedisClient
+
+
+async def closeAsyncRedisClient() -> None:
+    global _asyncRedisClient
+    client = _asyncRedisClient
+    _asyncRedisClient = None
+    if client is not None:
+        try:
+            await client.aclose()
+        except Exception:
+            return
+
+
 def _stableHash(value: dict[str, Any]) -> str:
     payload = json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
     return hashlib.sha256(payload.encode("utf-8")).hexdigest()
@@ -104,6 +146,7 @@ def incrementIntValue(keySuffix: str) -> int:
 
 
 def deleteCacheKey(keySuffix: str) -> None:
+    _l1.evict(keySuffix)
     client = getRedisClient()
     if client is None:
         return
@@ -111,6 +154,7 @@ def deleteCacheKey(keySuffix: str) -> None:
         client.delete(_fullKey(keySuffix))
     except Exception:
         return
+    _publishInvalidation(client, keySuffix)
 
 
 def getCachedJson(keySuffix: str) -> Any | None:
@@ -140,17 +184,595 @@ def setCachedJson(keySuffix: str, value: Any, ttlSeconds: int | None = None) ->
         return
 
 
+# --- L1: bounded in-process LRU/TTL tier in front of Redis ---
+#
+# Only fresh values are admitted, and each entry lives at most CACHE_L1_TTL_SECONDS (never past
+# the Redis soft TTL), so a worker that misses an invalidation message is stale for seconds at
+# worst. deleteCacheKey()/bumpJobsListVersion() evict locally and publish on the invalidation
+# channel; startCacheInvalidationListener() (API lifespan) applies other workers' messages.
+# Cached objects are shared between requests: treat returned values as read-only.
+
+_L1_VERSION_PREFIX = "__version__:"
+
+
+class _L1Cache:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[float, Any, Any]] = OrderedDict()
+
+    def get(self, key: str) -> tuple[Any, Any] | None:
+        """Return (value, version) or None; expired entries are dropped on access."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expiresAt, value, version = entry
+            if expiresAt <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value, version
+
+    def put(self, key: str, value: Any, *, ttlSeconds: float, version: Any = None) -> None:
+        maxEntries = _l1MaxEntries()
+        if ttlSeconds <= 0 or maxEntries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttlSeconds, value, version)
+            self._entries.move_to_end(key)
+            while len(self._entries) > maxEntries:
+                self._entries.popitem(last=False)
+
+    def evict(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def size(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+_l1 = _L1Cache()
+_listenerLock = threading.Lock()
+_listenerThread: threading.Thread | None = None
+_listenerStop = threading.Event()
+
+
+def isL1CacheEnabled() -> bool:
+    return _envBool("CACHE_L1_ENABLED", True)
+
+
+def _l1TtlSeconds() -> int:
+    return envInt("CACHE_L1_TTL_SECONDS", 5, 0)
+
+
+def _l1MaxEntries() -> int:
+    return envInt("CACHE_L1_MAX_ENTRIES", 512, 0)
+
+
+def _invalidationChannel() -> str:
+    return f"{_versionPrefix()}:invalidate"
+
+
+def _publishInvalidation(client: Any, keySuffix: str | None) -> None:
+    """Tell other workers to drop ``keySuffix`` from L1 (``None`` clears everything)."""
+    try:
+        message = json.dumps({"origin": _processId, "key": keySuffix}, separators=(",", ":"))
+        client.publish(_invalidationChannel(), message)
+    except Exception:
+        return
+
+
+def _applyInvalidation(raw: Any) -> None:
+    try:
+        message = json.loads(raw)
+    except Exception:
+        return
+    if not isinstance(message, dict) or message.get("origin") == _processId:
+        return
+    keySuffix = message.get("key")
+    if keySuffix is None:
+        _l1.clear()
+    else:
+        _l1.evict(str(keySuffix))
+
+
+def _runInvalidationListener() -> None:
+    backoffSeconds = 1.0
+    while not _listenerStop.is_set():
+        pubsub = None
+        try:
+            # Dedicated connection: the shared client's short socket timeout would break blocking reads.
+            subscriber = redis.Redis.from_url(
+                _redisUrl(),
+                decode_responses=True,
+                socket_connect_timeout=1.0,
+                health_check_interval=30,
+            )
+            pubsub = subscriber.pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(_invalidationChannel())
+            # Messages may have been missed while disconnected.
+            _l1.clear()
+            backoffSeconds = 1.0
+            while not _listenerStop.is_set():
+                message = pubsub.get_message(timeout=1.0)
+                if message and message.get("type") == "message":
+                    _applyInvalidation(message.get("data"))
+        except Exception:
+            _l1.clear()
+            _listenerStop.wait(backoffSeconds)
+            backoffSeconds = min(30.0, backoffSeconds * 2)
+        finally:
+            if pubsub is not None:
+                try:
+                    pubsub.close()
+                except Exception:
+                    pass
+
+
+def startCacheInvalidationListener() -> bool:
+    """Start the per-process pub/sub thread that keeps L1 coherent across workers (idempotent)."""
+    global _listenerThread
+    if not isL1CacheEnabled() or getRedisClient() is None:
+        return False
+    with _listenerLock:
+        if _listenerThread is not None and _listenerThread.is_alive():
+            return True
+        _listenerStop.clear()
+        _listenerThread = threading.Thread(
+            target=_runInvalidationListener, name="redisCacheInvalidation", daemon=True
+        )
+        _listenerThread.start()
+    return True
+
+
+def stopCacheInvalidationListener() -> None:
+    global _listenerThread
+    _listenerStop.set()
+    with _listenerLock:
+        thread = _listenerThread
+        _listenerThread = None
+    if thread is not None:
+        thread.join(timeout=2.0)
+
+
+def clearL1Cache() -> None:
+    _l1.clear()
+
+
+def _l1Get(keySuffix: str) -> tuple[Any, Any] | None:
+    if not isL1CacheEnabled():
+        return None
+    return _l1.get(keySuffix)
+
+
+def _l1Put(keySuffix: str, value: Any, *, softAt: float, version: Any = None) -> None:
+    if not isL1CacheEnabled():
+        return
+    ttl = min(float(_l1TtlSeconds()), softAt - time.time())
+    _l1.put(keySuffix, value, ttlSeconds=ttl, version=version)
+
+
+# --- Read-through layer: soft/hard TTL (stale-while-revalidate) + per-key single-flight ---
+#
+# Entries are stored as {"v": value, "softAt": epochSeconds, "ver": version}. Redis expiry is the
+# hard TTL (soft TTL + REDIS_STALE_TTL_SECONDS). Past softAt (or on a version mismatch) the entry
+# is stale: the worker that wins the SET NX lock recomputes, everyone else is served the stale
+# value instead of piling onto Mongo. A cold miss with the lock held waits briefly for the
+# winner's result before falling back to computing itself.
+
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+_STAT_FIELDS = ("l1Hits", "hits", "misses", "stale", "recomputes", "lockWaits", "errors")
+
+_cacheStatsLock = threading.Lock()
+_cacheStats: dict[str, dict[str, float]] = {}
+
+
+def _staleTtlSeconds() -> int:
+    return envInt("REDIS_STALE_TTL_SECONDS", 60, 0)
+
+
+def _lockTtlMs() -> int:
+    return envInt("REDIS_LOCK_TTL_MS", 10000, 100)
+
+
+def _lockWaitMs() -> int:
+    return envInt("REDIS_LOCK_WAIT_MS", 1500, 0)
+
+
+def keyFamily(keySuffix: str) -> str:
+    """Metrics bucket for a cache key: its first two segments (``jobs:list``, ``jobs:detail``, …)."""
+    return ":".join(str(keySuffix or "").split(":")[:2])
+
+
+def _recordCacheStat(family: str, field: str, amount: float = 1) -> None:
+    with _cacheStatsLock:
+        bucket = _cacheStats.get(family)
+        if bucket is None:
+            bucket = {name: 0 for name in _STAT_FIELDS}
+            bucket.update({"recomputeMsTotal": 0.0, "recomputeMsMax": 0.0})
+            _cacheStats[family] = bucket
+        if field == "recomputeMs":
+            bucket["recomputes"] += 1
+            bucket["recomputeMsTotal"] += amount
+            bucket["recomputeMsMax"] = max(bucket["recomputeMsMax"], amount)
+            return
+        bucket[field] += amount
+
+
+def cacheStats() -> dict[str, Any]:
+    """Per-key-family counters for this process (hit/miss/stale/recompute time)."""
+    with _cacheStatsLock:
+        families: dict[str, Any] = {}
+        for family, bucket in sorted(_cacheStats.items()):
+            row = {name: int(bucket[name]) for name in _STAT_FIELDS}
+            served = row["l1Hits"] + row["hits"] + row["stale"]
+            lookups = served + row["misses"]
+            row["hitRatio"] = round(served / lookups, 4) if lookups else 0.0
+            row["recomputeMsAvg"] = (
+                round(bucket["recomputeMsTotal"] / row["recomputes"], 2) if row["recomputes"] else 0.0
+            )
+            row["recomputeMsMax"] = round(bucket["recomputeMsMax"], 2)
+            families[family] = row
+    return {
+        "redisEnabled": getRedisClient() is not None,
+        "l1": {
+            "enabled": isL1CacheEnabled(),
+            "entries": _l1.size(),
+            "maxEntries": _l1MaxEntries(),
+            "ttlSeconds": _l1TtlSeconds(),
+            "listenerAlive": bool(_listenerThread is not None and _listenerThread.is_alive()),
+        },
+        "families": families,
+    }
+
+
+def resetCacheStats() -> None:
+    with _cacheStatsLock:
+        _cacheStats.clear()
+
+
+def _decodeEnvelope(raw: Any) -> dict[str, Any] | None:
+    if raw is None:
+        return None
+    try:
+        envelope = json.loads(raw)
+    except Exception:
+        return None
+    if not isinstance(envelope, dict) or "v" not in envelope or "softAt" not in envelope:
+        return None
+    return envelope
+
+
+def _readEnvelope(client: Any, fullKey: str) -> dict[str, Any] | None:
+    try:
+        return _decodeEnvelope(client.get(fullKey))
+    except Exception:
+        return None
+
+
+def _isFresh(envelope: dict[str, Any], version: int | None) -> bool:
+    if version is not None and envelope.get("ver") != version:
+        return False
+    try:
+        return float(envelope["softAt"]) > time.time()
+    except Exception:
+        return False
+
+
+def _encodeEnvelope(value: Any, ttl: int, version: int | None) -> tuple[str, float]:
+    softAt = time.time() + ttl
+    envelope = {"v": value, "softAt": softAt, "ver": version}
+    return json.dumps(envelope, separators=(",", ":"), default=str), softAt
+
+
+def _writeEnvelope(client: Any, fullKey: str, value: Any, ttl: int, version: int | None) -> float:
+    payload, softAt = _encodeEnvelope(value, ttl, version)
+    try:
+        client.setex(fullKey, int(ttl + _staleTtlSeconds()), payload)
+    except Exception:
+        pass
+    return softAt
+
+
+def _acquireLock(client: Any, lockKey: str) -> str | None:
+    token = uuid.uuid4().hex
+    try:
+        if client.set(lockKey, token, nx=True, px=_lockTtlMs()):
+            return token
+    except Exception:
+        # Redis hiccup: behave as if we own the lock so the request still gets an answer.
+        return ""
+    return None
+
+
+def _releaseLock(client: Any, lockKey: str, token: str) -> None:
+    if not token:
+        return
+    try:
+        client.eval(_RELEASE_LOCK_SCRIPT, 1, lockKey, token)
+        return
+    except Exception:
+        pass
+    try:
+        # Scripting unavailable: non-atomic compare-and-delete; the lock TTL bounds the race.
+        if client.get(lockKey) == token:
+            client.delete(lockKey)
+    except Exception:
+        return
+
+
+def _timedCompute(family: str, compute: Callable[[], Any]) -> Any:
+    start = time.perf_counter()
+    try:
+        return compute()
+    except Exception:
+        _recordCacheStat(family, "errors")
+        raise
+    finally:
+        _recordCacheStat(family, "recomputeMs", (time.perf_counter() - start) * 1000.0)
+
+
+def getOrComputeCachedJson(
+    keySuffix: str,
+    compute: Callable[[], Any],
+    *,
+    ttlSeconds: int | None = None,
+    version: int | None = None,
+    allowStale: bool = True,
+) -> Any:
+    """
+    Read-through cache with stale-while-revalidate and single-flight recompute.
+
+    ``ttlSeconds`` is the soft TTL; entries stay servable as stale for REDIS_STALE_TTL_SECONDS
+    more. ``version`` (e.g. ``jobsListVersion()``) marks an entry stale once the version moves
+    on, so a bump does not turn every list key into a cold miss at the same instant.
+    A ``None`` result from ``compute`` is returned but never cached (e.g. job not found).
+    ``allowStale=False`` (auth principals) never serves a stale entry; it waits like a cold miss.
+    Fresh values are also kept in the in-process L1 tier and served from there first.
+    """
+    family = keyFamily(keySuffix)
+    client = getRedisClient()
+    if client is None:
+        return _timedCompute(family, compute)
+
+    local = _l1Get(keySuffix)
+    if local is not None and (version is None or local[1] == version):
+        _recordCacheStat(family, "l1Hits")
+        return local[0]
+
+    ttl = ttlSeconds if ttlSeconds is not None else _defaultTtlSeconds()
+    fullKey = _fullKey(keySuffix)
+    envelope = _readEnvelope(client, fullKey)
+    if envelope is not None and _isFresh(envelope, version):
+        _recordCacheStat(family, "hits")
+        _l1Put(keySuffix, envelope["v"], softAt=float(envelope["softAt"]), version=version)
+        return envelope["v"]
+
+    lockKey = f"{fullKey}:lock"
+    token = _acquireLock(client, lockKey)
+    if token is None:
+        if envelope is not None and allowStale:
+            _recordCacheStat(family, "stale")
+            return envelope["v"]
+        # Cold miss while another worker recomputes: wait for its result rather than stampede.
+        _recordCacheStat(family, "lockWaits")
+        deadline = time.monotonic() + _lockWaitMs() / 1000.0
+        while time.monotonic() < deadline:
+            time.sleep(0.025)
+            waited = _readEnvelope(client, fullKey)
+            if waited is not None and _isFresh(waited, version):
+                _recordCacheStat(family, "hits")
+                _l1Put(keySuffix, waited["v"], softAt=float(waited["softAt"]), version=version)
+                return waited["v"]
+        token = _acquireLock(client, lockKey) or ""
+
+    _recordCacheStat(family, "misses")
+    try:
+        value = _timedCompute(family, compute)
+        if value is not None and ttl > 0:
+            softAt = _writeEnvelope(client, fullKey, value, ttl, version)
+            _l1Put(keySuffix, value, softAt=softAt, version=version)
+        return value
+    finally:
+        _releaseLock(client, lockKey, token)
+
+
+async def _timedComputeAsync(family: str, compute: Callable[[], Awaitable[Any]]) -> Any:
+    start = time.perf_counter()
+    try:
+        return await compute()
+    except Exception:
+        _recordCacheStat(family, "errors")
+        raise
+    finally:
+        _recordCacheStat(family, "recomputeMs", (time.perf_counter() - start) * 1000.0)
+
+
+async def _acquireLockAsync(client: Any, lockKey: str) -> str | None:
+    token = uuid.uuid4().hex
+    try:
+        if await client.set(lockKey, token, nx=True, px=_lockTtlMs()):
+            return token
+    except Exception:
+        return ""
+    return None
+
+
+async def _releaseLockAsync(client: Any, lockKey: str, token: str) -> None:
+    if not token:
+        return
+    try:
+        await client.eval(_RELEASE_LOCK_SCRIPT, 1, lockKey, token)
+        return
+    except Exception:
+        pass
+    try:
+        if await client.get(lockKey) == token:
+            await client.delete(lockKey)
+    except Exception:
+        return
+
+
+async def _readEnvelopeAsync(client: Any, fullKey: str) -> dict[str, Any] | None:
+    try:
+        return _decodeEnvelope(await client.get(fullKey))
+    except Exception:
+        return None
+
+
+async def getOrComputeCachedJsonAsync(
+    keySuffix: str,
+    compute: Callable[[], Awaitable[Any]],
+    *,
+    ttlSeconds: int | None = None,
+    version: int | None = None,
+    allowStale: bool = True,
+) -> Any:
+    """Async twin of getOrComputeCachedJson (same keys, envelopes, L1 tier and metrics)."""
+    family = keyFamily(keySuffix)
+    client = getAsyncRedisClient()
+    if client is None:
+        return await _timedComputeAsync(family, compute)
+
+    local = _l1Get(keySuffix)
+    if local is not None and (version is None or local[1] == version):
+        _recordCacheStat(family, "l1Hits")
+        return local[0]
+
+    ttl = ttlSeconds if ttlSeconds is not None else _defaultTtlSeconds()
+    fullKey = _fullKey(keySuffix)
+    envelope = await _readEnvelopeAsync(client, fullKey)
+    if envelope is not None and _isFresh(envelope, version):
+        _recordCacheStat(family, "hits")
+        _l1Put(keySuffix, envelope["v"], softAt=float(envelope["softAt"]), version=version)
+        return envelope["v"]
+
+    lockKey = f"{fullKey}:lock"
+    token = await _acquireLockAsync(client, lockKey)
+    if token is None:
+        if envelope is not None and allowStale:
+            _recordCacheStat(family, "stale")
+            return envelope["v"]
+        _recordCacheStat(family, "lockWaits")
+        deadline = time.monotonic() + _lockWaitMs() / 1000.0
+        while time.monotonic() < deadline:
+            await asyncio.sleep(0.025)
+            waited = await _readEnvelopeAsync(client, fullKey)
+            if waited is not None and _isFresh(waited, version):
+                _recordCacheStat(family, "hits")
+                _l1Put(keySuffix, waited["v"], softAt=float(waited["softAt"]), version=version)
+                return waited["v"]
+        token = await _acquireLockAsync(client, lockKey) or ""
+
+    _recordCacheStat(family, "misses")
+    try:
+        value = await _timedComputeAsync(family, compute)
+        if value is not None and ttl > 0:
+            payload, softAt = _encodeEnvelope(value, ttl, version)
+            try:
+                await client.setex(fullKey, int(ttl + _staleTtlSeconds()), payload)
+            except Exception:
+                pass
+            _l1Put(keySuffix, value, softAt=softAt, version=version)
+        return value
+    finally:
+        await _releaseLockAsync(client, lockKey, token)
+
+
+_JOBS_LIST_VERSION_KEY = "jobs:listVersion"
+
+
+def _readVersionCounter(keySuffix: str) -> int:
+    """Version counter, memoized in L1 so versioned lookups skip the extra Redis GET."""
+    l1Key = f"{_L1_VERSION_PREFIX}{keySuffix}"
+    local = _l1Get(l1Key)
+    if local is not None:
+        return int(local[0])
+    # 0 when unset so the first INCR (-> 1) actually moves the version.
+    version = getIntValue(keySuffix, 0)
+    if isL1CacheEnabled() and getRedisClient() is not None:
+        _l1.put(l1Key, version, ttlSeconds=_l1TtlSeconds())
+    return version
+
+
+async def _readVersionCounterAsync(keySuffix: str) -> int:
+    l1Key = f"{_L1_VERSION_PREFIX}{keySuffix}"
+    local = _l1Get(l1Key)
+    if local is not None:
+        return int(local[0])
+    client = getAsyncRedisClient()
+    if client is None:
+        return 0
+    try:
+        raw = await client.get(_fullKey(keySuffix))
+        version = int(str(raw).strip()) if raw is not None else 0
+    except Exception:
+        return 0
+    if isL1CacheEnabled():
+        _l1.put(l1Key, version, ttlSeconds=_l1TtlSeconds())
+    return version
+
+
+def _bumpVersionCounter(keySuffix: str) -> int:
+    version = incrementIntValue(keySuffix)
+    l1Key = f"{_L1_VERSION_PREFIX}{keySuffix}"
+    if version:
+        _l1.put(l1Key, version, ttlSeconds=_l1TtlSeconds())
+    else:
+        _l1.evict(l1Key)
+    client = getRedisClient()
+    if client is not None:
+        _publishInvalidation(client, l1Key)
+    return version
+
+
 def jobsListVersion() -> int:
-    return getIntValue("jobs:listVersion", 1)
+    return _readVersionCounter(_JOBS_LIST_VERSION_KEY)
+
+
+async def jobsListVersionAsync() -> int:
+    return await _readVersionCounterAsync(_JOBS_LIST_VERSION_KEY)
 
 
 def bumpJobsListVersion() -> int:
-    return incrementIntValue("jobs:listVersion")
+    return _bumpVersionCounter(_JOBS_LIST_VERSION_KEY)
+
+
+def _userTokenVersionKey(userId: str) -> str:
+    return f"auth:tokenVersion:{str(userId or '').strip()}"
+
+
+def userTokenVersion(userId: str) -> int:
+    """Per-user counter that versions the cached auth principal (see authService)."""
+    return _readVersionCounter(_userTokenVersionKey(userId))
+
+
+async def userTokenVersionAsync(userId: str) -> int:
+    return await _readVersionCounterAsync(_userTokenVersionKey(userId))
+
+
+def bumpUserTokenVersion(userId: str) -> int:
+    return _bumpVersionCounter(_userTokenVersionKey(userId))
 
 
 def keyJobsList(params: dict[str, Any]) -> str:
-    version = jobsListVersion()
-    return f"jobs:list:v{version}:{_stableHash(params)}"
+    """Unversioned: pass ``version=jobsListVersion()`` to getOrComputeCachedJson so bumps mark it stale."""
+    return f"jobs:list:{_stableHash(params)}"
+
+
+def keyJobsCount(params: dict[str, Any]) -> str:
+    return f"jobs:count:{_stableHash(params)}"
 
 
 def keyJobsSummary() -> str:
@@ -177,6 +799,10 @@ def keyProfileCurrentWeekAccepts(userId: str) -> str:
     return f"profile:currentWeekAccepts:{str(userId or '').strip()}"
 
 
+def keyAuthUser(userId: str) -> str:
+    return f"auth:user:{str(userId or '').strip()}"
+
+
 def keyAdminUsers() -> str:
     return "admin:users"
 
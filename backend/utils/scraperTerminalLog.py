@@ -18,6 +18,10 @@ PLATFORM_GLASSDOOR = "Glassdoor"
 PLATFORM_ZIPRECRUITER = "ZipRecruiter"
 PLATFORM_MIDHTECH = "Midhtech"
 
+# Printed by `validation.py -1 --follow` once its SIGUSR1 handler is installed; midhScraping.py
+# waits for it before signalling (SIGUSR1's default action would kill the follower).
+VALIDATION_FOLLOWER_READY_LINE = "validation follower ready"
+
 _PROGRESS_LINE_PAD = 120
 
 # --- ANSI (TTY only; respect NO_COLOR) -----------------------------------------
@@ -3,7 +3,15 @@ from __future__ import annotations
 from datetime import UTC, datetime, timedelta
 from typing import Any, Literal
 
-from utils.dataManager import getMongoDb
+from utils.dataManager import (
+    ensureCollectionSchema,
+    ensureCollectionSchemaAsync,
+    getAsyncDashboardMongoDb,
+    getAsyncMongoDb,
+    getDashboardMongoDb,
+    getMongoDb,
+    registerCollectionSchema,
+)
 
 USER_WEEKLY_STATS_COLLECTION = "userWeeklyStats"
 
@@ -31,10 +39,17 @@ def _weekWindow(now: datetime) -> tuple[str, str, str]:
     return weekKey, weekStartIso, weekEndIso
 
 
+registerCollectionSchema(
+    USER_WEEKLY_STATS_COLLECTION,
+    [
+        ([("userId", 1), ("weekKey", 1)], {"unique": True}),
+        ([("userId", 1), ("weekStartIso", -1)], {}),
+    ],
+)
+
+
 def _ensureIndexes() -> None:
-    coll = getMongoDb()[USER_WEEKLY_STATS_COLLECTION]
-    coll.create_index([("userId", 1), ("weekKey", 1)], unique=True)
-    coll.create_index([("userId", 1), ("weekStartIso", -1)])
+    ensureCollectionSchema(USER_WEEKLY_STATS_COLLECTION)
 
 
 def _eventDoc(*, eventType: str, jobId: str | None, delta: int) -> dict[str, Any]:
@@ -127,6 +142,24 @@ def fetchCurrentWeekAcceptedCount(*, userId: str) -> dict[str, Any]:
         {"userId": uid, "weekKey": week_key},
         {"acceptedCount": 1},
     )
+    return _currentWeekAccepted(week_key, week_start_iso, week_end_iso, doc)
+
+
+async def fetchCurrentWeekAcceptedCountAsync(*, userId: str) -> dict[str, Any]:
+    """Async variant of fetchCurrentWeekAcceptedCount for async API routes."""
+    uid = str(userId or "").strip()
+    week_key, week_start_iso, week_end_iso = _weekWindow(_utcNow())
+    if not uid:
+        return _currentWeekAccepted(week_key, week_start_iso, week_end_iso, None)
+    await ensureCollectionSchemaAsync(USER_WEEKLY_STATS_COLLECTION)
+    coll = getAsyncMongoDb()[USER_WEEKLY_STATS_COLLECTION]
+    doc = await coll.find_one({"userId": uid, "weekKey": week_key}, {"acceptedCount": 1})
+    return _currentWeekAccepted(week_key, week_start_iso, week_end_iso, doc)
+
+
+def _currentWeekAccepted(
+    week_key: str, week_start_iso: str, week_end_iso: str, doc: dict[str, Any] | None
+) -> dict[str, Any]:
     accepted = int(doc.get("acceptedCount") or 0) if doc else 0
     return {
         "weekKey": week_key,
@@ -191,11 +224,25 @@ def fetchWeeklyReportByUser(*, userId: str) -> dict[str, Any]:
     if not uid:
         return {"weeks": [], "summary": {"acceptedCount": 0, "rejectedCount": 0, "totalCount": 0}}
     _ensureIndexes()
-    coll = getMongoDb()[USER_WEEKLY_STATS_COLLECTION]
+    coll = getDashboardMongoDb()[USER_WEEKLY_STATS_COLLECTION]
     rows = list(
         coll.find({"userId": uid}, {"_id": 0}).sort([("weekStartIso", -1), ("createdAt", -1)])
     )
+    return _weeklyReportFromRows(rows)
+
+
+async def fetchWeeklyReportByUserAsync(*, userId: str) -> dict[str, Any]:
+    """Async variant of fetchWeeklyReportByUser for async API routes."""
+    uid = str(userId or "").strip()
+    if not uid:
+        return _weeklyReportFromRows([])
+    await ensureCollectionSchemaAsync(USER_WEEKLY_STATS_COLLECTION)
+    coll = getAsyncDashboardMongoDb()[USER_WEEKLY_STATS_COLLECTION]
+    cursor = coll.find({"userId": uid}, {"_id": 0}).sort([("weekStartIso", -1), ("createdAt", -1)])
+    return _weeklyReportFromRows(await cursor.to_list(length=None))
+
 
+def _weeklyReportFromRows(rows: list[dict[str, Any]]) -> dict[str, Any]:
     weeks: list[dict[str, Any]] = []
     acceptedTotal = 0
     rejectedTotal = 0
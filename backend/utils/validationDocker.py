@@ -18,6 +18,15 @@ _VALIDATION_ENV_KEYS = (
     "MIDHTECH_EMAIL",
     "MIDHTECH_PASSWORD",
     "MIDHTECH_CHECK_ABORT_AFTER_CONSECUTIVE_ERRORS",
+    "MIDHTECH_SYNC_CONCURRENCY",
+    "MIDHTECH_SYNC_RATE_PER_SEC",
+    "MIDHTECH_SYNC_BURST",
+    "MIDHTECH_SYNC_DELAY_SEC",
+    "VALIDATION_WRITE_BATCH_SIZE",
+    "VALIDATION_WRITE_FLUSH_SEC",
+    "VALIDATION_CURSOR_BATCH_SIZE",
+    "VALIDATION_LEASE_SEC",
+    "VALIDATION_RUN_STALE_SEC",
 )
 
 
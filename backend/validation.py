@@ -1,18 +1,32 @@
 import json
 import os
+import signal
+import socket
 import sys
+import threading
 import time
+import uuid
+from collections import deque
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
 
 import requests
 
 from utils.dataManager import (
+    ApplyStatusWriteBuffer,
+    ValidationRunCheckpoint,
+    countValidationQueue,
     deleteJobsKeepingOnlyApply,
     deletePastDataOlderThanHours,
+    countJobsByApplyStatus,
+    countJobsWithEmptyApplyStatus,
+    iterClaimedJobsWithEmptyApplyStatus,
+    iterJobsByApplyStatus,
+    iterQueuedValidationJobs,
     loadAllJobs,
-    loadJobsByApplyStatus,
-    loadJobsWithEmptyApplyStatus,
     updateApplyStatusByJobId,
 )
+from utils.env import envInt
 from utils.jobDecisionService import findRestrictionTagsForJob
 from utils.midhtechSuggestApi import (
     authenticateMidhtechSession,
@@ -23,10 +37,13 @@ from utils.midhtechSuggestApi import (
     errorsIndicateStaffWatchlistDoNotApply,
     postJobCheck,
     printCheckSummary,
+    sizeSessionConnectionPool,
     submitJobSuggestion,
 )
+from utils.rateLimit import TokenBucket
 from utils.scraperTerminalLog import (
     PLATFORM_MIDHTECH,
+    VALIDATION_FOLLOWER_READY_LINE,
     ScraperRunLog,
     formatApplyStatusBadge,
     formatPushResultSuffix,
@@ -136,12 +153,18 @@ class _ConsecutiveFailureTracker:
 
 
 def maybePersistClassifierApplyStatus(
-    job: dict, parsed: dict, *, quiet: bool = False
+    job: dict,
+    parsed: dict,
+    *,
+    quiet: bool = False,
+    writeStatus: Callable[[str, str], bool | None] = updateApplyStatusByJobId,
 ) -> tuple[bool, str | None]:
     """
-    If the check JSON is OK and we have a classifier decision string, write applyStatus in SQLite.
+    If the check JSON is OK and we have a classifier decision string, write applyStatus via
+    `writeStatus` (direct update by default; validation passes its write-behind buffer).
     Decisions are normalized (e.g. apply -> APPLY).
-    Returns (updated_in_db, status_string_or_none).
+    Returns (written, status_string_or_none). `writeStatus` returning None means the write was
+    queued; only an explicit False (no row matched) counts as not written.
     """
     if not isinstance(parsed, dict) or not bool(parsed.get("ok")):
         return False, None
@@ -152,7 +175,7 @@ def maybePersistClassifierApplyStatus(
     jobId = str(job.get("jobId") or "").strip()
     if not jobId:
         return False, None
-    if updateApplyStatusByJobId(jobId, applyStatus):
+    if writeStatus(jobId, applyStatus) is not False:
         if not quiet:
             print(f"Updated applyStatus for jobId={jobId!r} -> {applyStatus!r}")
         return True, applyStatus
@@ -162,7 +185,11 @@ def maybePersistClassifierApplyStatus(
 
 
 def maybePersistExistingFromMaasErrors(
-    job: dict, parsed: dict, *, quiet: bool = False
+    job: dict,
+    parsed: dict,
+    *,
+    quiet: bool = False,
+    writeStatus: Callable[[str, str], bool | None] = updateApplyStatusByJobId,
 ) -> tuple[bool, str | None]:
     """When /check/ returns duplicate/existing MAAS errors, set applyStatus to EXISTING."""
     if not isinstance(parsed, dict) or bool(parsed.get("ok")):
@@ -173,7 +200,7 @@ def maybePersistExistingFromMaasErrors(
     jobId = str(job.get("jobId") or "").strip()
     if not jobId:
         return False, None
-    if updateApplyStatusByJobId(jobId, APPLY_STATUS_EXISTING):
+    if writeStatus(jobId, APPLY_STATUS_EXISTING) is not False:
         if not quiet:
             print(
                 f"Updated applyStatus for jobId={jobId!r} -> {APPLY_STATUS_EXISTING!r} "
@@ -186,7 +213,11 @@ def maybePersistExistingFromMaasErrors(
 
 
 def maybePersistDoNotApplyFromStaffWatchlistErrors(
-    job: dict, parsed: dict, *, quiet: bool = False
+    job: dict,
+    parsed: dict,
+    *,
+    quiet: bool = False,
+    writeStatus: Callable[[str, str], bool | None] = updateApplyStatusByJobId,
 ) -> tuple[bool, str | None]:
     """When /check/ returns staff watchlist Do Not Apply, set applyStatus to DO_NOT_APPLY."""
     if not isinstance(parsed, dict) or bool(parsed.get("ok")):
@@ -197,7 +228,7 @@ def maybePersistDoNotApplyFromStaffWatchlistErrors(
     jobId = str(job.get("jobId") or "").strip()
     if not jobId:
         return False, None
-    if updateApplyStatusByJobId(jobId, APPLY_STATUS_DO_NOT_APPLY):
+    if writeStatus(jobId, APPLY_STATUS_DO_NOT_APPLY) is not False:
         if not quiet:
             print(
                 f"Updated applyStatus for jobId={jobId!r} -> {APPLY_STATUS_DO_NOT_APPLY!r} "
@@ -210,7 +241,11 @@ def maybePersistDoNotApplyFromStaffWatchlistErrors(
 
 
 def maybePersistRejectedFromMaasErrors(
-    job: dict, parsed: dict, *, quiet: bool = False
+    job: dict,
+    parsed: dict,
+    *,
+    quiet: bool = False,
+    writeStatus: Callable[[str, str], bool | None] = updateApplyStatusByJobId,
 ) -> tuple[bool, str | None]:
     """When /check/ returns known MAAS business rejections, set applyStatus to REJECTED."""
     if not isinstance(parsed, dict) or bool(parsed.get("ok")):
@@ -221,7 +256,7 @@ def maybePersistRejectedFromMaasErrors(
     jobId = str(job.get("jobId") or "").strip()
     if not jobId:
         return False, None
-    if updateApplyStatusByJobId(jobId, "REJECTED"):
+    if writeStatus(jobId, "REJECTED") is not False:
         if not quiet:
             print(
                 f"Updated applyStatus for jobId={jobId!r} -> 'REJECTED' "
@@ -272,120 +307,343 @@ def loginAndCheck(jobIndex: int = 0) -> None:
         maybePersistRejectedFromMaasErrors(job, parsed, quiet=False)
 
 
-def syncEmptyApplyStatuses() -> None:
+DEFAULT_SYNC_CONCURRENCY = 1
+MAX_SYNC_CONCURRENCY = 32
+VALIDATION_CHECKPOINT_INTERVAL_SEC = 30
+# ApplyStatusWriteBuffer source for local pre-check REJECTED writes (counted separately).
+PRECHECK_WRITE_SOURCE = "precheck"
+
+
+def _validationOwnerId() -> str:
+    """Lease owner / run owner: container hostname + pid, unique per process start."""
+    return f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+
+
+def _syncConcurrency() -> int:
+    return envInt("MIDHTECH_SYNC_CONCURRENCY", DEFAULT_SYNC_CONCURRENCY, 1, MAX_SYNC_CONCURRENCY)
+
+
+def _syncRateLimiter(concurrency: int, delaySec: float) -> TokenBucket:
+    """
+    MIDHTECH_SYNC_RATE_PER_SEC caps /check/ calls across all workers (burst:
+    MIDHTECH_SYNC_BURST, default = concurrency). When unset, a legacy
+    MIDHTECH_SYNC_DELAY_SEC is turned into the equivalent rate so concurrency never
+    hits Midhtech harder than the old sequential loop was configured to.
+    """
+    rate = _parseDelay(os.getenv("MIDHTECH_SYNC_RATE_PER_SEC"))
+    if rate <= 0 and delaySec > 0:
+        rate = 1.0 / delaySec
+    return TokenBucket(rate, envInt("MIDHTECH_SYNC_BURST", concurrency, 1))
+
+
+def _checkPendingJob(
+    job: dict,
+    session: requests.Session,
+    checkUrl: str,
+    suggestUrl: str,
+    csrfToken: str,
+    limiter: TokenBucket,
+    stopEvent: threading.Event,
+) -> tuple[list[str], requests.Response | None, object, BaseException | None]:
+    """
+    Worker body: local pre-check, then one rate-limited POST /check/. Never touches the DB,
+    so results can be applied by the caller in FIFO order. Returns
+    (preTags, checkResp, parsed, error); checkResp is None when skipped or on error.
+    """
+    try:
+        preTags = findRestrictionTagsForJob(job)
+        if preTags:
+            return preTags, None, None, None
+        if not limiter.acquire(stopEvent):
+            return [], None, None, None
+        checkResp, parsed = postJobCheck(session, checkUrl, suggestUrl, csrfToken, job)
+        return [], checkResp, parsed, None
+    except Exception as exc:
+        return [], None, None, exc
+
+
+_PENDING_END = object()
+
+
+def _iterCheckResultsFifo(
+    pending: Iterable[dict | None],
+    check,
+    *,
+    concurrency: int,
+    stopEvent: threading.Event,
+):
+    """
+    Yield (index, job, checkResult) strictly in `pending` order while up to `concurrency`
+    checks run ahead in a thread pool. `pending` may be a lazy stream; only the bounded
+    in-flight window is pulled ahead, so an abort wastes a handful of requests and closing
+    the generator cancels whatever has not started.
+
+    A None from `pending` means "nothing available right now" (follow mode): every check
+    still in flight is yielded first, then (None, None, None) as an idle tick.
+    """
+    if concurrency <= 1:
+        i = 0
+        for job in pending:
+            if job is None:
+                yield None, None, None
+                continue
+            yield i, job, check(job)
+            i += 1
+        return
+
+    window = concurrency * 2
+    jobs = iter(pending)
+    executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="midhtech-check")
+    inFlight: deque = deque()
+    nextIndex = 0
+    exhausted = False
+    try:
+        while True:
+            idle = False
+            while not exhausted and len(inFlight) < window:
+                job = next(jobs, _PENDING_END)
+                if job is _PENDING_END:
+                    exhausted = True
+                    break
+                if job is None:
+                    idle = True
+                    break
+                inFlight.append((nextIndex, job, executor.submit(check, job)))
+                nextIndex += 1
+            if idle:
+                while inFlight:
+                    i, job, future = inFlight.popleft()
+                    yield i, job, future.result()
+                yield None, None, None
+                continue
+            if not inFlight:
+                return
+            i, job, future = inFlight.popleft()
+            yield i, job, future.result()
+    finally:
+        stopEvent.set()
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _formatThroughput(processed: int, elapsedSec: float, concurrency: int) -> str:
+    perMinute = processed * 60.0 / elapsedSec if elapsedSec > 0 else 0.0
+    return (
+        f"Throughput: {perMinute:.1f} job(s)/min "
+        f"({processed} in {elapsedSec:.1f}s, concurrency={concurrency})."
+    )
+
+
+def syncEmptyApplyStatuses(*, follow: bool = False, drainEvent: threading.Event | None = None) -> None:
     """
     FIFO (oldest timestamp first): every job in jobData with applyStatus IS NULL,
-    all platforms. Optional delay between requests: MIDHTECH_SYNC_DELAY_SEC in .env.
-    Aborts early when the same /check/ failure repeats
+    all platforms. MIDHTECH_SYNC_CONCURRENCY (default 1) runs that many /check/ calls in
+    parallel on the shared session; MIDHTECH_SYNC_RATE_PER_SEC / MIDHTECH_SYNC_BURST cap the
+    request rate (MIDHTECH_SYNC_DELAY_SEC still works as the sequential delay). Results are
+    applied in FIFO order, so the abort below behaves exactly like the sequential loop:
+    stops when the same /check/ failure repeats
     MIDHTECH_CHECK_ABORT_AFTER_CONSECUTIVE_ERRORS times (default 3).
+
+    Jobs are leased to this run before they are checked, so validation containers started
+    side by side split the backlog, and progress is checkpointed in validationRuns so a run
+    whose container died is adopted (and its leased jobs reclaimed) by the next one.
+
+    follow=True consumes the validation queue instead of the backlog: jobs are checked as
+    soon as a scraper enqueues them (VALIDATION_QUEUE_ENABLED), and the run keeps polling
+    until `drainEvent` is set, then finishes what is queued and returns.
     """
-    log = ScraperRunLog(PLATFORM_MIDHTECH, "validate", mirrorToScrapeLog=False)
+    log = ScraperRunLog(PLATFORM_MIDHTECH, "follow" if follow else "validate", mirrorToScrapeLog=False)
     delaySec = _parseDelay(os.getenv("MIDHTECH_SYNC_DELAY_SEC"))
-    pending = loadJobsWithEmptyApplyStatus(None)
-    if not pending:
-        log.info("No jobs with applyStatus NULL (nothing pending).")
-        return
+    concurrency = _syncConcurrency()
+    if follow:
+        total = countValidationQueue()
+    else:
+        total = countJobsWithEmptyApplyStatus(None)
+        if not total:
+            log.info("No jobs with applyStatus NULL (nothing pending).")
+            return
 
     session, _baseUrl, suggestUrl, checkUrl, csrfToken = authenticateMidhtechSession()
-    total = len(pending)
-    log.info(
-        f"Syncing applyStatus for {total} job(s) with NULL applyStatus (FIFO, all platforms)…",
-    )
+    owner = _validationOwnerId()
+    if follow:
+        pending = iterQueuedValidationJobs(owner, drainEvent=drainEvent or threading.Event())
+        subject, details = "queued jobs", ["follow mode", f"{total} queued now"]
+    else:
+        # Claimed in FIFO batches; rows scraped mid-run are picked up after the counted backlog.
+        pending = iterClaimedJobsWithEmptyApplyStatus(owner)
+        subject, details = f"{total} job(s) with NULL applyStatus", ["FIFO", "all platforms"]
+    if concurrency > 1:
+        sizeSessionConnectionPool(session, concurrency)
+        limiter = _syncRateLimiter(concurrency, delaySec)
+        rateNote = f"{limiter.ratePerSec:.2f} req/s" if limiter.enabled else "no rate limit"
+        details += [f"{concurrency} workers", rateNote]
+    else:
+        limiter = _syncRateLimiter(1, 0.0)
+    log.info(f"Syncing applyStatus for {subject} ({', '.join(details)})…")
 
-    written = 0
-    rejectedPrecheck = 0
     processed = 0
     failureTracker = _ConsecutiveFailureTracker(_consecutiveCheckAbortLimit())
-    try:
-        for i, job in enumerate(pending):
-            processed = i + 1
-            jid = str(job.get("jobId") or "")
-            plat = (str(job.get("platform") or "") or "?").strip()
-            head = f"[{i + 1}/{total}] {plat} {_displayJobId(jid)}"
-            try:
-                preTags = findRestrictionTagsForJob(job)
-                if preTags:
-                    failureTracker.reset()
-                    if updateApplyStatusByJobId(jid, "REJECTED"):
-                        rejectedPrecheck += 1
+    stopEvent = threading.Event()
+    startedAt = time.monotonic()
+    checkpointAt = startedAt
+    checkpointedFlushes = 0
+    lastJob: dict = {}
+
+    def check(job: dict):
+        return _checkPendingJob(job, session, checkUrl, suggestUrl, csrfToken, limiter, stopEvent)
+
+    results = _iterCheckResultsFifo(pending, check, concurrency=concurrency, stopEvent=stopEvent)
+    runMode = "validate-follow" if follow else "validate"
+    with ValidationRunCheckpoint(owner, mode=runMode, total=total) as run, ApplyStatusWriteBuffer() as statusBuffer:
+        prior = run.doc if run.resumed else {}
+        if run.resumed:
+            log.info(
+                f"Resuming validation run {run.runId} (resume #{run.doc.get('resumeCount')}, "
+                f"{int(prior.get('processed') or 0)} job(s) already processed)."
+            )
+
+        def writtenCounts() -> tuple[int, int]:
+            """(classifier/MAAS writes, local pre-check REJECTED) confirmed by buffer flushes."""
+            rejected = statusBuffer.writtenBySource.get(PRECHECK_WRITE_SOURCE, 0)
+            return statusBuffer.written - rejected, rejected
+
+        def runProgress() -> dict:
+            written, rejectedPrecheck = writtenCounts()
+            return {
+                "processed": int(prior.get("processed") or 0) + processed,
+                "written": int(prior.get("written") or 0) + written,
+                "rejectedPrecheck": int(prior.get("rejectedPrecheck") or 0) + rejectedPrecheck,
+                "lastJobId": lastJob.get("jobId"),
+                "lastTimestamp": lastJob.get("timestamp"),
+            }
+
+        try:
+            for i, job, outcome in results:
+                statusBuffer.flushIfDue()
+                if (
+                    statusBuffer.flushes != checkpointedFlushes
+                    or time.monotonic() - checkpointAt >= VALIDATION_CHECKPOINT_INTERVAL_SEC
+                ):
+                    checkpointedFlushes = statusBuffer.flushes
+                    checkpointAt = time.monotonic()
+                    if not run.checkpoint(runProgress()):
+                        log.error(
+                            f"Validation run {run.runId} was adopted by another container "
+                            "(heartbeat went stale); stopping this one."
+                        )
+                        break
+                if job is None:
+                    continue  # follow mode: queue idle, only flush / heartbeat
+                preTags, checkResp, parsed, error = outcome
+                lastJob = job
+                processed = i + 1
+                total = max(total, processed)
+                jid = str(job.get("jobId") or "")
+                plat = (str(job.get("platform") or "") or "?").strip()
+                head = f"[{i + 1}/{total}] {plat} {_displayJobId(jid)}"
+                try:
+                    if error is not None:
+                        raise error
+                    if preTags:
+                        failureTracker.reset()
+                        statusBuffer.add(jid, "REJECTED", PRECHECK_WRITE_SOURCE)
                         log.warning(
                             f"{head} → {formatApplyStatusBadge('REJECTED')} local pre-check: "
                             f"{', '.join(preTags)}"
                         )
-                    else:
-                        log.warning(f"{head} → pre-check matched but no DB row updated for jobId={jid!r}")
-                    continue
-
-                checkResp, parsed = postJobCheck(session, checkUrl, suggestUrl, csrfToken, job)
-                if not isinstance(parsed, dict):
-                    failMsg = extractCheckFailureMessage(parsed, checkResp)
-                    log.warning(f"{head} → non-JSON HTTP {checkResp.status_code} — {failMsg}")
-                    failureTracker.record(failMsg)
-                    continue
-                if not bool(parsed.get("ok")):
-                    ex_ok, ex_st = maybePersistExistingFromMaasErrors(job, parsed, quiet=True)
-                    if ex_ok:
-                        failureTracker.reset()
-                        written += 1
-                        badge = formatApplyStatusBadge(ex_st or APPLY_STATUS_EXISTING)
-                        log.info(f"{head} → {badge}")
                         continue
-                    dna_ok, dna_st = maybePersistDoNotApplyFromStaffWatchlistErrors(
-                        job, parsed, quiet=True
-                    )
-                    if dna_ok:
-                        failureTracker.reset()
-                        written += 1
-                        badge = formatApplyStatusBadge(dna_st or APPLY_STATUS_DO_NOT_APPLY)
-                        log.info(f"{head} → {badge} staff watchlist")
+
+                    if checkResp is None:
+                        continue  # worker skipped the call after an abort was signalled
+                    if not isinstance(parsed, dict):
+                        failMsg = extractCheckFailureMessage(parsed, checkResp)
+                        log.warning(f"{head} → non-JSON HTTP {checkResp.status_code} — {failMsg}")
+                        failureTracker.record(failMsg)
                         continue
-                    rej_ok, rej_st = maybePersistRejectedFromMaasErrors(job, parsed, quiet=True)
-                    if rej_ok:
-                        failureTracker.reset()
-                        written += 1
-                        badge = formatApplyStatusBadge(rej_st or "REJECTED")
-                        log.info(f"{head} → {badge} MAAS business rule")
+                    if not bool(parsed.get("ok")):
+                        ex_ok, ex_st = maybePersistExistingFromMaasErrors(
+                            job, parsed, quiet=True, writeStatus=statusBuffer.add
+                        )
+                        if ex_ok:
+                            failureTracker.reset()
+                            badge = formatApplyStatusBadge(ex_st or APPLY_STATUS_EXISTING)
+                            log.info(f"{head} → {badge}")
+                            continue
+                        dna_ok, dna_st = maybePersistDoNotApplyFromStaffWatchlistErrors(
+                            job, parsed, quiet=True, writeStatus=statusBuffer.add
+                        )
+                        if dna_ok:
+                            failureTracker.reset()
+                            badge = formatApplyStatusBadge(dna_st or APPLY_STATUS_DO_NOT_APPLY)
+                            log.info(f"{head} → {badge} staff watchlist")
+                            continue
+                        rej_ok, rej_st = maybePersistRejectedFromMaasErrors(
+                            job, parsed, quiet=True, writeStatus=statusBuffer.add
+                        )
+                        if rej_ok:
+                            failureTracker.reset()
+                            badge = formatApplyStatusBadge(rej_st or "REJECTED")
+                            log.info(f"{head} → {badge} MAAS business rule")
+                            continue
+                        failMsg = extractCheckFailureMessage(parsed, checkResp)
+                        err_blob = failMsg if len(failMsg) <= 160 else failMsg[:157] + "…"
+                        log.warning(f"{head} → check ok=false: {err_blob!r}")
+                        failureTracker.record(failMsg)
                         continue
-                    failMsg = extractCheckFailureMessage(parsed, checkResp)
-                    err_blob = failMsg if len(failMsg) <= 160 else failMsg[:157] + "…"
-                    log.warning(f"{head} → check ok=false: {err_blob!r}")
-                    failureTracker.record(failMsg)
-                    continue
-                cl_ok, cl_st = maybePersistClassifierApplyStatus(job, parsed, quiet=True)
-                if cl_ok:
-                    failureTracker.reset()
-                    written += 1
-                    badge = formatApplyStatusBadge(cl_st or "")
-                    log.info(f"{head} → {badge}")
-                else:
-                    failMsg = "ok response but no applyStatus written (no decision?)"
-                    log.warning(f"{head} → {failMsg}")
-                    failureTracker.record(failMsg)
-            except ConsecutiveCheckFailureAbort:
-                raise
-            except KeyboardInterrupt:
-                raise
-            except requests.RequestException as exc:
-                log.error(f"{head} → network error: {exc}")
-            except Exception as exc:
-                log.error(f"{head} → exception: {exc}")
-            if delaySec > 0:
-                time.sleep(delaySec)
-    except ConsecutiveCheckFailureAbort as exc:
-        _logConsecutiveCheckAbort(
-            log,
-            exc,
-            written=written,
-            rejectedPrecheck=rejectedPrecheck,
-            processed=processed,
-            total=total,
-        )
-        raise
+                    cl_ok, cl_st = maybePersistClassifierApplyStatus(
+                        job, parsed, quiet=True, writeStatus=statusBuffer.add
+                    )
+                    if cl_ok:
+                        failureTracker.reset()
+                        badge = formatApplyStatusBadge(cl_st or "")
+                        log.info(f"{head} → {badge}")
+                    else:
+                        failMsg = "ok response but no applyStatus written (no decision?)"
+                        log.warning(f"{head} → {failMsg}")
+                        failureTracker.record(failMsg)
+                except ConsecutiveCheckFailureAbort:
+                    raise
+                except KeyboardInterrupt:
+                    raise
+                except requests.RequestException as exc:
+                    log.error(f"{head} → network error: {exc}")
+                except Exception as exc:
+                    log.error(f"{head} → exception: {exc}")
+                if delaySec > 0 and concurrency <= 1:
+                    time.sleep(delaySec)
+        except ConsecutiveCheckFailureAbort as exc:
+            statusBuffer.flush()
+            written, rejectedPrecheck = writtenCounts()
+            _logConsecutiveCheckAbort(
+                log,
+                exc,
+                written=written,
+                rejectedPrecheck=rejectedPrecheck,
+                processed=processed,
+                total=total,
+            )
+            log.error(_formatThroughput(processed, time.monotonic() - startedAt, concurrency))
+            raise
+        finally:
+            results.close()
+            run.progress = runProgress()
+    _logUnmatchedStatusWrites(log, statusBuffer)
+    written, rejectedPrecheck = writtenCounts()
 
     log.info(
         f"Done. Wrote applyStatus from classifier/MAAS for {written} job(s); "
         f"REJECTED from local pre-check (restrictions / 6+ years experience): {rejectedPrecheck}."
     )
+    log.info(_formatThroughput(processed, time.monotonic() - startedAt, concurrency))
+
+
+def _logUnmatchedStatusWrites(log: ScraperRunLog, statusBuffer: ApplyStatusWriteBuffer) -> None:
+    """Buffered writes only learn at flush time that a row disappeared (e.g. cleanup ran)."""
+    if statusBuffer.missing:
+        shown = ", ".join(repr(j) for j in statusBuffer.missing[:5])
+        more = f" (+{len(statusBuffer.missing) - 5} more)" if len(statusBuffer.missing) > 5 else ""
+        log.warning(f"No DB row updated for {len(statusBuffer.missing)} job(s): {shown}{more}")
+    if len(statusBuffer):
+        log.error(f"{len(statusBuffer)} applyStatus write(s) could not be flushed to MongoDB.")
 
 
 def _logConsecutiveCheckAbort(log: ScraperRunLog, exc: ConsecutiveCheckFailureAbort, *, written: int, rejectedPrecheck: int, processed: int, total: int) -> None:
@@ -402,66 +660,69 @@ def _logConsecutiveCheckAbort(log: ScraperRunLog, exc: ConsecutiveCheckFailureAb
 def pushApplyJobsAfterValidate() -> int:
     """Submit rows with applyStatus APPLY to suggest endpoint; set APPLIED or REDO."""
     log = ScraperRunLog(PLATFORM_MIDHTECH, "suggest", mirrorToScrapeLog=False)
-    applyJobs = loadJobsByApplyStatus(KEEP_STATUS)
-    if not applyJobs:
+    total = countJobsByApplyStatus(KEEP_STATUS)
+    if not total:
         log.info("No APPLY jobs found to submit.")
         return 0
 
-    log.info(f"Submitting {len(applyJobs)} APPLY job(s) to suggest endpoint...")
+    log.info(f"Submitting {total} APPLY job(s) to suggest endpoint...")
     session, _baseUrl, suggestUrl, _checkUrl, csrfToken = authenticateMidhtechSession()
 
     applied = 0
     redo = 0
     rejected = 0
     existing = 0
-    total = len(applyJobs)
-    for i, job in enumerate(applyJobs, start=1):
-        jobId = str(job.get("jobId") or "").strip()
-        title = str(job.get("title") or "").strip()
-        company = str(job.get("companyName") or "").strip()
-        jid = _displayJobId(jobId)
-        head = f"[{i}/{total}] submit {jid} :: {company} :: {title}"
-        restrictionTags = findRestrictionTagsForJob(job)
-        if restrictionTags:
-            updateApplyStatusByJobId(jobId, "REJECTED")
-            rejected += 1
-            log.warning(
-                f"{head} → {formatApplyStatusBadge('REJECTED')} local restriction match: "
-                f"{', '.join(restrictionTags)}"
-            )
-            continue
-        try:
-            success, info, auto_apply_status = submitJobSuggestion(
-                session=session,
-                suggestUrl=suggestUrl,
-                csrfToken=csrfToken,
-                job=job,
-            )
-        except Exception as exc:
-            success = False
-            info = f"exception: {exc}"
-            auto_apply_status = None
-
-        suffix = formatPushResultSuffix(info)
-        if success:
-            updateApplyStatusByJobId(jobId, STATUS_APPLIED)
-            applied += 1
-            badge = formatApplyStatusBadge(STATUS_APPLIED)
-            log.info(f"{head} → {badge} {suffix}")
-        elif auto_apply_status:
-            updateApplyStatusByJobId(jobId, auto_apply_status)
-            badge = formatApplyStatusBadge(auto_apply_status)
-            if auto_apply_status == "EXISTING":
-                existing += 1
-                log.info(f"{head} → {badge} — {info}")
-            else:
+    applyJobs = iterJobsByApplyStatus(KEEP_STATUS)
+    with ApplyStatusWriteBuffer() as statusBuffer:
+        for i, job in enumerate(applyJobs, start=1):
+            total = max(total, i)
+            jobId = str(job.get("jobId") or "").strip()
+            title = str(job.get("title") or "").strip()
+            company = str(job.get("companyName") or "").strip()
+            jid = _displayJobId(jobId)
+            head = f"[{i}/{total}] submit {jid} :: {company} :: {title}"
+            restrictionTags = findRestrictionTagsForJob(job)
+            if restrictionTags:
+                statusBuffer.add(jobId, "REJECTED")
                 rejected += 1
-                log.info(f"{head} → {badge} — {info}")
-        else:
-            updateApplyStatusByJobId(jobId, STATUS_REDO)
-            redo += 1
-            badge = formatApplyStatusBadge(STATUS_REDO)
-            log.warning(f"{head} → {badge} {suffix}")
+                log.warning(
+                    f"{head} → {formatApplyStatusBadge('REJECTED')} local restriction match: "
+                    f"{', '.join(restrictionTags)}"
+                )
+                continue
+            try:
+                success, info, auto_apply_status = submitJobSuggestion(
+                    session=session,
+                    suggestUrl=suggestUrl,
+                    csrfToken=csrfToken,
+                    job=job,
+                )
+            except Exception as exc:
+                success = False
+                info = f"exception: {exc}"
+                auto_apply_status = None
+
+            suffix = formatPushResultSuffix(info)
+            if success:
+                statusBuffer.add(jobId, STATUS_APPLIED)
+                applied += 1
+                badge = formatApplyStatusBadge(STATUS_APPLIED)
+                log.info(f"{head} → {badge} {suffix}")
+            elif auto_apply_status:
+                statusBuffer.add(jobId, auto_apply_status)
+                badge = formatApplyStatusBadge(auto_apply_status)
+                if auto_apply_status == "EXISTING":
+                    existing += 1
+                    log.info(f"{head} → {badge} — {info}")
+                else:
+                    rejected += 1
+                    log.info(f"{head} → {badge} — {info}")
+            else:
+                statusBuffer.add(jobId, STATUS_REDO)
+                redo += 1
+                badge = formatApplyStatusBadge(STATUS_REDO)
+                log.warning(f"{head} → {badge} {suffix}")
+    _logUnmatchedStatusWrites(log, statusBuffer)
 
     log.info("── suggest summary ──")
     log.info(
@@ -525,8 +786,10 @@ def _parseCliChoice(argv: list[str]) -> str | None:
     raw = argv[1].strip()
     if raw in ("-h", "--help"):
         print(
-            "Usage: python validation.py [-1|-2|-3]\n\n"
+            "Usage: python validation.py [-1 [--follow]|-2|-3]\n\n"
             "  -1  Validate all pending (applyStatus NULL -> check API, FIFO)\n"
+            "  -1 --follow  Validate jobs from the validation queue as scrapers add them;\n"
+            "               SIGUSR1 drains the queue and exits (midhScraping.py --pipeline)\n"
             "  -2  Push all APPLY jobs to suggest API\n\n"
             "  -3  Cleanup: Delete Unwanted + NULL (keep APPLY only) and "
             "delete pastData older than 48h\n\n"
@@ -553,8 +816,29 @@ def _parseCliChoice(argv: list[str]) -> str | None:
     raise SystemExit(2)
 
 
+def _exitOnSigterm(signum: int, _frame: object) -> None:
+    # `docker stop` sends SIGTERM; exit through SystemExit so buffered applyStatus writes flush.
+    raise SystemExit(128 + signum)
+
+
 def main() -> int:
-    choice = _parseCliChoice(sys.argv)
+    signal.signal(signal.SIGTERM, _exitOnSigterm)
+    follow = "--follow" in sys.argv[1:]
+    drainEvent = threading.Event()
+    if follow and hasattr(signal, "SIGUSR1"):
+        # Producer (midhScraping.py) is done: finish whatever is queued, then exit normally.
+        # Installed before anything else (and announced) so an early SIGUSR1 cannot hit the
+        # default action, which kills the process. Set from a helper thread: the handler may
+        # interrupt the main thread inside drainEvent.wait().
+        signal.signal(
+            signal.SIGUSR1,
+            lambda _signum, _frame: threading.Thread(target=drainEvent.set, daemon=True).start(),
+        )
+        print(VALIDATION_FOLLOWER_READY_LINE, flush=True)
+    choice = _parseCliChoice([a for a in sys.argv if a != "--follow"])
+    if follow and choice != "1":
+        print("--follow only applies to -1 (validate).", file=sys.stderr)
+        return 2
     if choice is None:
         choice = promptMenu()
     if choice is None:
@@ -562,7 +846,7 @@ def main() -> int:
         return 0
     try:
         if choice == "1":
-            syncEmptyApplyStatuses()
+            syncEmptyApplyStatuses(follow=follow, drainEvent=drainEvent)
         elif choice == "2":
             pushApplyJobsAfterValidate()
         else:
@@ -277,7 +277,8 @@ export type AdminJobAction =
   | "flush_db"
   | "flush_past_data_orphans"
   | "push_apply_jobs"
-  | "push_apply_jobs_then_cleanup";
+  | "push_apply_jobs_then_cleanup"
+  | "reconcile_status_counters";
 
 export type AdminScraperKeywordsResponse = {
   keywords: string[];
@@ -20,6 +20,7 @@ from selenium.common.exceptions import (
     NoSuchElementException,
     StaleElementReferenceException,
     TimeoutException,
+    WebDriverException,
 )
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
@@ -39,6 +40,7 @@ from utils.fileManagement import (
     isCompleteJobRow,
     loadExistingJobsAndMeta,
     loadJobsDocumentOrEmpty,
+    markJobDirty,
     mergeFetchedJobs,
     mergeNewJobsIntoDocument,
     resolveOutputJsonPath,
@@ -441,80 +443,153 @@ def _recommendationNotes(card) -> str | None:
         return None
 
 
+# One browser round-trip for every rendered card (fields as extractJobFromListCard reads them).
+# Elements without a layout box read as "" like Selenium's .text.
+_LIST_CARDS_EXTRACT_JS = """
+const [cardSelector, itemSelector] = arguments;
+const text = (el) => (el && el.getClientRects().length ? (el.innerText || '').trim() : '');
+const rel = (root, sel) => text(root.querySelector(sel));
+const notesIn = (root) => {
+  if (!root) return '';
+  const parts = [];
+  for (const el of root.querySelectorAll('[class*="recommendation-tag-text"]')) {
+    const t = text(el);
+    if (t) parts.push(t);
+  }
+  return parts.join(' | ');
+};
+const rowTexts = (row) => {
+  const out = [];
+  if (!row) return out;
+  for (const item of row.querySelectorAll(itemSelector)) {
+    const t = text(item.querySelector('span'));
+    if (t) out.push(t);
+  }
+  return out;
+};
+return Array.from(document.querySelectorAll(cardSelector), (card) => {
+  const link = card.querySelector('a[href*="/jobs/info/"]');
+  const rows = card.querySelectorAll('[class*="job-metadata-row"]');
+  return {
+    id: card.id || '',
+    href: link ? link.href || '' : '',
+    title: rel(card, '[class*="job-title"]'),
+    postedAgo: rel(card, '[class*="publish-time"]'),
+    company: rel(card, '[class*="company-name"]'),
+    industryTag: rel(card, '[class*="job-tag"]'),
+    applicants: rel(card, '[class*="apply-time"]'),
+    notes: notesIn(card) || notesIn(card.parentElement),
+    firstRow: rowTexts(rows[0]),
+    secondRow: rowTexts(rows[1]),
+  };
+});
+"""
+
+
+def _metadataRowTexts(row) -> list[str]:
+    out: list[str] = []
+    for item in row.find_elements(By.CSS_SELECTOR, JOB_METADATA_ITEM_SELECTOR):
+        try:
+            sp = item.find_element(By.CSS_SELECTOR, "span")
+            t = (sp.text or "").strip()
+            if t:
+                out.append(t)
+        except (NoSuchElementException, StaleElementReferenceException):
+            pass
+    return out
+
+
+def _jobFromListCardFields(fields: dict) -> dict[str, str | None] | None:
+    """Build the list row (same keys as parseJobCard) from raw card fields; None without a job id."""
+
+    def opt(key: str) -> str | None:
+        value = fields.get(key)
+        value = value.strip() if isinstance(value, str) else ""
+        return value or None
+
+    def row(key: str) -> list[str]:
+        values = fields.get(key)
+        if not isinstance(values, list):
+            return []
+        return [v.strip() for v in values if isinstance(v, str) and v.strip()]
+
+    jid = opt("id")
+    href = opt("href")
+    if href:
+        m = jobIdFromHrefPattern.search(href)
+        if m:
+            jid = m.group(1)
+    if not jid:
+        return None
+
+    path = href.split("?")[0] if href else f"/jobs/info/{jid}"
+    jobUrl = urljoin(jobrightOrigin, path) if path.startswith("/") else path
+
+    firstRow = row("firstRow")
+    secondRow = row("secondRow")
+    return {
+        "jobId": jid,
+        "jobUrl": jobUrl,
+        "title": opt("title"),
+        "postedAgo": opt("postedAgo"),
+        "company": opt("company"),
+        "industryTag": opt("industryTag"),
+        "applicants": opt("applicants"),
+        "visaOrMatchNote": opt("notes"),
+        "location": firstRow[0] if len(firstRow) > 0 else None,
+        "employmentType": firstRow[1] if len(firstRow) > 1 else None,
+        "salaryRange": firstRow[2] if len(firstRow) >= 3 else None,
+        "workModel": secondRow[0] if len(secondRow) > 0 else None,
+        "seniority": secondRow[1] if len(secondRow) > 1 else None,
+        "experience": secondRow[2] if len(secondRow) > 2 else None,
+    }
+
+
 def extractJobFromListCard(card) -> dict[str, str | None] | None:
-    """Parse one job row from the live list (same keys as parseJobCard)."""
+    """Parse one job row from the live list, one WebDriver call per field (fallback path)."""
     try:
-        jid = (card.get_attribute("id") or "").strip() or None
         href = None
         try:
             a = card.find_element(By.CSS_SELECTOR, 'a[href*="/jobs/info/"]')
-            href = (a.get_attribute("href") or "").strip()
+            href = a.get_attribute("href")
         except NoSuchElementException:
             pass
-        if href:
-            m = jobIdFromHrefPattern.search(href)
-            if m:
-                jid = m.group(1)
-        if not jid:
-            return None
-
-        path = href.split("?")[0] if href else f"/jobs/info/{jid}"
-        jobUrl = urljoin(jobrightOrigin, path) if path.startswith("/") else path
-
-        firstRow: list[str] = []
-        secondRow: list[str] = []
         rows = card.find_elements(By.CSS_SELECTOR, '[class*="job-metadata-row"]')
-        if len(rows) >= 1:
-            for item in rows[0].find_elements(
-                By.CSS_SELECTOR, JOB_METADATA_ITEM_SELECTOR
-            ):
-                try:
-                    sp = item.find_element(By.CSS_SELECTOR, "span")
-                    t = (sp.text or "").strip()
-                    if t:
-                        firstRow.append(t)
-                except (NoSuchElementException, StaleElementReferenceException):
-                    pass
-        if len(rows) >= 2:
-            for item in rows[1].find_elements(
-                By.CSS_SELECTOR, JOB_METADATA_ITEM_SELECTOR
-            ):
-                try:
-                    sp = item.find_element(By.CSS_SELECTOR, "span")
-                    t = (sp.text or "").strip()
-                    if t:
-                        secondRow.append(t)
-                except (NoSuchElementException, StaleElementReferenceException):
-                    pass
-
-        location = firstRow[0] if len(firstRow) > 0 else None
-        employmentType = firstRow[1] if len(firstRow) > 1 else None
-        salaryRange = firstRow[2] if len(firstRow) >= 3 else None
-        workModel = secondRow[0] if len(secondRow) > 0 else None
-        seniority = secondRow[1] if len(secondRow) > 1 else None
-        experience = secondRow[2] if len(secondRow) > 2 else None
-
-        return {
-            "jobId": jid,
-            "jobUrl": jobUrl,
-            "title": _relText(card, '[class*="job-title"]'),
-            "postedAgo": _relText(card, '[class*="publish-time"]'),
-            "company": _relText(card, '[class*="company-name"]'),
-            "industryTag": _relText(card, '[class*="job-tag"]'),
-            "applicants": _relText(card, '[class*="apply-time"]'),
-            "visaOrMatchNote": _recommendationNotes(card),
-            "location": location,
-            "employmentType": employmentType,
-            "salaryRange": salaryRange,
-            "workModel": workModel,
-            "seniority": seniority,
-            "experience": experience,
-        }
+        return _jobFromListCardFields(
+            {
+                "id": card.get_attribute("id"),
+                "href": href,
+                "title": _relText(card, '[class*="job-title"]'),
+                "postedAgo": _relText(card, '[class*="publish-time"]'),
+                "company": _relText(card, '[class*="company-name"]'),
+                "industryTag": _relText(card, '[class*="job-tag"]'),
+                "applicants": _relText(card, '[class*="apply-time"]'),
+                "notes": _recommendationNotes(card),
+                "firstRow": _metadataRowTexts(rows[0]) if len(rows) >= 1 else [],
+                "secondRow": _metadataRowTexts(rows[1]) if len(rows) >= 2 else [],
+            }
+        )
     except StaleElementReferenceException:
         return None
 
 
 def _extractVisibleJobs(driver) -> list[dict[str, str | None]]:
+    """
+    All rendered cards in one execute_script call; falls back to per-element reads
+    (extractJobFromListCard) when the script fails or returns something unexpected.
+    """
+    try:
+        raw = driver.execute_script(
+            _LIST_CARDS_EXTRACT_JS, JOB_CARD_CSS, JOB_METADATA_ITEM_SELECTOR
+        )
+    except WebDriverException:
+        raw = None
+    if isinstance(raw, list):
+        return [
+            job
+            for fields in raw
+            if isinstance(fields, dict) and (job := _jobFromListCardFields(fields))
+        ]
     out: list[dict[str, str | None]] = []
     for card in driver.find_elements(By.CSS_SELECTOR, JOB_CARD_CSS):
         job = extractJobFromListCard(card)
@@ -813,7 +888,7 @@ def fetchAndMergeSearchSelenium(
         if added:
             appended += 1
             try:
-                saveOutputDocument(outputPath, data)
+                saveOutputDocument(outputPath, data, dirtyOnly=True)
             except OSError as exc:
                 return False, f"Failed to save merged jobs: {exc}", None
         else:
@@ -1225,7 +1300,7 @@ def scrapePendingJobDetails(
     log: ScraperRunLog,
     phaseLabel: str,
 ) -> None:
-    """Open each pending job URL, scrape detail DOM, merge into data, save after each job."""
+    """Open each pending job URL, scrape detail DOM, merge into data, save that job after each one."""
     jobs = data["jobs"]
     log.bindPhase(phaseLabel)
     pending = [j for j in jobs if _jobNeedsDetailPass(j, knownJobIdsBeforeRun)]
@@ -1272,17 +1347,8 @@ def scrapePendingJobDetails(
             f"{label} — {preview}… | apply: {applyShow}{extra}",
         )
 
-        currentJobId = (job.get("jobId") or "").strip()
-        if currentJobId:
-            for i, existingJob in enumerate(data.get("jobs", [])):
-                if (
-                    isinstance(existingJob, dict)
-                    and (existingJob.get("jobId") or "").strip() == currentJobId
-                ):
-                    data["jobs"][i] = job
-                    break
-
-        saveOutputDocument(jsonPath, data)
+        markJobDirty(data, job)
+        saveOutputDocument(jsonPath, data, dirtyOnly=True)
 
 
 def main() -> None:
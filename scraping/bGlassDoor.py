@@ -17,6 +17,7 @@ from selenium.common.exceptions import (
     NoSuchElementException,
     StaleElementReferenceException,
     TimeoutException,
+    WebDriverException,
 )
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
@@ -546,7 +547,10 @@ def elementAttr(root, selector: str, name: str) -> str:
 
 
 def skillsFromCard(li) -> str:
-    raw = elementText(li, '[data-test="descSnippet"]')
+    return skillsFromSnippet(elementText(li, '[data-test="descSnippet"]'))
+
+
+def skillsFromSnippet(raw: str) -> str:
     match = re.search(r"Skills:\s*(.+)", raw, re.I | re.DOTALL)
     if not match:
         return ""
@@ -738,29 +742,93 @@ def scrapeDetailPane(driver) -> tuple[str, str]:
     return description, company
 
 
+# One browser round-trip for a batch of list rows: the fields cardFields reads plus the
+# Easy Apply badge. Elements without a layout box read as "" like Selenium's .text.
+_CARD_FIELDS_JS = """
+const text = (el) => (el && el.getClientRects().length ? (el.innerText || '').trim() : '');
+return Array.from(arguments[0], (li) => {
+  const q = (sel) => li.querySelector(sel);
+  const titleLink = q('a[data-test="job-title"]');
+  return {
+    glassdoorJobId: (li.getAttribute('data-jobid') || '').trim(),
+    companyName:
+      text(q('[class*="compactEmployerName"]')) ||
+      text(q('[class*="EmployerProfile_employerNameContainer"] span')),
+    title: text(titleLink),
+    titleHref: titleLink ? (titleLink.href || '').trim() : '',
+    location: text(q('[data-test="emp-location"]')),
+    salary: text(q('[data-test="detailSalary"]')),
+    snippet: text(q('[data-test="descSnippet"]')),
+    postedAgo: text(q('[data-test="job-age"]')),
+    easyApply: Boolean(q('[class*="easyApplyTag"]')) || text(li).toLowerCase().includes('easy apply'),
+  };
+});
+"""
+
+_FIND_LISTING_JS = """
+const [selector, jobId] = arguments;
+const items = document.querySelectorAll(selector);
+for (let i = 0; i < items.length; i++) {
+  if ((items[i].getAttribute('data-jobid') || '').trim() === jobId) return [i, items[i]];
+}
+return null;
+"""
+
+_LISTING_JOB_IDS_JS = """
+return Array.from(arguments[0], (li) => li.getAttribute('data-jobid') || '');
+"""
+
+
+def _cardFromFields(fields: dict) -> dict[str, str | None]:
+    def text(key: str) -> str:
+        value = fields.get(key)
+        return value.strip() if isinstance(value, str) else ""
+
+    snippet = text("snippet")
+    return {
+        "glassdoorJobId": text("glassdoorJobId"),
+        "companyName": text("companyName"),
+        "title": text("title"),
+        "titleHref": text("titleHref"),
+        "location": text("location"),
+        "salaryRange": text("salary") or None,
+        "snippet": snippet,
+        "postedAgo": text("postedAgo"),
+        "qualificationTags": skillsFromSnippet(snippet),
+    }
+
+
 def cardFields(li) -> dict[str, str | None]:
-    gid = (li.get_attribute("data-jobid") or "").strip()
+    """One list row, one WebDriver call per field (fallback for readCardFields)."""
     company = elementText(li, '[class*="compactEmployerName"]')
     if not company:
         company = elementText(li, '[class*="EmployerProfile_employerNameContainer"] span')
-    title = elementText(li, 'a[data-test="job-title"]')
-    titleHref = elementAttr(li, 'a[data-test="job-title"]', "href")
-    location = elementText(li, '[data-test="emp-location"]')
-    salary = elementText(li, '[data-test="detailSalary"]')
-    snippet = elementText(li, '[data-test="descSnippet"]')
-    age = elementText(li, '[data-test="job-age"]')
-    skills = skillsFromCard(li)
-    return {
-        "glassdoorJobId": gid,
-        "companyName": company,
-        "title": title,
-        "titleHref": titleHref,
-        "location": location,
-        "salaryRange": salary or None,
-        "snippet": snippet,
-        "postedAgo": age,
-        "qualificationTags": skills,
-    }
+    return _cardFromFields(
+        {
+            "glassdoorJobId": li.get_attribute("data-jobid"),
+            "companyName": company,
+            "title": elementText(li, 'a[data-test="job-title"]'),
+            "titleHref": elementAttr(li, 'a[data-test="job-title"]', "href"),
+            "location": elementText(li, '[data-test="emp-location"]'),
+            "salary": elementText(li, '[data-test="detailSalary"]'),
+            "snippet": elementText(li, '[data-test="descSnippet"]'),
+            "postedAgo": elementText(li, '[data-test="job-age"]'),
+        }
+    )
+
+
+def readCardFields(driver, items: list) -> list[dict]:
+    """
+    cardFields plus an "easyApply" flag for each row, read in one execute_script call.
+    Falls back to per-element reads when the script fails or returns a different shape.
+    """
+    try:
+        raw = driver.execute_script(_CARD_FIELDS_JS, items)
+    except WebDriverException:
+        raw = None
+    if isinstance(raw, list) and len(raw) == len(items) and all(isinstance(r, dict) for r in raw):
+        return [{**_cardFromFields(r), "easyApply": bool(r.get("easyApply"))} for r in raw]
+    return [{**cardFields(li), "easyApply": cardShowsGlassdoorEasyApply(li)} for li in items]
 
 
 def cardShowsGlassdoorEasyApply(li) -> bool:
@@ -979,6 +1047,21 @@ def scrollGlassdoorJobsList(
     return False
 
 
+def listingJobIds(driver, items: list) -> list[str]:
+    """
+    data-jobid of each element in `items`, read in one call (per-row get_attribute as
+    fallback). The elements themselves are passed in, so ids stay paired with their rows
+    even after a virtualized re-render.
+    """
+    try:
+        raw = driver.execute_script(_LISTING_JOB_IDS_JS, items)
+    except WebDriverException:
+        raw = None
+    if isinstance(raw, list) and len(raw) == len(items):
+        return [v if isinstance(v, str) else "" for v in raw]
+    return [li.get_attribute("data-jobid") or "" for li in items]
+
+
 def findJobListingIndexAndLi(driver, glassdoorDataJobid: str) -> tuple[int, object] | None:
     """
     Re-locate a list row after DOM reflows. The jobs list is often virtualized: only a
@@ -989,6 +1072,14 @@ def findJobListingIndexAndLi(driver, glassdoorDataJobid: str) -> tuple[int, obje
         return None
 
     def _scan() -> tuple[int, object] | None:
+        try:
+            hit = driver.execute_script(_FIND_LISTING_JS, jobListItem, raw)
+        except WebDriverException:
+            hit = False
+        if hit is None:
+            return None
+        if isinstance(hit, list) and len(hit) == 2:
+            return (int(hit[0]), hit[1])
         items = driver.find_elements(By.CSS_SELECTOR, jobListItem)
         for j, li in enumerate(items):
             if (li.get_attribute("data-jobid") or "").strip() == raw:
@@ -1060,14 +1151,20 @@ def scrapeGlassdoorSearch(
     out: list[dict] = []
     n = len(items)
     snapshot: list[tuple[str, str]] = []
-    for li in items:
-        gid = (li.get_attribute("data-jobid") or "").strip()
+    for gid in listingJobIds(driver, items):
+        gid = gid.strip()
         if not gid:
             continue
         jid = glassdoorJobIdToJobId(gid)
         if not jid:
             continue
         snapshot.append((gid, jid))
+    # Card fields for every row in one call; the detail loop re-locates rows only to click them.
+    cardsByGid = {
+        card["glassdoorJobId"]: card
+        for card in readCardFields(driver, items)
+        if card["glassdoorJobId"]
+    }
 
     nSnap = len(snapshot)
     log.info(
@@ -1086,7 +1183,10 @@ def scrapeGlassdoorSearch(
             listIndex, li = located
             driver.execute_script("arguments[0].scrollIntoView({block:'center'});", li)
             time.sleep(0.2)
-            card = cardFields(li)
+            card = cardsByGid.get(gidRaw)
+            if card is None or not card.get("title"):
+                # Not rendered when the list was read (virtualized panel); read the re-located row.
+                card = readCardFields(driver, [li])[0]
             if not card.get("glassdoorJobId"):
                 log.jobLine(pos + 1, nSnap, "skip: no data-jobid")
                 continue
@@ -1105,7 +1205,7 @@ def scrapeGlassdoorSearch(
                 )
                 continue
 
-            if cardShowsGlassdoorEasyApply(li):
+            if card.get("easyApply"):
                 if isinstance(data, dict):
                     skipBucket = data.setdefault(skippedOriginalUrlIdsKey, [])
                     if not isinstance(skipBucket, list):
@@ -1145,7 +1245,7 @@ def scrapeGlassdoorSearch(
                     data, [rec], category=phaseLabel or None
                 )
                 if added:
-                    saveOutputDocument(outputPath, data)
+                    saveOutputDocument(outputPath, data, dirtyOnly=True)
                     out.append(rec)
             else:
                 out.append(rec)
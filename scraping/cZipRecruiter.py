@@ -18,7 +18,7 @@ if str(_REPO_ROOT) not in sys.path:
 
 from dotenv import load_dotenv
 from selenium import webdriver
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver import ActionChains
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
@@ -115,6 +115,32 @@ return out;
 """
 
 
+# Same idea for the list cards themselves: unique cards in DOM order plus the fields the
+# per-card fallback reads. Elements without a layout box read as "" like Selenium's .text.
+_LIST_CARDS_SCAN_JS = """
+const text = (el) => (el && el.getClientRects().length ? (el.innerText || '').trim() : '');
+const section = document.querySelector('section.job_results_two_pane');
+if (!section) return null;
+const seen = new Set();
+const out = [];
+for (const card of section.querySelectorAll('article[id^="job-card-"]')) {
+  const id = (card.id || '').trim();
+  if (!id || seen.has(id)) continue;
+  seen.add(id);
+  const heading = card.querySelector('h2[aria-label]');
+  out.push({
+    element: card,
+    id,
+    title: heading ? (heading.getAttribute('aria-label') || '').trim() : '',
+    companyName: text(card.querySelector('[data-testid="job-card-company"]')),
+    location: text(card.querySelector('[data-testid="job-card-location"]')),
+    bodyTexts: Array.from(card.querySelectorAll('p.text-body-md'), text).filter(Boolean),
+  });
+}
+return out;
+"""
+
+
 def hostedApplyLabelsOnPage(driver: webdriver.Chrome) -> dict[str, str]:
     """Map job-card id → apply label for Zip-hosted apply badges on the current list page."""
     pairs = [[needle.casefold(), label] for needle, label in _zipCardHostedApplyPhrases]
@@ -384,16 +410,69 @@ def firstTextWithAny(texts: list[str], needles: tuple[str, ...]) -> str | None:
     return None
 
 
-def getCardElementsOnPage(
+def _listCardFromFields(fields: dict) -> dict:
+    def opt(key: str) -> str | None:
+        value = fields.get(key)
+        value = value.strip() if isinstance(value, str) else ""
+        return value or None
+
+    bodyTexts = fields.get("bodyTexts") if isinstance(fields.get("bodyTexts"), list) else []
+    return {
+        "element": fields.get("element"),
+        "id": opt("id"),
+        "title": opt("title"),
+        "companyName": opt("companyName"),
+        "location": opt("location"),
+        "salaryRange": firstTextWithAny(
+            [t.strip() for t in bodyTexts if isinstance(t, str) and t.strip()],
+            ("$", "/hr", "/yr", "K/yr"),
+        ),
+    }
+
+
+def listCardFields(card) -> dict:
+    """One list card, one WebDriver call per field (fallback for scanListCardsOnPage)."""
+    return _listCardFromFields(
+        {
+            "element": card,
+            "id": card.get_attribute("id"),
+            "title": safeAttr(card, "h2[aria-label]", "aria-label"),
+            "companyName": safeText(card, '[data-testid="job-card-company"]'),
+            "location": safeText(card, '[data-testid="job-card-location"]'),
+            "bodyTexts": [
+                element.text for element in card.find_elements(By.CSS_SELECTOR, "p.text-body-md")
+            ],
+        }
+    )
+
+
+def scanListCardsOnPage(driver: webdriver.Chrome) -> list[dict] | None:
+    """Unique list cards with their fields in one execute_script call; None if the scan failed."""
+    try:
+        raw = driver.execute_script(_LIST_CARDS_SCAN_JS)
+    except WebDriverException:
+        return None
+    if not isinstance(raw, list) or not all(isinstance(r, dict) for r in raw):
+        return None
+    return [_listCardFromFields(r) for r in raw]
+
+
+def getListCardsOnPage(
     driver: webdriver.Chrome,
     log: ScraperRunLog | None = None,
-) -> list:
-    """Return job cards on the current results page; empty list if layout never loads."""
+) -> list[dict]:
+    """
+    Job cards on the current results page as listCardFields dicts (the card WebElement is
+    under "element"); empty list if the layout never loads.
+    """
     for attempt in range(2):
         try:
             WebDriverWait(driver, 20).until(
                 EC.presence_of_element_located((By.CSS_SELECTOR, "section.job_results_two_pane"))
             )
+            scanned = scanListCardsOnPage(driver)
+            if scanned is not None:
+                return scanned
             section = driver.find_element(By.CSS_SELECTOR, "section.job_results_two_pane")
             allCards = section.find_elements(By.CSS_SELECTOR, 'article[id^="job-card-"]')
             uniqueById: dict[str, object] = {}
@@ -401,7 +480,7 @@ def getCardElementsOnPage(
                 cardId = (card.get_attribute("id") or "").strip()
                 if cardId and cardId not in uniqueById:
                     uniqueById[cardId] = card
-            return list(uniqueById.values())
+            return [listCardFields(card) for card in uniqueById.values()]
         except TimeoutException:
             pageHint = (driver.current_url or "")[:100]
             if log and attempt == 0:
@@ -570,7 +649,7 @@ def scrapeCurrentPageJobs(
     addedCount = 0
     skippedMerge = 0
     skippedKnown = 0
-    cards = getCardElementsOnPage(driver, log=log)
+    cards = getListCardsOnPage(driver, log=log)
     if not cards:
         log.warning(
             f"Page {pageNumber}: no job cards loaded; stopping pagination for this search phase",
@@ -593,8 +672,8 @@ def scrapeCurrentPageJobs(
     hostedSkipCount = 0
 
     for idx, card in enumerate(cards):
-        cardId = (card.get_attribute("id") or "").strip()
-        companyPreview = safeText(card, '[data-testid="job-card-company"]') or "?"
+        cardId = card.get("id") or ""
+        companyPreview = card.get("companyName") or "?"
         if not cardId:
             log.jobLine(idx + 1, n, "skip: no id")
             continue
@@ -602,7 +681,7 @@ def scrapeCurrentPageJobs(
             skippedKnown += 1
             continue
 
-        hostedLabel = hostedOnPage.get(cardId) or cardShowsZipHostedApply(card)
+        hostedLabel = hostedOnPage.get(cardId) or cardShowsZipHostedApply(card["element"])
         if hostedLabel:
             if cardId not in skipIdsSet:
                 skipIdsSet.add(cardId)
@@ -612,17 +691,10 @@ def scrapeCurrentPageJobs(
             continue
 
         fallback = {
-            "title": safeAttr(card, "h2[aria-label]", "aria-label"),
-            "companyName": safeText(card, '[data-testid="job-card-company"]'),
-            "location": safeText(card, '[data-testid="job-card-location"]'),
-            "salaryRange": firstTextWithAny(
-                [
-                    element.text.strip()
-                    for element in card.find_elements(By.CSS_SELECTOR, "p.text-body-md")
-                    if element.text.strip()
-                ],
-                ("$", "/hr", "/yr", "K/yr"),
-            ),
+            "title": card.get("title"),
+            "companyName": card.get("companyName"),
+            "location": card.get("location"),
+            "salaryRange": card.get("salaryRange"),
             "employmentType": "Full-time",
             "workModel": None,
         }
@@ -673,7 +745,7 @@ def scrapeCurrentPageJobs(
             data, [jobRecord], category=phaseLabel or None
         )
         if added:
-            saveOutputDocument(outputPath, data)
+            saveOutputDocument(outputPath, data, dirtyOnly=True)
             addedCount += added
         else:
             skippedMerge += skipped
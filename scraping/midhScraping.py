@@ -2,16 +2,21 @@ from __future__ import annotations
 
 import json
 import os
+import shutil
+import signal
 import subprocess
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
 import requests
 from dotenv import load_dotenv
 
-from utils.scraperTerminalLog import PLATFORM_MIDHTECH, ScraperRunLog
+from utils.env import envInt
+from utils.scraperTerminalLog import PLATFORM_MIDHTECH, VALIDATION_FOLLOWER_READY_LINE, ScraperRunLog
 
 
 REPO_ROOT = Path(__file__).resolve().parent
@@ -39,10 +44,41 @@ def _formatDuration(seconds: float) -> str:
     return f"{s}s"
 
 
+_streamLock = threading.Lock()
+_childLock = threading.Lock()
+_runningChildren: set[subprocess.Popen] = set()
+
+
+def _streamChildOutput(
+    proc: subprocess.Popen,
+    prefix: str,
+    ready: tuple[str, threading.Event] | None = None,
+) -> None:
+    """
+    Copy a child's merged stdout/stderr to our stderr, one prefixed line per write.
+    `ready` = (line, event): the event is set when the child prints that line.
+    """
+    assert proc.stdout is not None
+    for line in proc.stdout:
+        if ready is not None and line.strip() == ready[0]:
+            ready[1].set()
+        text = prefix + " " + line.rstrip("\n") + "\n"
+        with _streamLock:
+            sys.stderr.write(text)
+            sys.stderr.flush()
+
+
 def runOneScraper(
     scriptName: str,
     log: ScraperRunLog,
+    *,
+    env: dict[str, str] | None = None,
+    streamPrefix: str | None = None,
 ) -> tuple[int, float]:
+    """
+    Run one scraper script to completion. With `streamPrefix` (parallel mode) its output is
+    piped and re-emitted line by line behind that prefix instead of sharing the terminal.
+    """
     scriptPath = REPO_ROOT / scriptName
     if not scriptPath.exists():
         log.error(f"scraper script not found: {scriptPath}")
@@ -51,11 +87,34 @@ def runOneScraper(
     log.info(f"launching → {sys.executable} {scriptName}")
     start = time.monotonic()
     try:
-        proc = subprocess.run(
-            [sys.executable, str(scriptPath)],
-            cwd=str(REPO_ROOT),
-            check=False,
-        )
+        if streamPrefix is None:
+            proc = subprocess.run(
+                [sys.executable, str(scriptPath)],
+                cwd=str(REPO_ROOT),
+                env=env,
+                check=False,
+            )
+        else:
+            proc = subprocess.Popen(
+                [sys.executable, str(scriptPath)],
+                cwd=str(REPO_ROOT),
+                env=env,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                encoding="utf-8",
+                errors="replace",
+                bufsize=1,
+            )
+            with _childLock:
+                _runningChildren.add(proc)
+            try:
+                _streamChildOutput(proc, streamPrefix)
+                proc.wait()
+            finally:
+                with _childLock:
+                    _runningChildren.discard(proc)
     except KeyboardInterrupt:
         elapsed = time.monotonic() - start
         log.warning(f"interrupted by user after {_formatDuration(elapsed)}")
@@ -68,6 +127,163 @@ def runOneScraper(
     return proc.returncode, elapsed
 
 
+# --- Parallel mode: one Chrome profile + debugging port per scraper ---
+
+# Lock files and caches are not copied when seeding a per-platform profile from the shared one.
+_PROFILE_SEED_IGNORE = shutil.ignore_patterns(
+    "Singleton*",
+    "DevToolsActivePort",
+    "lockfile",
+    "Cache",
+    "Code Cache",
+    "GPUCache",
+    "GrShaderCache",
+    "ShaderCache",
+    "Crashpad",
+)
+
+
+def _resolveBaseChromeDir() -> Path:
+    """SCRAPING_CHROME_DIR resolved the same way utils.startChrome does."""
+    raw = (os.getenv("SCRAPING_CHROME_DIR") or "").strip()
+    if not raw:
+        return (REPO_ROOT / "zata" / "chromeData" / "irangarick").resolve()
+    p = Path(raw).expanduser()
+    if not p.is_absolute():
+        p = REPO_ROOT / p
+    return p.resolve()
+
+
+def _platformChoiceNum(key: str) -> int:
+    for num, choiceKey, _ in PLATFORM_CHOICES:
+        if choiceKey == key:
+            return num
+    return GLASSDOOR_CHOICE_NUM
+
+
+def resolvePlatformChromeProfile(key: str) -> tuple[Path, int]:
+    """
+    (user-data-dir, remote-debugging port) for one scraper in parallel mode.
+    SCRAPING_CHROME_DIR_<KEY> / SCRAPING_PORT_<KEY> override; otherwise `<SCRAPING_CHROME_DIR>-<key>`
+    and SCRAPING_PORT + the platform's menu number, so concurrent Chromes never share either.
+    """
+    suffix = key.upper()
+    rawDir = (os.getenv(f"SCRAPING_CHROME_DIR_{suffix}") or "").strip()
+    if rawDir:
+        profileDir = Path(rawDir).expanduser()
+        if not profileDir.is_absolute():
+            profileDir = REPO_ROOT / profileDir
+        profileDir = profileDir.resolve()
+    else:
+        base = _resolveBaseChromeDir()
+        profileDir = base.with_name(f"{base.name}-{key}")
+    defaultPort = envInt("SCRAPING_PORT", 9003) + _platformChoiceNum(key)
+    port = envInt(f"SCRAPING_PORT_{suffix}", defaultPort)
+    return profileDir, port
+
+
+def _seedChromeProfile(profileDir: Path, log: ScraperRunLog) -> None:
+    """First parallel run: copy the shared profile so site logins / cookies carry over."""
+    if profileDir.exists():
+        return
+    base = _resolveBaseChromeDir()
+    if not base.is_dir():
+        return
+    # Copy aside and rename so an interrupted copy is retried instead of half-used.
+    staging = profileDir.with_name(f"{profileDir.name}.seeding")
+    try:
+        shutil.rmtree(staging, ignore_errors=True)
+        shutil.copytree(
+            base,
+            staging,
+            symlinks=True,
+            ignore=_PROFILE_SEED_IGNORE,
+            ignore_dangling_symlinks=True,
+        )
+        os.replace(staging, profileDir)
+        log.info(f"seeded Chrome profile {profileDir.name} from {base.name}")
+    except (OSError, shutil.Error) as exc:
+        shutil.rmtree(staging, ignore_errors=True)
+        log.warning(f"could not seed Chrome profile {profileDir} from {base}: {exc!r}")
+
+
+def _parallelScraperEnv(key: str, log: ScraperRunLog) -> dict[str, str]:
+    profileDir, port = resolvePlatformChromeProfile(key)
+    _seedChromeProfile(profileDir, log)
+    env = dict(os.environ)
+    env["SCRAPING_CHROME_DIR"] = str(profileDir)
+    env["SCRAPING_PORT"] = str(port)
+    env["PYTHONUNBUFFERED"] = "1"
+    # stdin is not shared between concurrent scrapers, so never wait for Enter at the end.
+    env["CLOSE_ON_COMPLETE"] = "1"
+    if sys.stderr.isatty() and not os.environ.get("NO_COLOR", "").strip():
+        env.setdefault("FORCE_COLOR", "1")
+    log.info(f"profile {profileDir} · debug port {port}")
+    return env
+
+
+def _terminateRunningChildren() -> None:
+    with _childLock:
+        children = list(_runningChildren)
+    for proc in children:
+        if proc.poll() is None:
+            proc.terminate()
+    for proc in children:
+        try:
+            proc.wait(timeout=15)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+
+
+def runScrapersParallel(
+    scrapers: list[tuple[str, str]],
+    maxParallel: int,
+) -> list[tuple[str, int, float]]:
+    """
+    Run scrapers concurrently (at most `maxParallel` at a time), each with its own Chrome
+    profile and port, streaming their output behind a `[key]` prefix. Results keep the
+    order of `scrapers` so the summary table reads the same as a sequential run.
+    """
+    width = max(len(key) for key, _ in scrapers) + 2
+
+    def runOne(key: str, script: str) -> tuple[str, int, float]:
+        slog = ScraperRunLog(PLATFORM_MIDHTECH, key)
+        slog.info(f"=== {script} starting ===")
+        env = _parallelScraperEnv(key, slog)
+        rc, elapsed = runOneScraper(
+            script, slog, env=env, streamPrefix=f"{'[' + key + ']':<{width}}"
+        )
+        if rc == 0:
+            slog.info(f"=== {script} finished OK in {_formatDuration(elapsed)} ===")
+        else:
+            slog.error(f"=== {script} exited rc={rc} after {_formatDuration(elapsed)} ===")
+            slog.warning(
+                f"{key} scrape may be partial — check zata/sources/ and zata/logs/ "
+                "before re-running.",
+            )
+        return key, rc, elapsed
+
+    pool = ThreadPoolExecutor(max_workers=maxParallel, thread_name_prefix="scraper")
+    futures: list[Any] = []
+    try:
+        futures = [pool.submit(runOne, key, script) for key, script in scrapers]
+        results: list[tuple[str, int, float]] = []
+        for (key, _), fut in zip(scrapers, futures):
+            try:
+                results.append(fut.result())
+            except Exception as exc:
+                ScraperRunLog(PLATFORM_MIDHTECH, key).error(f"scraper runner crashed: {exc!r}")
+                results.append((key, 1, 0.0))
+        return results
+    except KeyboardInterrupt:
+        for fut in futures:
+            fut.cancel()
+        _terminateRunningChildren()
+        raise
+    finally:
+        pool.shutdown(wait=True)
+
+
 def showPlatformMenu() -> None:
     print("")
     print("Select platform to scrape:")
@@ -89,17 +305,56 @@ def promptPlatformSelection() -> int:
         print("Invalid choice — enter 0, 1, 2, or 3.")
 
 
+def _envTruthy(name: str) -> bool:
+    return (os.getenv(name) or "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def parseRunOptions(argv: list[str]) -> tuple[list[str], bool, int, bool]:
+    """
+    Strip --parallel / --max-parallel=N / --pipeline from argv. Returns (remaining argv,
+    parallel, maxParallel, pipeline); SCRAPING_PARALLEL=1, SCRAPING_MAX_PARALLEL and
+    SCRAPING_PIPELINE_VALIDATION=1 are the env equivalents.
+    """
+    parallel = _envTruthy("SCRAPING_PARALLEL")
+    maxParallel = envInt("SCRAPING_MAX_PARALLEL", 0, 0)
+    pipeline = _envTruthy("SCRAPING_PIPELINE_VALIDATION")
+    rest: list[str] = []
+    for arg in argv:
+        if arg in ("-p", "--parallel"):
+            parallel = True
+        elif arg == "--pipeline":
+            pipeline = True
+        elif arg == "--sequential":
+            parallel = False
+        elif arg.startswith("--max-parallel="):
+            parallel = True
+            try:
+                maxParallel = int(arg.split("=", 1)[1])
+            except ValueError:
+                print(f"error: invalid {arg!r}; use --max-parallel=N", file=sys.stderr)
+                raise SystemExit(2)
+        else:
+            rest.append(arg)
+    return rest, parallel, maxParallel, pipeline
+
+
 def parseSelection(argv: list[str]) -> int | None:
     """Return 0–3, or None when argv empty (prompt or default-all)."""
     if not argv:
         return None
     if argv[0] in ("-h", "--help"):
         print(
-            "Usage: python midhScraping.py [0|1|2|3]\n\n"
+            "Usage: python midhScraping.py [--parallel] [--max-parallel=N] [--pipeline] [0|1|2|3]\n\n"
             "  0 — all enabled platforms (JobRight + ZipRecruiter)\n"
             "  1 — JobRight\n"
             "  2 — ZipRecruiter\n"
             "  3 — Glassdoor (disabled for now)\n\n"
+            "  --parallel        run the selected scrapers concurrently, each with its own\n"
+            "                    Chrome profile (<SCRAPING_CHROME_DIR>-<platform>) and debug port\n"
+            "  --max-parallel=N  at most N scrapers at once (implies --parallel)\n"
+            "  --sequential      override SCRAPING_PARALLEL=1 from .env\n"
+            "  --pipeline        validate new jobs while scraping: scrapers enqueue them and a\n"
+            "                    `validation.py -1 --follow` worker checks them right away\n\n"
             "With no argument in an interactive terminal, you are prompted to choose.\n"
             "With no argument in cron/non-interactive mode, all enabled platforms run.",
         )
@@ -316,6 +571,82 @@ def runLocalValidationScript(
     return False
 
 
+def startValidationFollower(
+    log: ScraperRunLog,
+) -> tuple[subprocess.Popen, threading.Thread, threading.Event] | None:
+    """
+    Pipelined validation: launch `validation.py -1 --follow`, which checks jobs from the
+    validation queue as the scrapers save them (their output streams behind `[validate]`).
+    """
+    validationPath = REPO_ROOT / "validation.py"
+    if not validationPath.is_file():
+        log.error(f"validation script not found: {validationPath}; pipeline disabled.")
+        return None
+    cmd = [_resolveValidationPython(), str(validationPath), "-1", "--follow"]
+    env = dict(os.environ)
+    env["PYTHONUNBUFFERED"] = "1"
+    log.info(f"pipeline → {' '.join(cmd)}")
+    try:
+        proc = subprocess.Popen(
+            cmd,
+            cwd=str(REPO_ROOT),
+            env=env,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+            bufsize=1,
+        )
+    except Exception as exc:
+        log.error(f"failed to launch validation follower: {exc!r}")
+        return None
+    with _childLock:
+        _runningChildren.add(proc)
+    ready = threading.Event()
+    streamer = threading.Thread(
+        target=_streamChildOutput,
+        args=(proc, "[validate]", (VALIDATION_FOLLOWER_READY_LINE, ready)),
+        name="validate-stream",
+        daemon=True,
+    )
+    streamer.start()
+    return proc, streamer, ready
+
+
+def finishValidationFollower(
+    follower: tuple[subprocess.Popen, threading.Thread, threading.Event],
+    log: ScraperRunLog,
+) -> bool:
+    """
+    Tell the follower the scrapers are done (SIGUSR1), let it drain the queue, reap it. The
+    signal is only sent once the follower has announced its handler (or has exited).
+    """
+    proc, streamer, ready = follower
+    start = time.monotonic()
+    while not ready.wait(0.2):
+        if proc.poll() is not None:
+            break
+    if proc.poll() is None:
+        log.info("scrapers done → validation follower draining the queue…")
+        proc.send_signal(signal.SIGUSR1)
+    try:
+        rc = proc.wait()
+    finally:
+        streamer.join()
+        with _childLock:
+            _runningChildren.discard(proc)
+    if rc == 0:
+        log.info(f"validation follower finished (drained in {_formatDuration(time.monotonic() - start)})")
+        return True
+    log.warning(
+        f"validation follower exited rc={rc}; queued jobs are still NULL and are picked up by "
+        "the post-scrape validation run."
+    )
+    return False
+
+
 def runPostScrapeAdminPipeline(*, log: ScraperRunLog) -> bool:
     """
     After all scrapers succeed: delete unwanted jobs via Saral API, then run local
@@ -370,7 +701,8 @@ def main() -> int:
     log.bindPhase("orchestrator")
 
     try:
-        parsed = parseSelection(sys.argv[1:])
+        argv, parallel, maxParallel, pipeline = parseRunOptions(sys.argv[1:])
+        parsed = parseSelection(argv)
     except SystemExit as exc:
         return int(exc.code) if exc.code is not None else 0
 
@@ -391,32 +723,54 @@ def main() -> int:
     log.info(
         f"plan ({len(scrapers)} scraper{'s' if len(scrapers) != 1 else ''}): {plan}"
     )
-    log.info("on-error: continue to next scraper.")
-
     runStart = time.monotonic()
     results: list[tuple[str, int, float]] = []
+    workers = min(len(scrapers), maxParallel if maxParallel > 0 else len(scrapers))
+
+    follower = None
+    if pipeline:
+        # Inherited by every scraper: saves push newly inserted NULL-status jobIds onto the queue.
+        os.environ["VALIDATION_QUEUE_ENABLED"] = "1"
+        follower = startValidationFollower(log)
 
-    for index, (key, script) in enumerate(scrapers, start=1):
-        log.bindPhase(f"{index}/{len(scrapers)} {key}")
-        log.info(f"=== {script} starting ===")
+    if parallel and workers > 1:
+        log.info(f"mode: parallel (max {workers} at once); on-error: other scrapers keep running.")
         try:
-            rc, elapsed = runOneScraper(script, log)
+            results = runScrapersParallel(scrapers, workers)
         except KeyboardInterrupt:
-            log.warning("orchestrator interrupted; stopping run.")
+            log.warning("orchestrator interrupted; stopped running scrapers.")
             return 130
-        results.append((key, rc, elapsed))
-        if rc == 0:
-            log.info(f"=== {script} finished OK in {_formatDuration(elapsed)} ===")
-        else:
-            log.error(
-                f"=== {script} exited rc={rc} after {_formatDuration(elapsed)} ==="
-            )
-            log.warning(
-                f"{key} scrape may be partial — check zata/sources/ and zata/logs/ "
-                "before re-running.",
-            )
+    else:
+        log.info("on-error: continue to next scraper.")
+        for index, (key, script) in enumerate(scrapers, start=1):
+            log.bindPhase(f"{index}/{len(scrapers)} {key}")
+            log.info(f"=== {script} starting ===")
+            try:
+                rc, elapsed = runOneScraper(script, log)
+            except KeyboardInterrupt:
+                _terminateRunningChildren()
+                log.warning("orchestrator interrupted; stopping run.")
+                return 130
+            results.append((key, rc, elapsed))
+            if rc == 0:
+                log.info(f"=== {script} finished OK in {_formatDuration(elapsed)} ===")
+            else:
+                log.error(
+                    f"=== {script} exited rc={rc} after {_formatDuration(elapsed)} ==="
+                )
+                log.warning(
+                    f"{key} scrape may be partial — check zata/sources/ and zata/logs/ "
+                    "before re-running.",
+                )
 
     log.bindPhase("orchestrator")
+    if follower is not None:
+        try:
+            finishValidationFollower(follower, log)
+        except KeyboardInterrupt:
+            _terminateRunningChildren()
+            log.warning("orchestrator interrupted while the validation follower drained.")
+            return 130
     totalElapsed = time.monotonic() - runStart
     okCount = sum(1 for _, rc, _ in results if rc == 0)
     failCount = sum(1 for _, rc, _ in results if rc != 0)
@@ -12,6 +12,7 @@ from .dataManager import (
     loadScraperSearchKeywords,
     recordPastData,
     upsertJobs,
+    validationQueueEnabled,
 )
 from .urlCleaner import cleanUrl, normalizeCompanyName
 
@@ -55,6 +56,9 @@ def applyScrapeCategory(row: dict, category: str | None) -> dict:
 
 TARGET_PORTAL_DOMAINS = ("indeed.com", "linkedin.com", "jobright.ai")
 ORIGINAL_URL_SKIP_KEY = "skippedOriginalUrlIds"
+# In-memory document bookkeeping for incremental saves (never persisted).
+JOB_INDEX_KEY = "_jobIndex"
+DIRTY_JOB_IDS_KEY = "_dirtyJobIds"
 
 
 def domainFromUrl(url: object) -> str:
@@ -501,7 +505,7 @@ def mergeNewJobsIntoDocument(
         if not isAcceptableJobTitle(row.get("title")):
             skipped += 1
             continue
-        jobs.append(row)
+        markJobDirty(data, row, idKey=idKey)
         seen.add(jid)
         added += 1
     if filteredSkipRows:
@@ -509,79 +513,185 @@ def mergeNewJobsIntoDocument(
     return added, skipped
 
 
-def saveOutputDocument(path: Path, data: dict) -> None:
+def _jobIndex(data: dict) -> dict[str, int] | None:
+    """jobId -> position in data["jobs"], or None when missing / out of step with the list."""
+    index = data.get(JOB_INDEX_KEY)
+    jobs = data.get("jobs")
+    if not isinstance(index, dict) or not isinstance(jobs, list) or len(index) != len(jobs):
+        return None
+    return index
+
+
+def markJobDirty(data: dict, job: dict, *, idKey: str = "jobId") -> bool:
+    """
+    Put job into data["jobs"] (replacing the row with the same jobId via the O(1) index, or
+    appending) and queue it for the next saveOutputDocument(..., dirtyOnly=True).
+    """
+    jid = _strOrBlank(job.get(idKey))
+    if not jid:
+        return False
+    jobs = data.setdefault("jobs", [])
+    index = _jobIndex(data)
+    if index is None:
+        index = {}
+        for i, row in enumerate(jobs):
+            rowId = _strOrBlank(row.get(idKey)) if isinstance(row, dict) else ""
+            if rowId and rowId not in index:
+                index[rowId] = i
+        if len(index) != len(jobs):
+            # Duplicate / id-less rows: leave the index unset so the next save runs in full mode.
+            data.pop(JOB_INDEX_KEY, None)
+            index = None
+    if index is not None and jid in index:
+        jobs[index[jid]] = job
+    else:
+        if index is not None:
+            index[jid] = len(jobs)
+        jobs.append(job)
+    if index is not None:
+        data[JOB_INDEX_KEY] = index
+    dirty = data.get(DIRTY_JOB_IDS_KEY)
+    if not isinstance(dirty, set):
+        dirty = set()
+        data[DIRTY_JOB_IDS_KEY] = dirty
+    dirty.add(jid)
+    return True
+
+
+def _normalizeRowForSave(
+    data: dict,
+    job: object,
+    *,
+    sourcePlatform: str,
+    scrapeTimestamp: str,
+    filteredSkipRows: list[dict],
+) -> dict | None:
+    if not isinstance(job, dict):
+        return None
+    normalized = normalizeJobRecord(job)
+    if not normalized.get("platform"):
+        normalized["platform"] = sourcePlatform
+    if not normalized.get("timestamp"):
+        normalized["timestamp"] = scrapeTimestamp
+    if not bool(cleanUrl(normalized.get("jobUrl"))):
+        return None
+    if bool(cleanUrl(normalized.get("originalJobPostUrl"))) and shouldSkipJob(normalized):
+        addJobIdToSkipBucket(data, normalized, idKey="jobId", skipKey=ORIGINAL_URL_SKIP_KEY)
+        filteredSkipRows.append(normalized)
+        return None
+    return normalized
+
+
+def _persistRows(path: Path, data: dict, rows: list[dict], *, sourcePlatform: str, mode: str) -> None:
+    completeRows = [
+        j
+        for j in rows
+        if isinstance(j, dict) and _isCompleteForDb(j) and isAcceptableJobTitle(j.get("title"))
+    ]
+    incompleteRows = [j for j in rows if isinstance(j, dict) and not _isCompleteForDb(j)]
+    upserted = upsertJobs(completeRows, enqueueNew=validationQueueEnabled())
+    pastAdded = recordPastData(completeRows, platform=sourcePlatform)
+    sampleReasons: list[str] = []
+    for row in incompleteRows[:10]:
+        jid = _strOrBlank(row.get("jobId")) or "<missing-jobId>"
+        missing = ",".join(_missingCompleteFields(row))
+        sampleReasons.append(f"{jid}:{missing}")
+    reasonBlob = " | ".join(sampleReasons) if sampleReasons else "-"
+    appendScrapeLog(
+        f"Saved to DB only; mode={mode}; source={path.name}; jobs={len(data.get('jobs', []))}; rowsWritten={len(rows)}; complete={len(completeRows)}; incomplete={len(incompleteRows)}; upserted={upserted}; pastDataAdded={pastAdded}; skippedIds={len(data.get(ORIGINAL_URL_SKIP_KEY, []))}; incompleteSamples={reasonBlob}",
+        platform=sourcePlatform,
+    )
+
+
+def _saveDirtyRows(path: Path, data: dict, *, sourcePlatform: str, scrapeTimestamp: str) -> bool:
+    """Normalize + persist only rows queued by markJobDirty. False when a full save is needed."""
+    jobs = data.get("jobs")
+    index = _jobIndex(data)
+    dirty = data.get(DIRTY_JOB_IDS_KEY)
+    if index is None or not isinstance(jobs, list) or not isinstance(dirty, set):
+        return False
+    if not dirty:
+        return True
+    for jid in dirty:
+        pos = index.get(jid)
+        if pos is None or _strOrBlank((jobs[pos] or {}).get("jobId")) != jid:
+            return False
+    written: list[dict] = []
+    filteredSkipRows: list[dict] = []
+    dropped: set[str] = set()
+    for jid in sorted(dirty, key=lambda value: index[value]):
+        pos = index[jid]
+        normalized = _normalizeRowForSave(
+            data,
+            jobs[pos],
+            sourcePlatform=sourcePlatform,
+            scrapeTimestamp=scrapeTimestamp,
+            filteredSkipRows=filteredSkipRows,
+        )
+        if normalized is None:
+            dropped.add(jid)
+            continue
+        jobs[pos] = normalized
+        written.append(normalized)
+    if dropped:
+        # Rare (filtered/invalid rows): compact the list and rebuild positions once.
+        data["jobs"] = [j for j in jobs if _strOrBlank(j.get("jobId")) not in dropped]
+        data[JOB_INDEX_KEY] = {
+            _strOrBlank(j.get("jobId")): i for i, j in enumerate(data["jobs"])
+        }
+    data["count"] = len(data["jobs"])
+    dirty.clear()
+    if filteredSkipRows:
+        recordPastData(filteredSkipRows, platform=sourcePlatform)
+    _persistRows(path, data, written, sourcePlatform=sourcePlatform, mode="dirty")
+    return True
+
+
+def saveOutputDocument(path: Path, data: dict, *, dirtyOnly: bool = False) -> None:
+    """
+    Normalize, dedupe and persist data["jobs"] to MongoDB.
+    dirtyOnly=True writes only rows queued via markJobDirty / mergeNewJobsIntoDocument since the
+    last save (same crash-safety when called after each job); it falls back to a full save when
+    the jobId index is missing or stale.
+    """
     jobs = data.get("jobs")
     sourcePlatform = inferPlatformFromPath(path)
     scrapeTimestamp = _utcNowIso()
     data["_platform"] = sourcePlatform
     data["_sourcePath"] = str(path)
+    if dirtyOnly and _saveDirtyRows(
+        path, data, sourcePlatform=sourcePlatform, scrapeTimestamp=scrapeTimestamp
+    ):
+        return
     if isinstance(jobs, list):
-        filtered: list[dict] = []
         filteredSkipRows: list[dict] = []
+        positions: dict[str, int] = {}
+        deduped: list[dict] = []
         for j in jobs:
-            if not isinstance(j, dict):
-                continue
-            normalized = normalizeJobRecord(j)
-            if not normalized.get("platform"):
-                normalized["platform"] = sourcePlatform
-            if not normalized.get("timestamp"):
-                normalized["timestamp"] = scrapeTimestamp
-            if not bool(cleanUrl(normalized.get("jobUrl"))):
+            row = _normalizeRowForSave(
+                data,
+                j,
+                sourcePlatform=sourcePlatform,
+                scrapeTimestamp=scrapeTimestamp,
+                filteredSkipRows=filteredSkipRows,
+            )
+            if row is None:
                 continue
-            if bool(cleanUrl(normalized.get("originalJobPostUrl"))) and shouldSkipJob(
-                normalized
-            ):
-                addJobIdToSkipBucket(
-                    data, normalized, idKey="jobId", skipKey=ORIGINAL_URL_SKIP_KEY
-                )
-                filteredSkipRows.append(normalized)
-                continue
-            filtered.append(normalized)
-        byId: dict[str, dict] = {}
-        deduped: list[dict] = []
-        for row in filtered:
             jid = _strOrBlank(row.get("jobId"))
             if not jid:
                 continue
-            if jid in byId:
-                merged = _preferRicherJob(byId[jid], row)
-                byId[jid] = merged
-                for i, existingRow in enumerate(deduped):
-                    if _strOrBlank(existingRow.get("jobId")) == jid:
-                        deduped[i] = merged
-                        break
+            if jid in positions:
+                deduped[positions[jid]] = _preferRicherJob(deduped[positions[jid]], row)
             else:
-                byId[jid] = row
+                positions[jid] = len(deduped)
                 deduped.append(row)
         data["jobs"] = deduped
         data["count"] = len(data["jobs"])
+        data[JOB_INDEX_KEY] = positions
+        data[DIRTY_JOB_IDS_KEY] = set()
         if filteredSkipRows:
             recordPastData(filteredSkipRows, platform=sourcePlatform)
-    if isinstance(jobs, list):
-        completeRows = [
-            j
-            for j in data.get("jobs", [])
-            if isinstance(j, dict)
-            and _isCompleteForDb(j)
-            and isAcceptableJobTitle(j.get("title"))
-        ]
-        incompleteRows = [
-            j
-            for j in data.get("jobs", [])
-            if isinstance(j, dict) and not _isCompleteForDb(j)
-        ]
-        upserted = upsertJobs(completeRows)
-        pastAdded = recordPastData(completeRows, platform=sourcePlatform)
-        sampleReasons: list[str] = []
-        for row in incompleteRows[:10]:
-            jid = _strOrBlank(row.get("jobId")) or "<missing-jobId>"
-            missing = ",".join(_missingCompleteFields(row))
-            sampleReasons.append(f"{jid}:{missing}")
-        reasonBlob = " | ".join(sampleReasons) if sampleReasons else "-"
-        appendScrapeLog(
-            f"Saved to DB only; source={path.name}; jobs={len(data.get('jobs', []))}; complete={len(completeRows)}; incomplete={len(incompleteRows)}; upserted={upserted}; pastDataAdded={pastAdded}; skippedIds={len(data.get(ORIGINAL_URL_SKIP_KEY, []))}; incompleteSamples={reasonBlob}",
-            platform=sourcePlatform,
-        )
+        _persistRows(path, data, data["jobs"], sourcePlatform=sourcePlatform, mode="full")
 
 
 def loadOutputDocument(path: Path | str) -> tuple[Path, dict]:
@@ -1,11 +1,20 @@
 from __future__ import annotations
 
 import base64
+import hashlib
 import re
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime, timezone
 from email.utils import parseaddr
 
+import requests
+
+from utils.env import envFloat, envInt
 from utils.gmailAuth import getGmailService
+from utils.gmailBatch import getMessagesBatched, modifyLabelsBatched
+from utils.gmailClassificationCache import loadCachedClassifications, saveClassifications
 from utils.gmailLabels import (
     CLEAN_LABEL_BAHARMIL,
     CLEAN_LABEL_FINTAX,
@@ -19,6 +28,7 @@ from utils.localLlm import (
     chatCompletions,
     extractJsonObject,
     localLlmEnabled,
+    localLlmModel,
 )
 
 HEADER_NAMES = ("From", "Subject", "Date", "To", "Reply-To")
@@ -430,6 +440,30 @@ Rules:
 9. If unsure otherwise, use none.
 """
 
+# Changes whenever a pattern, a sender list or the LLM prompt changes, so persisted
+# classifications (utils.gmailClassificationCache) go stale on their own.
+CLASSIFIER_VERSION = hashlib.sha1(
+    "\0".join(
+        [
+            p.pattern
+            for patterns in (
+                JOB_SIGNAL_PATTERNS,
+                COMPANY_SENDER_PATTERNS,
+                REJECTION_PATTERNS,
+                ONESIDED_PATTERNS,
+                JOBADS_PATTERNS,
+                PENDINGJOBS_PATTERNS,
+                SHOPPING_PATTERNS,
+                FINTAX_PATTERNS,
+            )
+            for p in patterns
+        ]
+        + sorted(PERSONAL_DOMAINS)
+        + list(ATS_DOMAIN_HINTS)
+        + [LLM_SYSTEM_PROMPT]
+    ).encode("utf-8")
+).hexdigest()[:8]
+
 
 def _headerMap(payload: dict) -> dict[str, str]:
     headers = payload.get("headers") or []
@@ -809,10 +843,104 @@ def _mergeLlmWithRegex(regexResult: dict, llmResult: dict) -> dict:
     return llmResult
 
 
-def classifyBatchWithLlm(items: list[dict]) -> dict[str, dict]:
+LLM_MAX_COMPLETION_TOKENS = 1600
+
+
+class _LlmBatchSizer:
+    """
+    Items per classify call, adapted after every answered chunk: the largest size whose
+    observed latency stays under the target, whose answer fits the completion budget and
+    whose prompt fits the context window. Grows two items at a time, shrinks at once, and
+    never returns to a size that failed.
+    """
+
+    def __init__(self) -> None:
+        self.maximum = envInt("LOCAL_LLM_CLASSIFY_BATCH_MAX", 16, 1)
+        self.size = min(self.maximum, envInt("LOCAL_LLM_CLASSIFY_BATCH", 8, 1))
+        self.targetSec = envFloat("LOCAL_LLM_CLASSIFY_TARGET_SEC", 30.0, 1.0)
+        self.promptBudget = max(
+            512, envInt("LOCAL_LLM_CONTEXT_TOKENS", 8192, 1024) - LLM_MAX_COMPLETION_TOKENS
+        )
+
+    def observe(self, items: int, elapsedSec: float, usage: dict) -> None:
+        limits = [self.maximum]
+        if elapsedSec > 0:
+            limits.append(int(items * self.targetSec / elapsedSec))
+        completionTokens = usage.get("completion_tokens")
+        if isinstance(completionTokens, int) and completionTokens > 0:
+            # Keep headroom so a wordier answer is not cut off mid-JSON.
+            limits.append(int(items * 0.8 * LLM_MAX_COMPLETION_TOKENS / completionTokens))
+        promptTokens = usage.get("prompt_tokens")
+        if isinstance(promptTokens, int) and promptTokens > 0:
+            limits.append(int(items * self.promptBudget / promptTokens))
+        fit = max(1, min(limits))
+        self.size = min(fit, self.size + 2) if fit > self.size else fit
+
+    def onFailure(self, items: int) -> None:
+        # A size that failed once is not grown back into for the rest of this dispatch.
+        self.maximum = max(1, min(self.maximum, items - 1))
+        self.size = max(1, min(self.size, items // 2))
+
+
+def _timedLlmBatch(chunk: list[dict]) -> tuple[dict[str, dict], float, dict]:
+    usage: dict = {}
+    started = time.monotonic()
+    results = classifyBatchWithLlm(chunk, usage=usage)
+    return results, time.monotonic() - started, usage
+
+
+def _dispatchLlmBatches(items: list[dict]) -> tuple[dict[str, dict], dict[str, BaseException]]:
+    """
+    classifyBatchWithLlm over any number of items: up to LOCAL_LLM_CLASSIFY_CONCURRENCY
+    chunks in flight (the OpenAI-compatible server batches concurrent requests), chunk size
+    from _LlmBatchSizer. A failed chunk is split and its halves retried; an item that fails
+    on its own, or whose chunk could not reach the server, lands in the errors.
+    Returns (classification by id, error by id).
+    """
+    if not items:
+        return {}, {}
+    concurrency = envInt("LOCAL_LLM_CLASSIFY_CONCURRENCY", 4, 1)
+    sizer = _LlmBatchSizer()
+    remaining = deque(items)
+    retryChunks: deque[list[dict]] = deque()
+    results: dict[str, dict] = {}
+    errors: dict[str, BaseException] = {}
+    inflight: dict = {}
+
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="llm-classify") as pool:
+        while remaining or retryChunks or inflight:
+            while (remaining or retryChunks) and len(inflight) < concurrency:
+                if retryChunks:
+                    chunk = retryChunks.popleft()
+                else:
+                    chunk = [remaining.popleft() for _ in range(min(sizer.size, len(remaining)))]
+                inflight[pool.submit(_timedLlmBatch, chunk)] = chunk
+
+            done, _ = wait(inflight, return_when=FIRST_COMPLETED)
+            for future in done:
+                chunk = inflight.pop(future)
+                try:
+                    chunkResults, elapsedSec, usage = future.result()
+                except Exception as exc:
+                    # Nothing to gain from splitting when the server is unreachable.
+                    unreachable = isinstance(exc, requests.ConnectionError)
+                    if len(chunk) > 1 and not unreachable:
+                        sizer.onFailure(len(chunk))
+                        half = len(chunk) // 2
+                        retryChunks.extend((chunk[:half], chunk[half:]))
+                    else:
+                        for row in chunk:
+                            errors[row["id"]] = exc
+                    continue
+                sizer.observe(len(chunk), elapsedSec, usage)
+                results.update(chunkResults)
+    return results, errors
+
+
+def classifyBatchWithLlm(items: list[dict], *, usage: dict | None = None) -> dict[str, dict]:
     """
     items: [{id, fromEmail, subject, text}]
-    returns id -> classification dict
+    returns id -> classification dict; `usage` receives the server's token counts.
     """
     if not items:
         return {}
@@ -849,7 +977,8 @@ def classifyBatchWithLlm(items: list[dict]) -> dict[str, dict]:
             {"role": "user", "content": userPrompt},
         ],
         temperature=0.0,
-        maxTokens=min(1600, 120 * len(items) + 300),
+        maxTokens=min(LLM_MAX_COMPLETION_TOKENS, 120 * len(items) + 300),
+        usage=usage,
     )
     parsed = extractJsonObject(raw)
     rows = parsed.get("results") if isinstance(parsed, dict) else parsed
@@ -919,20 +1048,36 @@ def classifyOneUnreadEmail(messageId: str, *, useLlm: bool = True) -> dict:
 def classifyManyUnreadEmails(messageIds: list[str], *, useLlm: bool = True) -> list[dict]:
     """
     Load and classify several Gmail messages in one LLM call (recommended batch size: 3).
-    Falls back to regex per message if LLM is disabled or fails.
+    Falls back to regex per message if LLM is disabled or fails. Messages with a cached
+    classification (LLM-checked when the LLM is wanted) skip both.
     """
     if not messageIds:
         return []
 
     gmail = getGmailService()
-    loaded: list[dict] = []
-    for messageId in messageIds:
-        item = _loadMessageForClassify(gmail, messageId.strip())
-        regexResult = classifyWithRegex(item.get("text") or "", fromEmail=item.get("fromEmail") or "")
-        item["classification"] = regexResult
-        loaded.append(item)
+    loaded, errors = _loadMessagesForClassify(gmail, [m.strip() for m in messageIds])
+    if errors:
+        raise next(iter(errors.values()))
+
+    wantLlm = useLlm and localLlmEnabled()
+    hashes = {item["id"]: _classificationHash(item) for item in loaded}
+    cached = loadCachedClassifications(hashes)
+    fresh: list[dict] = []
+    for item in loaded:
+        hit = cached.get(item["id"])
+        if hit is not None and (hit["llmChecked"] or not wantLlm):
+            item["classification"] = hit["classification"]
+            item["cached"] = True
+            continue
+        item["cached"] = False
+        item["classification"] = classifyWithRegex(
+            item.get("text") or "", fromEmail=item.get("fromEmail") or ""
+        )
+        fresh.append(item)
 
-    if useLlm and localLlmEnabled():
+    llmChecked: set[str] = set()
+    llmFailed = False
+    if wantLlm and fresh:
         try:
             llmResults = classifyBatchWithLlm(
                 [
@@ -942,23 +1087,33 @@ def classifyManyUnreadEmails(messageIds: list[str], *, useLlm: bool = True) -> l
                         "subject": item.get("subject") or "",
                         "text": item.get("text") or "",
                     }
-                    for item in loaded
+                    for item in fresh
                 ]
             )
-            for item in loaded:
+            for item in fresh:
                 llmResult = llmResults.get(item["id"])
                 if llmResult is None:
                     continue
+                llmChecked.add(item["id"])
                 item["classification"] = _mergeLlmWithRegex(
                     item.get("classification") or {},
                     llmResult,
                 )
         except Exception as exc:
-            for item in loaded:
+            llmFailed = True
+            for item in fresh:
                 current = dict(item.get("classification") or {})
                 current["reason"] = f"{current.get('reason')}|llmFailed:{exc}"
                 item["classification"] = current
 
+    if not llmFailed:
+        saveClassifications(
+            [
+                (item["id"], hashes[item["id"]], item["classification"], item["id"] in llmChecked)
+                for item in fresh
+            ]
+        )
+
     output: list[dict] = []
     for item in loaded:
         classification = item.get("classification") or {}
@@ -976,6 +1131,7 @@ def classifyManyUnreadEmails(messageIds: list[str], *, useLlm: bool = True) -> l
                 "source": classification.get("source"),
                 "isCompany": classification.get("isCompany"),
                 "isJobRelated": classification.get("isJobRelated"),
+                "cached": item.get("cached", False),
             }
         )
     return output
@@ -1010,6 +1166,8 @@ def applyEmailLabelActions(
 
     # System labels to strip so mail leaves Primary inbox view.
     inboxLeaveLabels = ["INBOX", "CATEGORY_PERSONAL"]
+    # Valid rows are labelled after the loop, grouped into batchModify calls.
+    pending: list[tuple[dict, dict, list[str], list[str]]] = []
 
     for raw in items:
         messageId = str(raw.get("messageId") or raw.get("id") or "").strip()
@@ -1064,44 +1222,40 @@ def applyEmailLabelActions(
         # Deduplicate while preserving order
         removeIds = list(dict.fromkeys(removeIds))
 
-        try:
-            gmail.users().messages().modify(
-                userId="me",
-                id=messageId,
-                body={"addLabelIds": addIds, "removeLabelIds": removeIds},
-            ).execute()
-            if category == "baharMil":
-                counts["baharMil"] += 1
-            elif category == "oneSided":
-                counts["oneSided"] += 1
-            elif category == "jobAds":
-                counts["jobAds"] += 1
-            elif category == "pendingJobs":
-                counts["pendingJobs"] += 1
-            elif category == "shopping":
-                counts["shopping"] += 1
-            else:
-                counts["finTax"] += 1
-            counts["applied"] += 1
-            results.append(
-                {
-                    "messageId": messageId,
-                    "category": category,
-                    "action": "applied",
-                    "appliedLabel": {"id": labelMeta["id"], "name": labelMeta["name"]},
-                    "removedLabelIds": removeIds,
-                }
-            )
-        except Exception as exc:
+        entry = {"messageId": messageId, "category": category}
+        results.append(entry)
+        pending.append((entry, labelMeta, addIds, removeIds))
+
+    modifyErrors = modifyLabelsBatched(
+        gmail, [(entry["messageId"], addIds, removeIds) for entry, _, addIds, removeIds in pending]
+    )
+    for entry, labelMeta, _addIds, removeIds in pending:
+        exc = modifyErrors.get(entry["messageId"])
+        if exc is not None:
             counts["errors"] += 1
-            results.append(
-                {
-                    "messageId": messageId,
-                    "category": category,
-                    "action": "error",
-                    "error": str(exc),
-                }
-            )
+            entry.update({"action": "error", "error": str(exc)})
+            continue
+        category = entry["category"]
+        if category == "baharMil":
+            counts["baharMil"] += 1
+        elif category == "oneSided":
+            counts["oneSided"] += 1
+        elif category == "jobAds":
+            counts["jobAds"] += 1
+        elif category == "pendingJobs":
+            counts["pendingJobs"] += 1
+        elif category == "shopping":
+            counts["shopping"] += 1
+        else:
+            counts["finTax"] += 1
+        counts["applied"] += 1
+        entry.update(
+            {
+                "action": "applied",
+                "appliedLabel": {"id": labelMeta["id"], "name": labelMeta["name"]},
+                "removedLabelIds": removeIds,
+            }
+        )
 
     return {
         "archive": archive,
@@ -1148,17 +1302,18 @@ def _listUnreadPrimaryIds(gmail, *, maxResults: int) -> list[str]:
     return messageIds
 
 
-def _loadMessageForClassify(gmail, msgId: str) -> dict:
-    message = (
-        gmail.users()
-        .messages()
-        .get(
-            userId="me",
-            id=msgId,
-            format="full",
-        )
-        .execute()
-    )
+def _loadMessagesForClassify(
+    gmail, messageIds: list[str]
+) -> tuple[list[dict], dict[str, BaseException]]:
+    """Full messages for classification in list order (batched), plus per-id load errors."""
+    messages, errors = getMessagesBatched(gmail, messageIds, format="full")
+    loaded = [
+        _messageForClassify(msgId, messages[msgId]) for msgId in messageIds if msgId in messages
+    ]
+    return loaded, errors
+
+
+def _messageForClassify(msgId: str, message: dict) -> dict:
     headers = _headerMap(message.get("payload") or {})
     fromName, fromEmail = parseaddr(headers.get("from", ""))
     subject = (headers.get("subject") or "").strip()
@@ -1177,10 +1332,39 @@ def _loadMessageForClassify(gmail, msgId: str) -> dict:
     }
 
 
-def _classifyLoadedMessages(items: list[dict], *, forceLlm: bool = True) -> None:
+def _classificationHash(item: dict) -> str:
+    """Cache key for a loaded message: classifier inputs, salted with CLASSIFIER_VERSION and the LLM model."""
+    digest = hashlib.blake2b(digest_size=12)
+    for part in (CLASSIFIER_VERSION, localLlmModel(), item.get("fromEmail") or "", item.get("text") or ""):
+        digest.update(part.encode("utf-8", "surrogatepass"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _classifyLoadedMessages(items: list[dict], *, forceLlm: bool = True) -> dict[str, int]:
+    """
+    Set item["classification"] / item["cached"] on every item. A cached classification is
+    reused unless this call would ask the LLM about the message and the LLM has not answered
+    for it yet. Returns {"cacheHits", "cacheMisses"}.
+    """
+    hashes = {item["id"]: _classificationHash(item) for item in items}
+    cached = loadCachedClassifications(hashes)
     pendingLlm: list[dict] = []
+    fresh: list[dict] = []
 
     for item in items:
+        hit = cached.get(item["id"])
+        # A regex-only entry is exactly the regex result, so it also answers _shouldAskLlm.
+        if hit is not None and (
+            hit["llmChecked"]
+            or not forceLlm
+            or not _shouldAskLlm(hit["classification"], item.get("text") or "", item.get("fromEmail") or "")
+        ):
+            item["classification"] = hit["classification"]
+            item["cached"] = True
+            continue
+        item["cached"] = False
+        fresh.append(item)
         regexResult = classifyWithRegex(item.get("text") or "", fromEmail=item.get("fromEmail") or "")
         item["classification"] = regexResult
         if forceLlm and _shouldAskLlm(regexResult, item.get("text") or "", item.get("fromEmail") or ""):
@@ -1193,31 +1377,33 @@ def _classifyLoadedMessages(items: list[dict], *, forceLlm: bool = True) -> None
                 }
             )
 
-    if not pendingLlm:
-        return
-
-    # Batch to keep latency reasonable on local Gemma.
-    batchSize = 8
-    for start in range(0, len(pendingLlm), batchSize):
-        chunk = pendingLlm[start : start + batchSize]
-        try:
-            llmResults = classifyBatchWithLlm(chunk)
-        except Exception as exc:
-            for item in items:
-                if any(row["id"] == item["id"] for row in chunk):
-                    current = dict(item.get("classification") or {})
-                    current["reason"] = f"{current.get('reason')}|llmFailed:{exc}"
-                    item["classification"] = current
-            continue
+    llmChecked: set[str] = set()
+    byId = {item["id"]: item for item in fresh}
+    llmResults, llmFailed = _dispatchLlmBatches(pendingLlm)
+    for msgId, exc in llmFailed.items():
+        target = byId[msgId]
+        current = dict(target.get("classification") or {})
+        current["reason"] = f"{current.get('reason')}|llmFailed:{exc}"
+        target["classification"] = current
+
+    for msgId, classification in llmResults.items():
+        target = byId.get(msgId)
+        if target is not None:
+            llmChecked.add(msgId)
+            target["classification"] = _mergeLlmWithRegex(
+                target.get("classification") or {},
+                classification,
+            )
 
-        byId = {item["id"]: item for item in items}
-        for msgId, classification in llmResults.items():
-            target = byId.get(msgId)
-            if target is not None:
-                target["classification"] = _mergeLlmWithRegex(
-                    target.get("classification") or {},
-                    classification,
-                )
+    # LLM failures are not cached: the next call should ask again.
+    saveClassifications(
+        [
+            (item["id"], hashes[item["id"]], item["classification"], item["id"] in llmChecked)
+            for item in fresh
+            if item["id"] not in llmFailed
+        ]
+    )
+    return {"cacheHits": len(items) - len(fresh), "cacheMisses": len(fresh)}
 
 
 def cleanUnreadPrimaryInbox(
@@ -1238,7 +1424,6 @@ def cleanUnreadPrimaryInbox(
     labels = resolveCleanLabels(createMissing=True)
     messageIds = _listUnreadPrimaryIds(gmail, maxResults=max(1, min(maxResults, 1000)))
 
-    loaded: list[dict] = []
     results: list[dict] = []
     counts = {
         "scanned": 0,
@@ -1255,15 +1440,16 @@ def cleanUnreadPrimaryInbox(
         "regexUsed": 0,
     }
 
-    for msgId in messageIds:
-        counts["scanned"] += 1
-        try:
-            loaded.append(_loadMessageForClassify(gmail, msgId))
-        except Exception as exc:
-            counts["errors"] += 1
-            results.append({"id": msgId, "error": str(exc), "action": "error"})
+    counts["scanned"] = len(messageIds)
+    loaded, loadErrors = _loadMessagesForClassify(gmail, messageIds)
+    for msgId, exc in loadErrors.items():
+        counts["errors"] += 1
+        results.append({"id": msgId, "error": str(exc), "action": "error"})
 
-    _classifyLoadedMessages(loaded, forceLlm=useLlm and localLlmEnabled())
+    cacheStats = _classifyLoadedMessages(loaded, forceLlm=useLlm and localLlmEnabled())
+    counts.update(cacheStats)
+    counts["cacheHitRate"] = round(cacheStats["cacheHits"] / len(loaded), 3) if loaded else 0.0
+    toModify: list[tuple[dict, list[str], list[str]]] = []
 
     for item in loaded:
         classification = item.get("classification") or {}
@@ -1281,6 +1467,7 @@ def cleanUnreadPrimaryInbox(
             "subject": item.get("subject"),
             "snippet": item.get("snippet"),
             "classification": classification,
+            "cached": item.get("cached", False),
             "action": "skipped",
             "appliedLabel": None,
         }
@@ -1318,21 +1505,22 @@ def cleanUnreadPrimaryInbox(
         if archive:
             removeIds.append("INBOX")
 
-        try:
-            gmail.users().messages().modify(
-                userId="me",
-                id=item["id"],
-                body={"addLabelIds": addIds, "removeLabelIds": removeIds},
-            ).execute()
+        results.append(entry)
+        toModify.append((entry, addIds, removeIds))
+
+    modifyErrors = modifyLabelsBatched(
+        gmail, [(entry["id"], addIds, removeIds) for entry, addIds, removeIds in toModify]
+    )
+    for entry, _addIds, _removeIds in toModify:
+        exc = modifyErrors.get(entry["id"])
+        if exc is None:
             entry["action"] = "applied"
             counts["applied"] += 1
-        except Exception as exc:
+        else:
             entry["action"] = "error"
             entry["error"] = str(exc)
             counts["errors"] += 1
 
-        results.append(entry)
-
     return {
         "dryRun": dryRun,
         "archive": archive,
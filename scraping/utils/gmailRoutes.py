@@ -362,7 +362,11 @@ def postGmailClassifyBatch(body: ClassifyBatchBody) -> dict:
 
     try:
         results = classifyManyUnreadEmails(messageIds, useLlm=body.useLlm)
-        return {"count": len(results), "results": results}
+        return {
+            "count": len(results),
+            "cacheHits": sum(1 for row in results if row.get("cached")),
+            "results": results,
+        }
     except HTTPException:
         raise
     except Exception as exc:
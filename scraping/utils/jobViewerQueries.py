@@ -1,29 +1,38 @@
 from __future__ import annotations
 
+import base64
+import json
 import re
 from typing import Any
 
 from utils.dataManager import (
     JOB_DATA_COLLECTION,
-    PAST_DATA_COLLECTION,
+    applyStatusSummaryFromCounts,
     createTables,
+    ensureCollectionSchemaAsync,
+    getAsyncDashboardMongoDb,
+    getAsyncMongoDb,
+    getDashboardMongoDb,
     getMongoDb,
     jobDataApplyStatusSummary,
+    jobDataStatusCounts,
+    jobDataStatusCountsAsync,
+    registerCollectionSchema,
 )
 
-_listingIndexesEnsured = False
+registerCollectionSchema(
+    JOB_DATA_COLLECTION,
+    [
+        ([("platform", 1), ("applyStatus", 1)], {}),
+        ([("category", 1), ("timestamp", 1)], {}),
+        ([("timestamp", 1), ("jobId", 1)], {}),
+    ],
+)
 
 
 def ensureJobListingIndexes() -> None:
-    global _listingIndexesEnsured
-    if _listingIndexesEnsured:
-        return
+    """Listing indexes are part of the jobData schema entry; createTables verifies them once."""
     createTables(recreate=False)
-    jobCol = getMongoDb()[JOB_DATA_COLLECTION]
-    jobCol.create_index([("platform", 1), ("applyStatus", 1)])
-    jobCol.create_index([("category", 1), ("timestamp", 1)])
-    jobCol.create_index([("timestamp", 1), ("jobId", 1)])
-    _listingIndexesEnsured = True
 
 
 def escapeRegex(needle: str) -> str:
@@ -131,6 +140,114 @@ def normalizeJobListDoc(doc: dict[str, Any]) -> dict[str, Any]:
     return out
 
 
+_LIST_PROJECTION: dict[str, Any] = {
+    "_id": 0,
+    "jobId": 1,
+    "title": 1,
+    "jobUrl": 1,
+    "location": 1,
+    "employmentType": 1,
+    "workModel": 1,
+    "seniority": 1,
+    "experience": 1,
+    "originalJobPostUrl": 1,
+    "companyName": 1,
+    "timestamp": 1,
+    "applyStatus": 1,
+    "platform": 1,
+    "category": 1,
+    "fifoKey": 1,
+    "descriptionPreview": {"$substrCP": [{"$ifNull": ["$jobDescription", ""]}, 0, 280]},
+    "hasLongDescription": {
+        "$gt": [{"$strLenCP": {"$ifNull": ["$jobDescription", ""]}}, 280]
+    },
+}
+
+# FIFO order served by the (fifoKey, jobId) index; fifoKey is precomputed by upsertJobs.
+_FIFO_SORT: dict[str, int] = {"fifoKey": 1, "jobId": 1}
+
+
+def encodeJobListCursor(fifoKey: str, jobId: str) -> str:
+    """Opaque keyset cursor: urlsafe base64 of the last row's (fifoKey, jobId)."""
+    payload = json.dumps([fifoKey, jobId], separators=(",", ":"), ensure_ascii=False)
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decodeJobListCursor(cursor: str) -> tuple[str, str]:
+    """Inverse of encodeJobListCursor; raises ValueError for malformed cursors."""
+    raw = str(cursor or "").strip()
+    try:
+        decoded = base64.urlsafe_b64decode(raw + "=" * (-len(raw) % 4)).decode("utf-8")
+        fifoKey, jobId = json.loads(decoded)
+    except (ValueError, TypeError, UnicodeDecodeError) as exc:
+        raise ValueError("Invalid cursor") from exc
+    if not isinstance(fifoKey, str) or not isinstance(jobId, str) or not jobId:
+        raise ValueError("Invalid cursor")
+    return fifoKey, jobId
+
+
+def countJobData(
+    *,
+    platform: str | None = None,
+    applyStatus: str | None = None,
+    search: str | None = None,
+    category: str | None = None,
+) -> int:
+    """Filtered jobData count for list totals (callers cache it separately from pages)."""
+    ensureJobListingIndexes()
+    jobCol = getMongoDb()[JOB_DATA_COLLECTION]
+    return int(jobCol.count_documents(buildMatchStage(platform, applyStatus, search, category)))
+
+
+def _listPipeline(matchStage: dict[str, Any], *, skip: int, limit: int) -> list[dict[str, Any]]:
+    aggPipeline: list[dict[str, Any]] = []
+    if matchStage:
+        aggPipeline.append({"$match": matchStage})
+    aggPipeline.append({"$sort": _FIFO_SORT})
+    if skip > 0:
+        aggPipeline.append({"$skip": skip})
+    aggPipeline.extend([{"$limit": limit}, {"$project": _LIST_PROJECTION}])
+    return aggPipeline
+
+
+def _fetchListRows(
+    matchStage: dict[str, Any], *, skip: int, limit: int
+) -> list[dict[str, Any]]:
+    jobCol = getMongoDb()[JOB_DATA_COLLECTION]
+    return list(jobCol.aggregate(_listPipeline(matchStage, skip=skip, limit=limit)))
+
+
+def _keysetMatchStage(matchStage: dict[str, Any], cursor: str | None) -> dict[str, Any]:
+    if not cursor:
+        return matchStage
+    afterKey, afterJobId = decodeJobListCursor(cursor)
+    keysetClause = {
+        "$or": [
+            {"fifoKey": {"$gt": afterKey}},
+            {"fifoKey": afterKey, "jobId": {"$gt": afterJobId}},
+        ]
+    }
+    return {"$and": [matchStage, keysetClause]} if matchStage else keysetClause
+
+
+def _keysetPageResult(
+    rawRows: list[dict[str, Any]], pageSize: int
+) -> tuple[list[dict[str, Any]], str | None]:
+    nextCursor: str | None = None
+    if len(rawRows) > pageSize:
+        rawRows = rawRows[:pageSize]
+        last = rawRows[-1]
+        nextCursor = encodeJobListCursor(str(last.get("fifoKey") or ""), str(last.get("jobId") or ""))
+    return [normalizeJobListDoc(row) for row in rawRows], nextCursor
+
+
+def _distinctSorted(values: list[Any]) -> list[str]:
+    return sorted(
+        {str(v).strip() for v in values if v is not None and str(v).strip()},
+        key=str.lower,
+    )
+
+
 def fetchJobDataPage(
     *,
     page: int,
@@ -139,121 +256,58 @@ def fetchJobDataPage(
     applyStatus: str | None = None,
     search: str | None = None,
     category: str | None = None,
+    total: int | None = None,
 ) -> tuple[list[dict[str, Any]], int]:
     """
-    One aggregation: match → FIFO sort (same as sortJobsFifoByTimestamp) → facet skip/limit + count.
+    Offset pagination (compatibility path): match → indexed FIFO sort (fifoKey, jobId) → skip/limit.
     List payloads include descriptionPreview (first 280 chars) and hasLongDescription;
     full jobDescription is omitted to keep transfers small.
+    Pass a cached total to skip the count_documents round-trip.
     """
     ensureJobListingIndexes()
-    createTables(recreate=False)
-    jobCol = getMongoDb()[JOB_DATA_COLLECTION]
     matchStage = buildMatchStage(platform, applyStatus, search, category)
-    aggPipeline: list[dict[str, Any]] = []
-    if matchStage:
-        aggPipeline.append({"$match": matchStage})
-    aggPipeline.extend(
-        [
-            {
-                "$addFields": {
-                    "_tsEmpty": {
-                        "$cond": {
-                            "if": {
-                                "$or": [
-                                    {"$eq": [{"$ifNull": ["$timestamp", ""]}, ""]},
-                                    {"$eq": ["$timestamp", None]},
-                                ]
-                            },
-                            "then": 1,
-                            "else": 0,
-                        }
-                    }
-                }
-            },
-            {"$sort": {"_tsEmpty": 1, "timestamp": 1, "jobId": 1}},
-            {
-                "$facet": {
-                    "data": [
-                        {"$skip": max(0, (page - 1) * pageSize)},
-                        {"$limit": pageSize},
-                        {
-                            "$project": {
-                                "_id": 0,
-                                "jobId": 1,
-                                "title": 1,
-                                "jobUrl": 1,
-                                "location": 1,
-                                "employmentType": 1,
-                                "workModel": 1,
-                                "seniority": 1,
-                                "experience": 1,
-                                "originalJobPostUrl": 1,
-                                "companyName": 1,
-                                "timestamp": 1,
-                                "applyStatus": 1,
-                                "platform": 1,
-                                "category": 1,
-                                "descriptionPreview": {
-                                    "$substrCP": [
-                                        {"$ifNull": ["$jobDescription", ""]},
-                                        0,
-                                        280,
-                                    ]
-                                },
-                                "hasLongDescription": {
-                                    "$gt": [
-                                        {
-                                            "$strLenCP": {
-                                                "$ifNull": ["$jobDescription", ""]
-                                            }
-                                        },
-                                        280,
-                                    ]
-                                },
-                            }
-                        },
-                    ],
-                    "total": [{"$count": "n"}],
-                }
-            },
-        ]
-    )
-    aggResult = list(jobCol.aggregate(aggPipeline))
-    if not aggResult:
-        return [], 0
-    facetResult = aggResult[0]
-    rawRows = facetResult.get("data") or []
-    totalArr = facetResult.get("total") or []
-    totalCount = int(totalArr[0]["n"]) if totalArr else 0
-    normalizedRows = [normalizeJobListDoc(row) for row in rawRows]
-    return normalizedRows, totalCount
+    rawRows = _fetchListRows(matchStage, skip=max(0, (page - 1) * pageSize), limit=pageSize)
+    if total is None:
+        total = countJobData(
+            platform=platform, applyStatus=applyStatus, search=search, category=category
+        )
+    return [normalizeJobListDoc(row) for row in rawRows], int(total)
+
+
+def fetchJobDataKeysetPage(
+    *,
+    pageSize: int,
+    cursor: str | None = None,
+    platform: str | None = None,
+    applyStatus: str | None = None,
+    search: str | None = None,
+    category: str | None = None,
+) -> tuple[list[dict[str, Any]], str | None]:
+    """
+    Keyset pagination on (fifoKey, jobId): cost is independent of page depth and no count runs.
+    Returns (rows, nextCursor); nextCursor is None on the last page. Raises ValueError for bad cursors.
+    """
+    ensureJobListingIndexes()
+    matchStage = _keysetMatchStage(buildMatchStage(platform, applyStatus, search, category), cursor)
+    rawRows = _fetchListRows(matchStage, skip=0, limit=pageSize + 1)
+    return _keysetPageResult(rawRows, pageSize)
 
 
 def fetchDistinctPlatforms() -> list[str]:
     ensureJobListingIndexes()
     createTables(recreate=False)
-    jobCol = getMongoDb()[JOB_DATA_COLLECTION]
-    values = jobCol.distinct("platform")
-    out = sorted(
-        {str(v).strip() for v in values if v is not None and str(v).strip()},
-        key=str.lower,
-    )
-    return out
+    jobCol = getDashboardMongoDb()[JOB_DATA_COLLECTION]
+    return _distinctSorted(jobCol.distinct("platform"))
 
 
 def fetchDistinctCategories() -> list[str]:
     ensureJobListingIndexes()
     createTables(recreate=False)
-    jobCol = getMongoDb()[JOB_DATA_COLLECTION]
-    values = jobCol.distinct("category")
-    return sorted(
-        {str(v).strip() for v in values if v is not None and str(v).strip()},
-        key=str.lower,
-    )
+    jobCol = getDashboardMongoDb()[JOB_DATA_COLLECTION]
+    return _distinctSorted(jobCol.distinct("category"))
 
 
-def fetchJobSummaryCamel() -> dict[str, int]:
-    raw = jobDataApplyStatusSummary()
+def _summaryCamel(raw: dict[str, int]) -> dict[str, int]:
     return {
         "total": int(raw["total"]),
         "nullPending": int(raw["nullPending"]),
@@ -265,41 +319,22 @@ def fetchJobSummaryCamel() -> dict[str, int]:
     }
 
 
+def fetchJobSummaryCamel() -> dict[str, int]:
+    return _summaryCamel(jobDataApplyStatusSummary())
+
+
 def fetchAdminJobStatusSummary() -> dict[str, Any]:
     """
     Admin dashboard counts with explicit status buckets plus a full status breakdown.
     Includes pending/null and applied/not-applied style totals needed for operations.
+    Reads the same jobDataStatusCounts() engine as fetchJobSummaryCamel.
     """
-    ensureJobListingIndexes()
-    createTables(recreate=False)
-    db = getMongoDb()
-    jobCol = db[JOB_DATA_COLLECTION]
-    pastCol = db[PAST_DATA_COLLECTION]
+    return _adminStatusSummary(jobDataStatusCounts())
 
-    grouped = list(
-        jobCol.aggregate(
-            [
-                {
-                    "$project": {
-                        "normalizedStatus": {
-                            "$trim": {"input": {"$toString": {"$ifNull": ["$applyStatus", ""]}}}
-                        }
-                    }
-                },
-                {"$group": {"_id": "$normalizedStatus", "count": {"$sum": 1}}},
-            ]
-        )
-    )
 
-    statusCounts: dict[str, int] = {}
-    pendingCount = 0
-    for row in grouped:
-        key = str(row.get("_id") or "").strip()
-        count = int(row.get("count") or 0)
-        if not key:
-            pendingCount += count
-            continue
-        statusCounts[key] = count
+def _adminStatusSummary(counts: dict[str, Any]) -> dict[str, Any]:
+    statusCounts: dict[str, int] = counts["statusCounts"]
+    pendingCount = int(counts["pending"])
 
     normalized = {k.upper(): int(v) for k, v in statusCounts.items()}
     applyCount = int(normalized.get("APPLY", 0))
@@ -309,8 +344,8 @@ def fetchAdminJobStatusSummary() -> dict[str, Any]:
     existingCount = int(normalized.get("EXISTING", 0))
     applyingCount = int(normalized.get("APPLYING", 0))
     redoCount = int(normalized.get("REDO", 0))
-    totalCount = int(jobCol.count_documents({}))
-    pastDataRows = int(pastCol.count_documents({}))
+    totalCount = int(counts["total"])
+    pastDataRows = int(counts["pastDataRows"])
     otherCount = max(
         0,
         totalCount
@@ -354,8 +389,100 @@ def fetchJobDetailByJobId(jobId: str) -> dict[str, Any] | None:
     createTables(recreate=False)
     jobCol = getMongoDb()[JOB_DATA_COLLECTION]
     doc = jobCol.find_one({"jobId": jid}, projection={"_id": 0})
+    return _jobDetailRow(doc)
+
+
+def _jobDetailRow(doc: dict[str, Any] | None) -> dict[str, Any] | None:
     if not doc:
         return None
     row = normalizeJobListDoc(doc)
     row["jobDescription"] = str(doc.get("jobDescription") or "")
     return row
+
+
+# --- Async read paths (pymongo AsyncMongoClient) for async API routes; same queries as above. ---
+
+
+async def countJobDataAsync(
+    *,
+    platform: str | None = None,
+    applyStatus: str | None = None,
+    search: str | None = None,
+    category: str | None = None,
+) -> int:
+    await ensureCollectionSchemaAsync(JOB_DATA_COLLECTION)
+    jobCol = getAsyncMongoDb()[JOB_DATA_COLLECTION]
+    matchStage = buildMatchStage(platform, applyStatus, search, category)
+    return int(await jobCol.count_documents(matchStage))
+
+
+async def _fetchListRowsAsync(
+    matchStage: dict[str, Any], *, skip: int, limit: int
+) -> list[dict[str, Any]]:
+    jobCol = getAsyncMongoDb()[JOB_DATA_COLLECTION]
+    cursor = await jobCol.aggregate(_listPipeline(matchStage, skip=skip, limit=limit))
+    return await cursor.to_list(length=None)
+
+
+async def fetchJobDataPageAsync(
+    *,
+    page: int,
+    pageSize: int,
+    platform: str | None = None,
+    applyStatus: str | None = None,
+    search: str | None = None,
+    category: str | None = None,
+    total: int | None = None,
+) -> tuple[list[dict[str, Any]], int]:
+    await ensureCollectionSchemaAsync(JOB_DATA_COLLECTION)
+    matchStage = buildMatchStage(platform, applyStatus, search, category)
+    rawRows = await _fetchListRowsAsync(
+        matchStage, skip=max(0, (page - 1) * pageSize), limit=pageSize
+    )
+    if total is None:
+        total = await countJobDataAsync(
+            platform=platform, applyStatus=applyStatus, search=search, category=category
+        )
+    return [normalizeJobListDoc(row) for row in rawRows], int(total)
+
+
+async def fetchJobDataKeysetPageAsync(
+    *,
+    pageSize: int,
+    cursor: str | None = None,
+    platform: str | None = None,
+    applyStatus: str | None = None,
+    search: str | None = None,
+    category: str | None = None,
+) -> tuple[list[dict[str, Any]], str | None]:
+    await ensureCollectionSchemaAsync(JOB_DATA_COLLECTION)
+    matchStage = _keysetMatchStage(buildMatchStage(platform, applyStatus, search, category), cursor)
+    rawRows = await _fetchListRowsAsync(matchStage, skip=0, limit=pageSize + 1)
+    return _keysetPageResult(rawRows, pageSize)
+
+
+async def fetchDistinctPlatformsAsync() -> list[str]:
+    await ensureCollectionSchemaAsync(JOB_DATA_COLLECTION)
+    return _distinctSorted(await getAsyncDashboardMongoDb()[JOB_DATA_COLLECTION].distinct("platform"))
+
+
+async def fetchDistinctCategoriesAsync() -> list[str]:
+    await ensureCollectionSchemaAsync(JOB_DATA_COLLECTION)
+    return _distinctSorted(await getAsyncDashboardMongoDb()[JOB_DATA_COLLECTION].distinct("category"))
+
+
+async def fetchJobSummaryCamelAsync() -> dict[str, int]:
+    return _summaryCamel(applyStatusSummaryFromCounts(await jobDataStatusCountsAsync()))
+
+
+async def fetchAdminJobStatusSummaryAsync() -> dict[str, Any]:
+    return _adminStatusSummary(await jobDataStatusCountsAsync())
+
+
+async def fetchJobDetailByJobIdAsync(jobId: str) -> dict[str, Any] | None:
+    jid = str(jobId or "").strip()
+    if not jid:
+        return None
+    await ensureCollectionSchemaAsync(JOB_DATA_COLLECTION)
+    doc = await getAsyncMongoDb()[JOB_DATA_COLLECTION].find_one({"jobId": jid}, projection={"_id": 0})
+    return _jobDetailRow(doc)
@@ -36,7 +36,9 @@ def chatCompletions(
     *,
     temperature: float = 0.0,
     maxTokens: int = 512,
+    usage: dict[str, Any] | None = None,
 ) -> str:
+    """Single chat completion; `usage`, when given, receives the server's token counts."""
     url = f"{localLlmBaseUrl()}/chat/completions"
     payload = {
         "model": localLlmModel(),
@@ -47,6 +49,8 @@ def chatCompletions(
     response = requests.post(url, json=payload, timeout=localLlmTimeoutSeconds())
     response.raise_for_status()
     data = response.json()
+    if usage is not None and isinstance(data.get("usage"), dict):
+        usage.update(data["usage"])
     choices = data.get("choices") or []
     if not choices:
         raise RuntimeError("Local LLM returned no choices.")
@@ -0,0 +1,227 @@
+"""
+Per-profile pool of authenticated Midhtech sessions.
+
+Accept decisions used to log in (GET login, POST login, GET suggest) on every click. The pool
+keeps one logged-in requests.Session per email together with its suggest URL, check URL and
+CSRF token, and only re-authenticates when the entry is too old, the password changed, or a
+request comes back 403 / redirected to /login. requests.Session is not thread-safe, so
+concurrent Accepts for one profile take turns on its entry's requestLock.
+
+Env:
+  MIDHTECH_SESSION_POOL_SIZE      max cached profiles (LRU beyond that), default 16
+  MIDHTECH_SESSION_IDLE_SEC       evict entries unused for this long, default 900
+  MIDHTECH_SESSION_MAX_AGE_SEC    re-login after this long regardless of use, default 3600
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+import requests
+
+from utils.env import envInt
+from utils.midhtechSuggestApi import (
+    authenticateMidhtechSessionWithCredentials,
+    interpretSubmitResponse,
+    postJobSuggestion,
+    responseIndicatesExpiredSession,
+)
+
+
+class PooledMidhtechSession:
+    """One logged-in profile: the session plus what authenticateMidhtechSession* returned."""
+
+    def __init__(
+        self,
+        email: str,
+        session: requests.Session,
+        baseUrl: str,
+        suggestUrl: str,
+        checkUrl: str,
+        csrfToken: str,
+        passwordDigest: str,
+    ):
+        self.email = email
+        self.session = session
+        self.baseUrl = baseUrl
+        self.suggestUrl = suggestUrl
+        self.checkUrl = checkUrl
+        self.csrfToken = csrfToken
+        self.passwordDigest = passwordDigest
+        self.createdAt = time.monotonic()
+        self.lastUsedAt = self.createdAt
+        # Held around every request made on `session`.
+        self.requestLock = threading.Lock()
+
+
+_lock = threading.Lock()
+_entries: "OrderedDict[str, PooledMidhtechSession]" = OrderedDict()
+_loginLocks: dict[str, threading.Lock] = {}
+_stats: dict[str, int] = {
+    "hits": 0,
+    "misses": 0,
+    "expired": 0,
+    "idleEvictions": 0,
+    "sizeEvictions": 0,
+    "reauthOnRejection": 0,
+    "loginFailures": 0,
+}
+
+
+def _poolKey(email: str) -> str:
+    return (email or "").strip().lower()
+
+
+def _passwordDigest(password: str) -> str:
+    return hashlib.sha256((password or "").encode("utf-8")).hexdigest()
+
+
+def _closeQuietly(entry: PooledMidhtechSession) -> None:
+    try:
+        entry.session.close()
+    except Exception:
+        pass
+
+
+def _evictIdleLocked(now: float) -> None:
+    idleSec = envInt("MIDHTECH_SESSION_IDLE_SEC", 900, 1)
+    for key in [k for k, e in _entries.items() if now - e.lastUsedAt >= idleSec]:
+        _closeQuietly(_entries.pop(key))
+        _stats["idleEvictions"] += 1
+
+
+def _takeValidLocked(key: str, digest: str, now: float) -> PooledMidhtechSession | None:
+    entry = _entries.get(key)
+    if entry is None:
+        return None
+    maxAgeSec = envInt("MIDHTECH_SESSION_MAX_AGE_SEC", 3600, 1)
+    if entry.passwordDigest != digest or now - entry.createdAt >= maxAgeSec:
+        _closeQuietly(_entries.pop(key))
+        _stats["expired"] += 1
+        return None
+    entry.lastUsedAt = now
+    _entries.move_to_end(key)
+    _stats["hits"] += 1
+    return entry
+
+
+def acquireMidhtechSession(email: str, password: str) -> tuple[PooledMidhtechSession, bool]:
+    """
+    Cached session for this profile, logging in only on a miss. Returns (entry, reused).
+    Concurrent callers for the same email wait for one login instead of each opening their
+    own. Raises like authenticateMidhtechSessionWithCredentials when the login itself fails.
+    """
+    key = _poolKey(email)
+    digest = _passwordDigest(password)
+    with _lock:
+        now = time.monotonic()
+        _evictIdleLocked(now)
+        entry = _takeValidLocked(key, digest, now)
+        if entry is not None:
+            return entry, True
+        loginLock = _loginLocks.setdefault(key, threading.Lock())
+    with loginLock:
+        with _lock:
+            entry = _takeValidLocked(key, digest, time.monotonic())
+            if entry is not None:
+                return entry, True
+            _stats["misses"] += 1
+        try:
+            session, baseUrl, suggestUrl, checkUrl, csrfToken = (
+                authenticateMidhtechSessionWithCredentials(email, password)
+            )
+        except Exception:
+            with _lock:
+                _stats["loginFailures"] += 1
+            raise
+        entry = PooledMidhtechSession(
+            email=key,
+            session=session,
+            baseUrl=baseUrl,
+            suggestUrl=suggestUrl,
+            checkUrl=checkUrl,
+            csrfToken=csrfToken,
+            passwordDigest=digest,
+        )
+        with _lock:
+            previous = _entries.pop(key, None)
+            if previous is not None:
+                _closeQuietly(previous)
+            _entries[key] = entry
+            maxSize = envInt("MIDHTECH_SESSION_POOL_SIZE", 16, 1)
+            while len(_entries) > maxSize:
+                _closeQuietly(_entries.popitem(last=False)[1])
+                _stats["sizeEvictions"] += 1
+        return entry, False
+
+
+def invalidateMidhtechSession(email: str, *, entry: PooledMidhtechSession | None = None) -> bool:
+    """Drop the cached session for email (only if it is still `entry`, when given)."""
+    key = _poolKey(email)
+    with _lock:
+        current = _entries.get(key)
+        if current is None or (entry is not None and current is not entry):
+            return False
+        _closeQuietly(_entries.pop(key))
+        return True
+
+
+def submitJobSuggestionPooled(
+    email: str,
+    password: str,
+    job: dict,
+    *,
+    pooled: tuple[PooledMidhtechSession, bool] | None = None,
+) -> tuple[bool, str, str | None]:
+    """
+    submitJobSuggestion on a pooled session (`pooled` = an earlier acquireMidhtechSession
+    result, else one is acquired here). When a reused session is rejected (403 or bounced to
+    /login) nothing was submitted, so the entry is dropped, the profile logs in again and the
+    POST is retried once on the fresh session. Each POST holds the entry's requestLock, so
+    concurrent Accepts for the same profile never share the session at the same time.
+    """
+    entry, reused = pooled or acquireMidhtechSession(email, password)
+    response = _postOnEntry(entry, job)
+    if reused and responseIndicatesExpiredSession(response):
+        with _lock:
+            _stats["reauthOnRejection"] += 1
+        invalidateMidhtechSession(email, entry=entry)
+        entry, _reused = acquireMidhtechSession(email, password)
+        response = _postOnEntry(entry, job)
+    return interpretSubmitResponse(job, response)
+
+
+def _postOnEntry(entry: PooledMidhtechSession, job: dict):
+    with entry.requestLock:
+        return postJobSuggestion(entry.session, entry.suggestUrl, entry.csrfToken, job)
+
+
+def midhtechSessionPoolStats() -> dict[str, Any]:
+    """Hit rate and eviction counters for this process, plus per-profile entry ages."""
+    with _lock:
+        now = time.monotonic()
+        lookups = _stats["hits"] + _stats["misses"]
+        return {
+            **_stats,
+            "hitRate": round(_stats["hits"] / lookups, 4) if lookups else 0.0,
+            "size": len(_entries),
+            "maxSize": envInt("MIDHTECH_SESSION_POOL_SIZE", 16, 1),
+            "entries": [
+                {
+                    "email": e.email,
+                    "ageSec": round(now - e.createdAt, 1),
+                    "idleSec": round(now - e.lastUsedAt, 1),
+                }
+                for e in _entries.values()
+            ],
+        }
+
+
+def clearMidhtechSessionPool() -> None:
+    with _lock:
+        while _entries:
+            _closeQuietly(_entries.popitem()[1])
@@ -318,6 +318,17 @@ def authenticateMidhtechSession() -> tuple[requests.Session, str, str, str, str]
     return authenticateMidhtechSessionWithCredentials(email, password)
 
 
+def sizeSessionConnectionPool(session: requests.Session, poolSize: int) -> None:
+    """
+    Let `poolSize` threads share one authenticated session without urllib3 discarding
+    connections ("Connection pool is full"). Cookies / CSRF stay on the shared session.
+    """
+    size = max(1, int(poolSize))
+    adapter = requests.adapters.HTTPAdapter(pool_connections=size, pool_maxsize=size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+
 def postJobCheck(
     session: requests.Session,
     checkUrl: str,
@@ -680,19 +691,41 @@ def submitJobSuggestion(
     autoApplyStatus is set for known business rejections (EXISTING, DO_NOT_APPLY, REJECTED);
     None means the job should stay APPLY for retry (network/auth/unknown errors).
     """
+    response = postJobSuggestion(session, suggestUrl, csrfToken, job)
+    return interpretSubmitResponse(job, response)
+
+
+def postJobSuggestion(
+    session: requests.Session,
+    suggestUrl: str,
+    csrfToken: str,
+    job: dict,
+) -> requests.Response:
+    """POST the suggest form; interpretation is left to interpretSubmitResponse."""
     payload = buildCheckPayload(job)
     payload["csrfmiddlewaretoken"] = csrfToken
     headers = {
         "Referer": suggestUrl,
         "X-CSRFToken": csrfToken,
     }
-    response = session.post(
+    return session.post(
         suggestUrl,
         data=payload,
         headers=headers,
         allow_redirects=True,
         timeout=30,
     )
+
+
+def responseIndicatesExpiredSession(response: requests.Response) -> bool:
+    """403 (Django CSRF / permission) or a redirect back to /login: the session must re-authenticate."""
+    if response.status_code == 403:
+        return True
+    return urlparse(response.url or "").path.rstrip("/") == "/login"
+
+
+def interpretSubmitResponse(job: dict, response: requests.Response) -> tuple[bool, str, str | None]:
+    """Turn a suggest POST response into submitJobSuggestion's (ok, detail, autoApplyStatus)."""
     ok = responseLooksSuccessful(response)
     body = (response.text or "").strip()
     if not ok:
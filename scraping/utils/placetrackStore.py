@@ -7,12 +7,19 @@ from typing import Any
 
 from bson.binary import Binary
 
-from utils.dataManager import MongoUnavailableError, createTables, getMongoDb
+from utils.dataManager import (
+    MongoUnavailableError,
+    createTables,
+    ensureCollectionSchema,
+    getMongoDb,
+    registerCollectionSchema,
+)
 
 PLACETRACK_WORKSPACE_COLLECTION = "placetrackWorkspace"
 PLACETRACK_WORKSPACE_DOCUMENT_ID = "default"
 
-_indexesEnsured = False
+# Singleton workspace document keyed by _id: no secondary indexes, only existence is verified.
+registerCollectionSchema(PLACETRACK_WORKSPACE_COLLECTION)
 
 
 def _utcNowIso() -> str:
@@ -20,20 +27,8 @@ def _utcNowIso() -> str:
 
 
 def ensurePlacetrackWorkspace(*, recreate: bool = False) -> None:
-    global _indexesEnsured
     createTables(recreate=recreate)
-    if _indexesEnsured and not recreate:
-        return
-    try:
-        db = getMongoDb()
-        if recreate:
-            names = set(db.list_collection_names())
-            if PLACETRACK_WORKSPACE_COLLECTION in names:
-                db[PLACETRACK_WORKSPACE_COLLECTION].drop()
-        _indexesEnsured = True
-    except MongoUnavailableError:
-        _indexesEnsured = False
-        raise
+    ensureCollectionSchema(PLACETRACK_WORKSPACE_COLLECTION, force=recreate)
 
 
 def _collection():
@@ -62,6 +57,7 @@ def _normalizeSentRecipientsCache(raw: dict[str, Any] | None) -> dict[str, Any]
     recipients = raw.get("recipients")
     if not isinstance(recipients, list):
         return None
+    messageIds = raw.get("messageIds")
     return {
         "since": raw.get("since") or raw.get("Since"),
         "fetchedAt": raw.get("fetchedAt") or raw.get("fetched_at"),
@@ -70,6 +66,12 @@ def _normalizeSentRecipientsCache(raw: dict[str, Any] | None) -> dict[str, Any]
         if raw.get("recipientCount") is not None
         else raw.get("recipient_count"),
         "recipients": sorted(str(item).strip().lower() for item in recipients if str(item).strip()),
+        # Incremental refresh state (gmailSentRecipients): last mailbox historyId and the sent
+        # message ids already merged in. Caches written before history tracking have neither.
+        "historyId": str(raw["historyId"]) if raw.get("historyId") else None,
+        "messageIds": [str(item) for item in messageIds if str(item).strip()]
+        if isinstance(messageIds, list)
+        else None,
     }
 
 
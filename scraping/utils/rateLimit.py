@@ -0,0 +1,58 @@
+"""Thread-safe token-bucket rate limiter shared by concurrent HTTP workers."""
+from __future__ import annotations
+
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Classic token bucket: `ratePerSec` tokens refill continuously up to `burst`.
+    A rate of 0 (or less) disables limiting so `acquire()` always returns immediately.
+    """
+
+    def __init__(self, ratePerSec: float, burst: int = 1):
+        self.ratePerSec = max(0.0, float(ratePerSec))
+        self.burst = max(1, int(burst))
+        self._tokens = float(self.burst)
+        self._updatedAt = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ratePerSec > 0
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updatedAt
+        if elapsed > 0:
+            self._tokens = min(float(self.burst), self._tokens + elapsed * self.ratePerSec)
+            self._updatedAt = now
+
+    def tryAcquire(self) -> bool:
+        if not self.enabled:
+            return True
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return True
+            return False
+
+    def acquire(self, stopEvent: threading.Event | None = None) -> bool:
+        """
+        Block until a token is available. Returns False without consuming a token when
+        `stopEvent` is set while waiting (used to unblock workers on abort).
+        """
+        if not self.enabled:
+            return not (stopEvent is not None and stopEvent.is_set())
+        while True:
+            with self._lock:
+                self._refill(time.monotonic())
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return True
+                waitSec = (1.0 - self._tokens) / self.ratePerSec
+            if stopEvent is None:
+                time.sleep(waitSec)
+            elif stopEvent.wait(waitSec):
+                return False